@@ -0,0 +1,151 @@
+from datetime import date, timedelta
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+
+# SQL expressions turning a 'YYYY-MM-DD' column into the label of its reporting period
+PERIODS = {
+    "week": "strftime('%Y-W%W', {col})",
+    "month": "substr({col}, 1, 7)",
+    "quarter": "substr({col}, 1, 4) || '-Q' || ((CAST(substr({col}, 6, 2) AS INTEGER) + 2) / 3)",
+    "total": "'Total'",
+}
+
+
+def split_range(start, end):
+    # Whole calendar months inside [start, end] are read from the monthly rollup,
+    # the partial months at either edge from the daily one
+    first_month = start if start.day == 1 else (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    after_end = end + timedelta(days=1)
+    last_month_end = end if after_end.day == 1 else end.replace(day=1) - timedelta(days=1)
+
+    if first_month > last_month_end:
+        return [(start, end)], None
+
+    daily = []
+    if start < first_month:
+        daily.append((start, first_month - timedelta(days=1)))
+    if last_month_end < end:
+        daily.append((last_month_end + timedelta(days=1), end))
+    return daily, (first_month.strftime("%Y-%m"), last_month_end.strftime("%Y-%m"))
+
+
+def rollup_rows(start, end, period):
+    # UNION ALL over the rollup slices covering the range, labelled by period
+    if period == "week":
+        # Weeks cross month boundaries, so they always come from the daily rollup
+        daily, months = [(start, end)], None
+    else:
+        daily, months = split_range(start, end)
+
+    parts = []
+    params = []
+    for first, last in daily:
+        label = PERIODS[period].format(col="date")
+        parts.append(f"""
+            SELECT emp_id, {label} AS period, total_work_hours, full_days, half_days, punches
+            FROM Attendance_Daily WHERE date BETWEEN ? AND ?
+        """)
+        params += [first.isoformat(), last.isoformat()]
+    if months:
+        label = PERIODS[period].format(col="(month || '-01')")
+        parts.append(f"""
+            SELECT emp_id, {label} AS period, total_work_hours, full_days, half_days, punches
+            FROM Attendance_Monthly WHERE month BETWEEN ? AND ?
+        """)
+        params += list(months)
+    return " UNION ALL ".join(parts), params
+
+
+def attendance_summary(conn, start, end, group_by="employee", period="total", department=None):
+    # Range attendance per employee or per department, read from the rollups; returns (headers, rows)
+    rows_sql, params = rollup_rows(start, end, period)
+    where = ""
+    if department:
+        where = "WHERE E.department = ?"
+        params.append(department)
+
+    if group_by == "department":
+        cursor = conn.execute(f"""
+            SELECT E.department, R.period, COUNT(DISTINCT R.emp_id), ROUND(SUM(R.total_work_hours), 2),
+                   SUM(R.full_days), SUM(R.half_days), SUM(R.punches)
+            FROM ({rows_sql}) R
+            JOIN Employee E ON E.emp_id = R.emp_id
+            {where}
+            GROUP BY E.department, R.period
+            ORDER BY E.department, R.period
+        """, params)
+        headers = ["Department", "Period", "Employees", "Total Hours", "Full Days", "Half Days", "Punches"]
+    else:
+        cursor = conn.execute(f"""
+            SELECT R.emp_id, E.name, R.period, ROUND(SUM(R.total_work_hours), 2),
+                   SUM(R.full_days), SUM(R.half_days), SUM(R.punches)
+            FROM ({rows_sql}) R
+            {"JOIN" if department else "LEFT JOIN"} Employee E ON E.emp_id = R.emp_id
+            {where}
+            GROUP BY R.emp_id, R.period
+            ORDER BY R.emp_id, R.period
+        """, params)
+        headers = ["Employee ID", "Name", "Period", "Total Hours", "Full Days", "Half Days", "Punches"]
+    return headers, cursor.fetchall()
+
+
+def parse_date(text):
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def range_report(conn):
+    # Interactive weekly/monthly/quarterly attendance report used by the HR and Manager menus
+    start = parse_date(input("\nEnter start date (YYYY-MM-DD): ").strip())
+    end = parse_date(input("Enter end date (YYYY-MM-DD): ").strip())
+    if not start or not end or end < start:
+        print(colored("\nInvalid dates! End date must be on or after start date.", "red"))
+        return
+
+    period = input("Group by period (week/month/quarter/total): ").strip().lower() or "total"
+    if period not in PERIODS:
+        print(colored("\nInvalid period!", "red"))
+        return
+
+    group_by = "department" if input("Report per (1: Employee, 2: Department): ").strip() == "2" else "employee"
+    department = input("Filter by department (Enter for all): ").strip() or None
+
+    headers, rows = attendance_summary(conn, start, end, group_by, period, department)
+    if not rows:
+        print(colored(f"\nNo attendance data found between {start} and {end}.", "red"))
+        return
+
+    print(colored(f"\nAttendance Report {start} to {end} ({period}):", "green"))
+    print(tabulate(rows, headers=headers, tablefmt="double_grid"))
+
+
+if __name__ == "__main__":
+    # python3 attendance_reports.py rebuild [--db ems_data.db]
+    # python3 attendance_reports.py report START END [--period month] [--by department] [--department IT]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Attendance rollup maintenance and range reports")
+    parser.add_argument("command", choices=["rebuild", "report"])
+    parser.add_argument("start", nargs="?")
+    parser.add_argument("end", nargs="?")
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--period", default="total", choices=list(PERIODS))
+    parser.add_argument("--by", default="employee", choices=["employee", "department"])
+    parser.add_argument("--department")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        database.run_in_transaction(database.rebuild_attendance_rollups, args.db)
+        print("Attendance rollups rebuilt.")
+    else:
+        start, end = parse_date(args.start or ""), parse_date(args.end or "")
+        if not start or not end:
+            parser.error("report needs START and END dates (YYYY-MM-DD)")
+        conn = database.connect(args.db)
+        headers, rows = attendance_summary(conn, start, end, args.by, args.period, args.department)
+        conn.close()
+        print(tabulate(rows, headers=headers, tablefmt="double_grid"))
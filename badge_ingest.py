@@ -0,0 +1,202 @@
+import sys
+import json
+import time
+from datetime import datetime
+
+from tabulate import tabulate
+
+import database
+import services
+
+# Loads badge-reader punch logs (JSONL, one punch per line) into Employee_Attendance:
+#
+#   {"emp_id": 17, "at": "2026-10-18T09:02:11", "direction": "in"}
+#
+# Punches are paired in memory per employee per day (earliest check-in, latest check-out)
+# and merged into the attendance rows in batched transactions, with hours and Full/Half Day
+# worked out by services.work_hours exactly as Employee.mark_attendance does. Merging only
+# ever moves a check-in earlier or a check-out later, so ingesting a file twice changes nothing.
+#
+#   python3 badge_ingest.py punches.jsonl [more.jsonl ...] [--follow] [--batch-size 10000]
+
+BATCH_SIZE = 10_000
+POLL_SECONDS = 1.0
+IDLE = object()
+
+STATS = ["punches", "rejected", "unknown_employee", "inserted", "updated", "unchanged", "unpaired_check_out"]
+
+
+def parse_punch(line):
+    # (emp_id, date, time, direction), or None for a malformed line
+    try:
+        punch = json.loads(line)
+        emp_id = int(punch["emp_id"])
+        at = datetime.fromisoformat(punch["at"])
+        direction = str(punch["direction"]).lower()
+    except (ValueError, TypeError, KeyError):
+        return None
+    if direction not in ("in", "out"):
+        return None
+    return emp_id, at.date().isoformat(), at.strftime("%H:%M:%S"), direction
+
+
+def read_lines(path, follow=False, poll=POLL_SECONDS):
+    # Lines of a file ("-" for stdin). With follow, keeps reading as the reader appends,
+    # yielding IDLE whenever it catches up so the caller can flush what it has
+    file = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        partial = ""
+        while True:
+            line = file.readline()
+            if line.endswith("\n"):
+                yield partial + line
+                partial = ""
+            elif line:
+                partial += line
+            elif not follow:
+                if partial:
+                    yield partial
+                return
+            else:
+                yield IDLE
+                time.sleep(poll)
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def merge_times(check_in, check_out, new_in, new_out):
+    # Earliest check-in and latest check-out; a check-out before the check-in is dropped
+    check_in = min(t for t in (check_in, new_in) if t) if check_in or new_in else None
+    check_out = max(t for t in (check_out, new_out) if t) if check_out or new_out else None
+    if check_in and check_out and check_out <= check_in:
+        check_out = None
+    return check_in, check_out
+
+
+class Ingestor:
+    def __init__(self, db=database.DB_PATH, batch_size=BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.pending = {}  # (emp_id, date) -> [first check-in, last check-out]
+        self.buffered = 0
+        self.stats = dict.fromkeys(STATS, 0)
+
+    def add_line(self, line):
+        if not line.strip():
+            return
+        punch = parse_punch(line)
+        if punch is None:
+            self.stats["rejected"] += 1
+            return
+        emp_id, day, at, direction = punch
+        self.stats["punches"] += 1
+
+        times = self.pending.setdefault((emp_id, day), [None, None])
+        if direction == "in":
+            times[0] = min(times[0], at) if times[0] else at
+        else:
+            times[1] = max(times[1], at) if times[1] else at
+        self.buffered += 1
+        if self.buffered >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        pending, self.pending, self.buffered = self.pending, {}, 0
+        counts = database.run_in_transaction(lambda conn: self.merge(conn, pending), self.db)
+        for key, value in counts.items():
+            self.stats[key] += value
+
+    def merge(self, conn, pending):
+        counts = dict.fromkeys(["unknown_employee", "inserted", "updated", "unchanged", "unpaired_check_out"], 0)
+        keys = json.dumps([[emp_id, day] for emp_id, day in pending])
+
+        known = {row[0] for row in conn.execute(
+            "SELECT emp_id FROM Employee WHERE emp_id IN (SELECT DISTINCT json_extract(value, '$[0]') FROM json_each(?))",
+            (keys,)
+        )}
+        # First attendance row of each employee-day in the batch; CROSS JOIN keeps the batch as the
+        # outer loop so every lookup is an index seek on (emp_id, date) rather than a table scan
+        existing = {}
+        for emp_id, day, atd_id, check_in, check_out in conn.execute("""
+            SELECT A.emp_id, A.date, A.atd_id, A.check_in_time, A.check_out_time
+            FROM json_each(?) J
+            CROSS JOIN Employee_Attendance A
+            WHERE A.emp_id = json_extract(J.value, '$[0]') AND A.date = json_extract(J.value, '$[1]')
+        """, (keys,)):
+            if (emp_id, day) not in existing or atd_id < existing[(emp_id, day)][0]:
+                existing[(emp_id, day)] = (atd_id, check_in, check_out)
+
+        inserts, updates = [], []
+        for (emp_id, day), (new_in, new_out) in pending.items():
+            if emp_id not in known:
+                counts["unknown_employee"] += 1
+                continue
+            atd_id, old_in, old_out = existing.get((emp_id, day), (None, None, None))
+            check_in, check_out = merge_times(old_in, old_out, new_in, new_out)
+            if check_in is None:
+                # Same rule as mark_attendance: no check-out without a check-in
+                counts["unpaired_check_out"] += 1
+                continue
+            if atd_id is not None and (check_in, check_out) == (old_in, old_out):
+                counts["unchanged"] += 1
+                continue
+
+            total_hours, status = services.work_hours(check_in, check_out) if check_out else (None, None)
+            if atd_id is None:
+                inserts.append((emp_id, day, check_in, check_out, total_hours, status))
+            else:
+                updates.append((check_in, check_out, total_hours, status, atd_id))
+
+        conn.executemany("""
+            INSERT INTO Employee_Attendance (emp_id, date, check_in_time, check_out_time, total_work_hours, type)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, inserts)
+        conn.executemany(
+            "UPDATE Employee_Attendance SET check_in_time = ?, check_out_time = ?, total_work_hours = ?, type = ? WHERE atd_id = ?",
+            updates
+        )
+        if inserts or updates:
+            database.bump_versions(conn, "Employee_Attendance")
+        counts["inserted"], counts["updated"] = len(inserts), len(updates)
+        return counts
+
+
+def ingest(paths, db=database.DB_PATH, batch_size=BATCH_SIZE, follow=False):
+    # Returns the counters plus elapsed seconds and punches per second; follow tails the last file
+    ingestor = Ingestor(db, batch_size)
+    start = time.perf_counter()
+    try:
+        for number, path in enumerate(paths, start=1):
+            for line in read_lines(path, follow and number == len(paths)):
+                if line is IDLE:
+                    ingestor.flush()
+                else:
+                    ingestor.add_line(line)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ingestor.flush()
+
+    result = dict(ingestor.stats)
+    result["seconds"] = time.perf_counter() - start
+    result["punches_per_second"] = result["punches"] / result["seconds"] if result["seconds"] else 0
+    return result
+
+
+if __name__ == "__main__":
+    # python3 badge_ingest.py FILE [FILE ...] [--follow] [--batch-size 10000] [--db ems_data.db]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingest badge-reader punch logs (JSONL) into Employee_Attendance")
+    parser.add_argument("paths", nargs="+", help="Punch files; - reads standard input")
+    parser.add_argument("--follow", action="store_true", help="Keep reading the last file as it grows (Ctrl+C to stop)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Punches per transaction")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    result = ingest(args.paths, args.db, args.batch_size, args.follow)
+    print(tabulate([[key.replace("_", " ").capitalize(), result[key]] for key in STATS], tablefmt="double_grid"))
+    print(f"{result['punches']} punches in {result['seconds']:.2f}s ({result['punches_per_second']:,.0f} punches/s)")
@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import leave_calendar
+import generate_data
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMPLOYEES = 100_000
+LEAVES_PER_EMPLOYEE = 20
+
+
+def per_day_calendar(conn, start, end, department=None):
+    # The query-per-day version the sweep replaces, to check and time against
+    first, last = date.fromisoformat(start), date.fromisoformat(end)
+    query = """
+        SELECT DISTINCT L.emp_id, E.name
+        FROM Leaves L
+        JOIN Employee E ON E.emp_id = L.emp_id
+        WHERE L.status = 'APPROVED' AND L.startdate <= ? AND L.enddate >= ? AND L.startdate <= L.enddate
+    """ + (" AND E.department = ?" if department else "")
+    calendar = []
+    for offset in range((last - first).days + 1):
+        day = (first + timedelta(days=offset)).isoformat()
+        names = sorted(name for _, name in conn.execute(query, [day, day] + ([department] if department else [])))
+        calendar.append((day, len(names), names))
+    return calendar
+
+
+def timed(work):
+    start = time.perf_counter()
+    result = work()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    employees = int(sys.argv[1]) if len(sys.argv) > 1 else EMPLOYEES
+    today = date.today()
+    end = today - timedelta(days=1)
+    start = end - timedelta(days=91)
+
+    workdir = tempfile.mkdtemp(prefix="ems_calendar_")
+    db = os.path.join(workdir, "ems_data.db")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+    try:
+        print(f"Generating {employees:,} employees with {employees * LEAVES_PER_EMPLOYEE:,} leaves...")
+        generate_data.add_employees(db, employees, seed=11)
+        conn = database.connect(db)
+        emp_ids = [row[0] for row in conn.execute("SELECT emp_id FROM Employee")]
+        conn.close()
+        generate_data.add_leaves(db, len(emp_ids) * LEAVES_PER_EMPLOYEE, emp_ids, seed=11, today=today)
+
+        conn = database.connect(db)
+        conn.execute("ANALYZE")
+        department = conn.execute(
+            "SELECT department FROM Employee GROUP BY department ORDER BY COUNT(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        rows = []
+        for label, dept in [("all departments", None), (department, department)]:
+            counts, counts_ms = timed(lambda: leave_calendar.absence_calendar(conn, start.isoformat(), end.isoformat(), dept, names=False))
+            swept, swept_ms = timed(lambda: leave_calendar.absence_calendar(conn, start.isoformat(), end.isoformat(), dept))
+            per_day, per_day_ms = timed(lambda: per_day_calendar(conn, start.isoformat(), end.isoformat(), dept))
+            assert swept == per_day, f"sweep and per-day queries disagree ({label})"
+            assert [day[:2] for day in counts] == [day[:2] for day in swept]
+            peak = max(day[1] for day in swept)
+            rows.append([label, peak, f"{counts_ms:.0f}", f"{swept_ms:.0f}", f"{per_day_ms:.0f}"])
+        conn.close()
+    finally:
+        database.close_all()
+        shutil.rmtree(workdir)
+
+    print(f"Calendar {start} to {end} ({(end - start).days + 1} days); sweep matches the per-day queries")
+    print(tabulate(rows, headers=["Scope", "Peak absent", "Sweep, counts (ms)", "Sweep, names (ms)", "Query per day (ms)"],
+                   tablefmt="double_grid"))
+
+
+if __name__ == "__main__":
+    main()
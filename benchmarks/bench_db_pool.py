@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import tempfile
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ITERATIONS = 2000
+
+
+# Each action mirrors what one menu choice does against the database
+def check_salary(conn, emp_id):
+    cursor = conn.cursor()
+    cursor.execute("SELECT salary FROM Employee WHERE emp_id = ?", (emp_id,))
+    cursor.fetchone()
+
+
+def view_applied_leaves(conn, emp_id):
+    cursor = conn.cursor()
+    cursor.execute("SELECT leavetype, startdate, enddate, status FROM Leaves WHERE emp_id = ?", (emp_id,))
+    cursor.fetchall()
+
+
+def check_in(conn, emp_id):
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO Employee_Attendance (emp_id, date, check_in_time) VALUES (?, ?, ?)",
+        (emp_id, date.today().isoformat(), datetime.now().strftime("%H:%M:%S"))
+    )
+    conn.commit()
+
+
+ACTIONS = [("Check Salary", check_salary), ("View Applied Leaves", view_applied_leaves), ("Check-in", check_in)]
+
+
+def time_action(action, open_conn, iterations):
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        conn = open_conn()
+        action(conn, 1)
+        conn.close()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return sum(samples) / len(samples), samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS
+
+    workdir = tempfile.mkdtemp(prefix="ems_bench_")
+    db = os.path.join(workdir, "ems_data.db")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+
+    rows = []
+    try:
+        for name, action in ACTIONS:
+            before = time_action(action, lambda: sqlite3.connect(db), iterations)
+            after = time_action(action, lambda: database.connect(db), iterations)
+            rows.append([
+                name,
+                f"{before[0] * 1e6:.1f}", f"{before[2] * 1e6:.1f}",
+                f"{after[0] * 1e6:.1f}", f"{after[2] * 1e6:.1f}",
+                f"{before[0] / after[0]:.1f}x"
+            ])
+    finally:
+        database.close_all()
+        shutil.rmtree(workdir)
+
+    print(f"Per-action latency over {iterations} iterations (microseconds)")
+    print(tabulate(rows, headers=["Action", "connect() mean", "connect() p99", "Pool mean", "Pool p99", "Speedup"], tablefmt="double_grid"))
+
+
+if __name__ == "__main__":
+    main()
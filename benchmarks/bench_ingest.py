@@ -0,0 +1,76 @@
+import os
+import sys
+import json
+import random
+import shutil
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import badge_ingest
+import generate_data
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMPLOYEES = 2_000
+PUNCHES = 1_000_000
+
+
+def write_punch_log(path, punches, emp_ids, seed=0):
+    # An in and an out per employee per workday, in time order within each day,
+    # with a few duplicate taps and malformed lines like real readers produce
+    rng = random.Random(seed)
+    days = generate_data.workdays(date.today() - timedelta(days=1), punches // (2 * len(emp_ids)) + 1)
+    written = 0
+    with open(path, "w") as file:
+        for day in days:
+            shifts = []
+            for emp_id in emp_ids:
+                check_in = int(min(max(rng.gauss(9.25 * 3600, 1200), 7 * 3600), 12 * 3600))
+                check_out = check_in + int(min(max(rng.gauss(8.3, 1.2), 2.0), 12.0) * 3600)
+                shifts += [(check_in, emp_id, "in"), (check_out, emp_id, "out")]
+                if rng.random() < 0.01:
+                    shifts.append((check_in + 5, emp_id, "in"))
+            for seconds, emp_id, direction in sorted(shifts):
+                at = f"{day}T{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+                file.write(json.dumps({"emp_id": emp_id, "at": at, "direction": direction}) + "\n")
+                written += 1
+                if rng.random() < 0.0005:
+                    file.write("{garbled\n")
+                if written >= punches:
+                    return written
+    return written
+
+
+def main():
+    punches = int(sys.argv[1]) if len(sys.argv) > 1 else PUNCHES
+
+    workdir = tempfile.mkdtemp(prefix="ems_ingest_")
+    db = os.path.join(workdir, "ems_data.db")
+    log = os.path.join(workdir, "punches.jsonl")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+    try:
+        generate_data.add_employees(db, EMPLOYEES, seed=1)
+        conn = database.connect(db)
+        emp_ids = [row[0] for row in conn.execute("SELECT emp_id FROM Employee")]
+        conn.close()
+        write_punch_log(log, punches, emp_ids)
+
+        rows = []
+        for run in ["first", "again (idempotent)"]:
+            result = badge_ingest.ingest([log], db)
+            rows.append([run] + [result[key] for key in badge_ingest.STATS] +
+                        [f"{result['seconds']:.2f}", f"{result['punches_per_second']:,.0f}"])
+    finally:
+        database.close_all()
+        shutil.rmtree(workdir)
+
+    print(f"Badge log ingestion, {punches:,} punches for {EMPLOYEES:,} employees, batch size {badge_ingest.BATCH_SIZE:,}")
+    print(tabulate(rows, headers=["Run"] + [key.replace("_", " ") for key in badge_ingest.STATS] + ["Seconds", "Punches/s"],
+                   tablefmt="double_grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import search
+import generate_data
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIZES = [10_000, 100_000, 1_000_000]
+REPEAT = 20
+
+QUERIES = ["Rajesh", "sha", "Backend", "Pune", "priya kap", "sharma42"]
+
+
+def time_query(run, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+
+    rows = []
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix="ems_search_")
+        db = os.path.join(workdir, "ems_data.db")
+        shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+        try:
+            generate_data.add_employees(db, size, seed=size)
+            conn = database.connect(db)
+            for text in QUERIES:
+                # The query HR.search_employee used to run
+                like = time_query(lambda: conn.execute("SELECT * FROM Employee WHERE name LIKE ?",
+                                                       ('%' + text + '%',)).fetchall(), REPEAT)
+                fts = time_query(lambda: search.search_employees(conn, text), REPEAT)
+                rows.append([f"{size:,}", text, f"{like * 1000:.2f}", f"{fts * 1000:.2f}", f"{like / fts:.1f}x"])
+            conn.close()
+        finally:
+            database.close_all()
+            shutil.rmtree(workdir)
+
+    print(f"Employee search latency, mean of {REPEAT} runs (ms)")
+    print(tabulate(rows, headers=["Employees", "Query", "LIKE '%..%'", "FTS5 (top 50)", "Speedup"], tablefmt="double_grid"))
+
+
+if __name__ == "__main__":
+    main()
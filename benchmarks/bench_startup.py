@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+MAIN_PROMPT = b"Enter your choice (1/2/3): "
+ROLES = [
+    ("HR", "1", "hr.py", b"Enter your HR ID: "),
+    ("Employee", "2", "employee.py", b"Enter your Employee ID: "),
+    ("Manager", "3", "manager.py", b"Enter your Manager ID: "),
+]
+
+
+def wait_for(process, prompt):
+    output = b""
+    while prompt not in output:
+        chunk = os.read(process.stdout.fileno(), 4096)
+        if not chunk:
+            raise RuntimeError(f"process exited before printing {prompt!r}")
+        output += chunk
+
+
+def time_to_prompt(script, prompt, workdir, choice=None):
+    # Seconds from process launch until the login prompt is printed
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-u", os.path.join(ROOT, script)], cwd=workdir,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        if choice is not None:
+            wait_for(process, MAIN_PROMPT)
+            # Start the clock for the role itself once the role is chosen
+            start = time.perf_counter()
+            process.stdin.write(choice.encode() + b"\n")
+            process.stdin.flush()
+        wait_for(process, prompt)
+        return time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+
+def best_of(runs, measure):
+    return min(measure() for _ in range(runs))
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+
+    workdir = tempfile.mkdtemp(prefix="ems_startup_")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), workdir)
+
+    rows = []
+    try:
+        for role, choice, script, prompt in ROLES:
+            # Previously main.py ran os.system('python3 <role>.py'): a fresh interpreter per login
+            spawned = best_of(runs, lambda: time_to_prompt(script, prompt, workdir))
+            in_process = best_of(runs, lambda: time_to_prompt("main.py", prompt, workdir, choice))
+            rows.append([role, f"{spawned * 1000:.1f}", f"{in_process * 1000:.1f}", f"{spawned / in_process:.1f}x"])
+    finally:
+        shutil.rmtree(workdir)
+
+    print(f"Time from role choice to login prompt, best of {runs} (ms)")
+    print(tabulate(rows, headers=["Role", "Spawned interpreter", "In-process", "Speedup"], tablefmt="double_grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import builtins
+import argparse
+import tempfile
+import statistics
+import contextlib
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import charts
+import database
+import generate_data
+from employee import Employee
+from hr import HR
+from manager import Manager
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+REPEAT = 5
+TOLERANCE = 0.25
+MIN_DELTA_MS = 1.0   # differences below this are timer noise, never a regression
+
+
+def cases(ctx):
+    # (role, action, menu method, scripted answers for run i); each entry is one menu action as a user would drive it
+    emp, day, future = str(ctx["emp_id"]), ctx["day"], ctx["future"]
+    leave_day = lambda i: (future + timedelta(days=i)).isoformat()
+    return [
+        ("Employee", "mark_attendance (check-in)", ctx["employee"].mark_attendance, lambda i: ["1"]),
+        ("Employee", "mark_attendance (check-out)", ctx["employee"].mark_attendance, lambda i: ["2"]),
+        ("Employee", "apply_leave", ctx["employee"].apply_leave, lambda i: ["1", leave_day(i), leave_day(i)]),
+        ("Employee", "view_applied_leaves", ctx["employee"].view_applied_leaves, lambda i: []),
+        ("Employee", "check_salary", ctx["employee"].check_salary, lambda i: []),
+        ("Employee", "view_and_update_profile", ctx["employee"].view_and_update_profile, lambda i: ["", "", "", ""]),
+        ("HR", "search_employee (by ID)", ctx["hr"].search_employee, lambda i: ["1", emp]),
+        ("HR", "search_employee (text)", ctx["hr"].search_employee, lambda i: ["2", "sha"]),
+        ("HR", "approve_or_reject_leave (list)", ctx["hr"].approve_or_reject_leave, lambda i: ["0", "R"]),
+        ("HR", "view_leave_history", ctx["hr"].view_leave_history, lambda i: [emp, "no"]),
+        ("HR", "team availability calendar (quarter)", ctx["hr"].manage_leaves,
+         lambda i: ["4", ctx["range_start"], day, ""]),
+        ("HR", "view_salary", ctx["hr"].view_salary, lambda i: [emp]),
+        ("HR", "update_salary", ctx["hr"].update_salary, lambda i: [emp, str(60000 + i)]),
+        ("HR", "bulk salary revision (preview)", ctx["hr"].manage_salaries, lambda i: ["3", "p", "5", "IT", "", "", "no", "no"]),
+        ("HR", "generate_salary_report (department)", ctx["hr"].generate_salary_report, lambda i: ["1", "IT"]),
+        ("HR", "generate_salary_report (analytics)", ctx["hr"].generate_salary_report, lambda i: ["2"]),
+        ("HR", "employee_rating", ctx["hr"].employee_rating, lambda i: [emp, "4", "Benchmark"]),
+        ("HR", "employee_attendance_report (day)", ctx["hr"].employee_attendance_report, lambda i: ["1", day]),
+        ("HR", "employee_attendance_report (quarter)", ctx["hr"].employee_attendance_report,
+         lambda i: ["2", ctx["range_start"], day, "month", "2", ""]),
+        ("Manager", "company_overview (cached dashboard)", ctx["manager"].company_overview, lambda i: []),
+        ("Manager", "view_employee_performance (top 5)", ctx["manager"].view_employee_performance, lambda i: ["1", "", ""]),
+        ("Manager", "view_employee_performance (rater distribution)", ctx["manager"].view_employee_performance,
+         lambda i: ["3"]),
+        ("Manager", "manage_company_passwords", ctx["manager"].manage_company_passwords, lambda i: ["2", emp, "pass", "4"]),
+        ("Manager", "generate_salary_report (HR)", ctx["manager"].generate_salary_report, lambda i: ["2", "4"]),
+        ("Manager", "promote_employee_or_hr", ctx["manager"].promote_employee_or_hr,
+         lambda i: ["2", emp, str(10_000_000 + i), "4"]),
+    ]
+
+
+@contextlib.contextmanager
+def scripted(answers):
+    # Feed the menu its answers and swallow its output
+    answers = iter(answers)
+
+    def fake_input(prompt=""):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise RuntimeError(f"Ran out of scripted input at prompt {prompt!r}")
+
+    real_input = builtins.input
+    builtins.input = fake_input
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = real_input
+
+
+def context(db):
+    conn = database.connect(db)
+    emp_id, name = conn.execute("SELECT emp_id, name FROM Employee ORDER BY emp_id LIMIT 1 OFFSET "
+                                "(SELECT COUNT(*) / 2 FROM Employee)").fetchone()
+    hr = conn.execute("SELECT hr_id, name FROM HR ORDER BY hr_id LIMIT 1").fetchone()
+    manager = conn.execute("SELECT id, name FROM Manager ORDER BY id LIMIT 1").fetchone()
+    day = conn.execute("SELECT MAX(date) FROM Employee_Attendance").fetchone()[0] or date.today().isoformat()
+    conn.close()
+
+    ctx = {
+        "emp_id": emp_id,
+        "day": day,
+        "range_start": (date.fromisoformat(day) - timedelta(days=90)).isoformat(),
+        "future": date.today() + timedelta(days=400),
+        "employee": Employee(emp_id, name),
+        "hr": HR(*hr),
+        "manager": Manager(*manager),
+    }
+    for role in ["employee", "hr", "manager"]:
+        ctx[role].db = db
+    return ctx
+
+
+def run_suite(db, repeat=REPEAT):
+    # Median wall time per menu action, in milliseconds
+    results = {}
+    for role, action, method, answers in cases(context(db)):
+        samples = []
+        for i in range(repeat):
+            with scripted(answers(i)):
+                start = time.perf_counter()
+                method()
+                samples.append(time.perf_counter() - start)
+        results[f"{role}.{action}"] = statistics.median(samples) * 1000
+    return results
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    rows = []
+    regressions = 0
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            rows.append([name, "-", f"{current:.2f}", "-", "new"])
+            continue
+        ratio = current / before if before else float("inf")
+        if ratio > 1 + tolerance and current - before > MIN_DELTA_MS:
+            status = "REGRESSION"
+            regressions += 1
+        elif ratio < 1 - tolerance and before - current > MIN_DELTA_MS:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append([name, f"{before:.2f}", f"{current:.2f}", f"{ratio:.2f}x", status])
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every Employee, HR and Manager menu action and compare with a baseline")
+    parser.add_argument("--db", help="Generated database to benchmark (a copy is used); default: generate the preset")
+    parser.add_argument("--preset", choices=list(generate_data.PRESETS), default="small")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these timings as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed slowdown before flagging (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="ems_suite_")
+    db = os.path.join(workdir, "ems_data.db")
+    charts.CHART_MODE = "headless"
+    charts.CHART_DIR = os.path.join(workdir, "charts")
+    try:
+        if args.db:
+            shutil.copy(args.db, db)
+            label = os.path.basename(args.db)
+        else:
+            shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+            generate_data.generate(db, **generate_data.PRESETS[args.preset])
+            label = f"preset {args.preset}"
+        results = run_suite(db, args.repeat)
+    finally:
+        database.close_all()
+        shutil.rmtree(workdir)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    rows, regressions = compare(results, baseline.get("timings", {}), args.tolerance)
+    print(f"Menu action timings on {label}, median of {args.repeat} runs (ms)")
+    if baseline:
+        print(f"Baseline: {baseline.get('label')} ({baseline.get('saved')})")
+    print(tabulate(rows, headers=["Action", "Baseline", "Current", "Ratio", "Status"], tablefmt="double_grid"))
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump({"label": label, "saved": date.today().isoformat(), "timings": results}, file, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif regressions:
+        print(f"\n{regressions} action(s) slower than the baseline by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
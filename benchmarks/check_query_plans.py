@@ -0,0 +1,142 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Hot queries from the role classes, with representative parameters
+HOT_QUERIES = [
+    ("Employee.mark_attendance check-out",
+     "SELECT check_in_time FROM Employee_Attendance WHERE emp_id = ? AND date = ?", (1, "2025-03-01")),
+    ("Employee.view_applied_leaves",
+     "SELECT leavetype, startdate, enddate, status FROM Leaves WHERE emp_id = ?", (1,)),
+    ("approve_or_reject_leave pending list (services.pending_leaves)", """
+        SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
+        FROM Leaves L
+        CROSS JOIN Employee E ON L.emp_id = E.emp_id
+        WHERE L.status = 'PENDING'
+     """, ()),
+    ("view_leave_history", """
+        SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
+        FROM Leaves L
+        JOIN Employee E ON L.emp_id = E.emp_id
+        WHERE L.emp_id = ?
+     """, (1,)),
+    ("generate_salary_report department total", """
+        SELECT department, SUM(salary)
+        FROM Employee
+        WHERE department = ?
+        GROUP BY department
+     """, ("IT",)),
+    ("employee_attendance_report", """
+        SELECT emp_id, SUM(total_work_hours)
+        FROM Employee_Attendance
+        WHERE date = ?
+        GROUP BY emp_id
+     """, ("2025-03-01",)),
+    ("Employee_performance by employee",
+     "SELECT rating FROM Employee_performance WHERE employee_id = ?", (1,)),
+    ("apply_leave overlap check (leave_overlaps.find_overlap)", """
+        SELECT leave_id, leavetype, startdate, enddate, status
+        FROM Leaves
+        WHERE emp_id = ? AND status IN ('PENDING', 'APPROVED') AND enddate >= ? AND startdate <= ?
+        ORDER BY enddate
+        LIMIT 1
+     """, (1, "2025-03-01", "2025-03-05")),
+    ("absence calendar (leave_calendar.load_absences)", """
+        SELECT emp_id, MAX(startdate, ?), MIN(enddate, ?)
+        FROM Leaves
+        WHERE status = 'APPROVED' AND enddate >= ? AND startdate <= ? AND startdate <= enddate
+     """, ("2025-03-01", "2025-03-31", "2025-03-01", "2025-03-31")),
+]
+
+# Hot queries allowed to scan, by name, with the reason; everything else must seek
+ALLOWED_SCANS = {}
+
+# sqlite_stat1 rows describing production volumes: 100k employees, 30M attendance
+# punches, 2M leaves, 500k ratings. "rows avg-rows-per-key-prefix..."
+SCALE_STATS = {
+    "Employee": "100000",
+    "Employee_Attendance": "30000000",
+    "Leaves": "2000000",
+    "Employee_performance": "500000",
+    "idx_attendance_emp_date": "30000000 300 1 1",
+    "idx_attendance_date": "30000000 100000 1 1",
+    "idx_leaves_emp": "2000000 20 2 1 1 1",
+    "idx_leaves_active_end": "1500000 15 1 1",
+    "idx_leaves_status_end": "2000000 700000 2 1 1",
+    "idx_employee_department": "100000 20000 1 1",
+    "idx_employee_name": "100000 10",
+    "idx_performance_employee": "500000 5 2",
+}
+
+
+def load_scale_stats(path):
+    conn = sqlite3.connect(path)
+    conn.execute("ANALYZE")
+    conn.execute("DELETE FROM sqlite_stat1")
+
+    cursor = conn.execute("SELECT name, tbl_name FROM sqlite_master WHERE type = 'index'")
+    for index, table in cursor.fetchall():
+        if index in SCALE_STATS:
+            conn.execute("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (?, ?, ?)", (table, index, SCALE_STATS[index]))
+        elif index.startswith("sqlite_autoindex") and table in SCALE_STATS:
+            # UNIQUE columns: one row per key
+            conn.execute("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (?, ?, ?)", (table, index, f"{SCALE_STATS[table]} 1"))
+
+    for table in ["Employee", "Employee_Attendance", "Leaves", "Employee_performance"]:
+        conn.execute("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (?, NULL, ?)", (table, SCALE_STATS[table]))
+    conn.commit()
+    conn.close()
+
+
+def is_full_scan(detail):
+    # Any SCAN step reads a whole table or index, covering or not; only SEARCH seeks. Scans
+    # of table-valued functions (json_each), constant rows and materialized subqueries are
+    # bounded by the parameters or by the steps that fill them, which are checked themselves
+    return (detail.startswith("SCAN ") and not detail.startswith("SCAN (")
+            and "VIRTUAL TABLE" not in detail and "CONSTANT ROW" not in detail)
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="ems_plans_")
+    path = os.path.join(workdir, "ems_data.db")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), path)
+
+    try:
+        # Opening through the pool applies the index migration
+        database.connect(path).close()
+        database.close_all()
+        load_scale_stats(path)
+
+        conn = sqlite3.connect(path)
+        rows = []
+        failures = 0
+        for name, sql, params in HOT_QUERIES:
+            plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+            scans = [detail for detail in plan if is_full_scan(detail)]
+            if scans and name in ALLOWED_SCANS:
+                rows.append([name, "\n".join(plan), f"ALLOWED SCAN: {ALLOWED_SCANS[name]}"])
+                continue
+            failures += bool(scans)
+            rows.append([name, "\n".join(plan), "FULL SCAN" if scans else "OK"])
+        conn.close()
+    finally:
+        shutil.rmtree(workdir)
+
+    print(tabulate(rows, headers=["Query", "Plan", "Result"], tablefmt="grid"))
+    if failures:
+        print(f"\n{failures} hot queries fall back to a full table or index scan")
+        sys.exit(1)
+    print("\nNo hot query does a full table or index scan outside ALLOWED_SCANS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import os
+import sys
+import math
+import time
+import random
+import shutil
+import argparse
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import services
+import validators
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHUNK_SIZE = 50_000
+
+# Row counts per table; "production" is the volume we need to plan for
+PRESETS = {
+    "small": {"employees": 1_000, "punches": 100_000, "leaves": 20_000, "ratings": 5_000},
+    "medium": {"employees": 10_000, "punches": 2_000_000, "leaves": 200_000, "ratings": 50_000},
+    "production": {"employees": 100_000, "punches": 50_000_000, "leaves": 2_000_000, "ratings": 500_000},
+}
+
+FIRST_NAMES = ["Amit", "Priya", "Rajesh", "Sneha", "Vikram", "Anjali", "Rahul", "Kavya", "Arjun", "Meera",
+               "Sanjay", "Pooja", "Karan", "Divya", "Rohan", "Nisha", "Aditya", "Isha", "Manoj", "Ritu"]
+LAST_NAMES = ["Sharma", "Patel", "Kumar", "Singh", "Reddy", "Iyer", "Gupta", "Mehta", "Nair", "Joshi",
+              "Rao", "Das", "Verma", "Shah", "Pillai", "Bose", "Chopra", "Malhotra", "Kapoor", "Menon"]
+CITIES = ["Mumbai, Maharashtra", "Pune, Maharashtra", "Delhi", "Bengaluru, Karnataka", "Chennai, Tamil Nadu",
+          "Hyderabad, Telangana", "Ahmedabad, Gujarat", "Kolkata, West Bengal"]
+DEGREES = ["B.Tech", "B.Com", "BBA", "MBA", "M.Tech", "B.Sc", "CA"]
+
+# Headcount share and median salary (INR) per department
+DEPARTMENT_WEIGHTS = {"IT": 0.45, "Finance": 0.15, "Marketing": 0.15, "Operations": 0.25}
+MEDIAN_SALARY = {"IT": 70_000, "Finance": 65_000, "Marketing": 55_000, "Operations": 50_000}
+
+LEAVE_WEIGHTS = {"Sick Leave": 0.35, "Vacation Leave": 0.25, "Casual Leave": 0.40}
+STATUS_WEIGHTS = {"APPROVED": 0.80, "REJECTED": 0.15, "PENDING": 0.05}
+RATING_WEIGHTS = {1: 0.03, 2: 0.10, 3: 0.37, 4: 0.35, 5: 0.15}
+COMMENTS = ["Meets expectations", "Exceeds expectations", "Needs improvement", "Great team player",
+            "Consistently delivers", "Should work on communication", ""]
+
+
+def chunked(rows, size=CHUNK_SIZE):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def insert(db, table, sql, rows):
+    # One write transaction per chunk keeps memory flat and lets readers in between
+    count = 0
+    for chunk in chunked(rows):
+        def work(conn):
+            conn.executemany(sql, chunk)
+            if table in database.VERSIONED_TABLES:
+                database.bump_versions(conn, table)
+        database.run_in_transaction(work, db)
+        count += len(chunk)
+    return count
+
+
+def weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def add_employees(db, count, seed=0):
+    # Names and cities from a fixed pool, department by headcount share, log-normal salaries per department
+    rng = random.Random(seed)
+    conn = database.connect(db)
+    first_id = (conn.execute("SELECT MAX(emp_id) FROM Employee").fetchone()[0] or 0) + 1
+    conn.close()
+
+    def rows():
+        for i in range(first_id, first_id + count):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            department = weighted(rng, DEPARTMENT_WEIGHTS)
+            salary = round(MEDIAN_SALARY[department] * rng.lognormvariate(0, 0.35), -2)
+            joined = date(2015, 1, 1) + timedelta(days=rng.randrange(3650))
+            yield (f"{first} {last}", "pass", rng.randint(21, 60), rng.choice(validators.GENDERS), rng.choice(CITIES),
+                   department, rng.choice(validators.DEPARTMENTS[department]), salary,
+                   f"{first.lower()}.{last.lower()}{i}@example.com", f"{7000000000 + i}", joined.isoformat(),
+                   rng.choice(DEGREES))
+
+    return insert(db, "Employee", """
+        INSERT INTO Employee (name, password, age, gender, address, department, position, salary, email, contactnumber, joining_date, degree)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows())
+
+
+def workdays(end, count):
+    # The last `count` weekdays up to and including `end`, oldest first
+    days = []
+    day = end
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.isoformat())
+        day -= timedelta(days=1)
+    return days[::-1]
+
+
+def add_punches(db, count, emp_ids, seed=0, end=None):
+    # Each employee gets the same run of recent weekdays with ~5% absences;
+    # check-in around 09:15, shifts around 8.3 hours
+    rng = random.Random(seed)
+    days = workdays(end or date.today() - timedelta(days=1), math.ceil(count / len(emp_ids) / 0.95))
+
+    def rows():
+        produced = 0
+        for day in days:
+            for emp_id in emp_ids:
+                if rng.random() < 0.05:
+                    continue
+                check_in = min(max(rng.gauss(9.25 * 3600, 1200), 7 * 3600), 12 * 3600)
+                hours = min(max(rng.gauss(8.3, 1.2), 2.0), 12.0)
+                check_out = check_in + hours * 3600
+                check_in_time = time.strftime("%H:%M:%S", time.gmtime(check_in))
+                check_out_time = time.strftime("%H:%M:%S", time.gmtime(check_out))
+                total_hours, status = services.work_hours(check_in_time, check_out_time)
+                yield emp_id, day, check_in_time, check_out_time, total_hours, status
+                produced += 1
+                if produced == count:
+                    return
+
+    # Rollup triggers are dropped for the load and the rollups rebuilt once at the end; insert()
+    # bumps the Data_Version counter once per chunk
+    with database.transaction(db) as conn:
+        for trigger in ["Attendance_rollup_insert", "Attendance_rollup_delete", "Attendance_rollup_update"]:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    try:
+        return insert(db, "Employee_Attendance", """
+            INSERT INTO Employee_Attendance (emp_id, date, check_in_time, check_out_time, total_work_hours, type)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, rows())
+    finally:
+        database.run_in_transaction(database.create_attendance_rollups, db)
+
+
+def add_leaves(db, count, emp_ids, seed=0, today=None):
+    # Mostly short leaves spread over the last two years; pending ones lie in the future
+    rng = random.Random(seed)
+    today = today or date.today()
+
+    def rows():
+        for _ in range(count):
+            status = weighted(rng, STATUS_WEIGHTS)
+            offset = rng.randint(1, 90) if status == "PENDING" else -rng.randint(1, 730)
+            start = today + timedelta(days=offset)
+            length = min(int(rng.expovariate(1 / 1.5)), 14)
+            yield (rng.choice(emp_ids), weighted(rng, LEAVE_WEIGHTS), start.isoformat(),
+                   (start + timedelta(days=length)).isoformat(), status)
+
+    # Like the attendance rollups: load without the balance triggers, then rebuild the ledger once
+    with database.transaction(db) as conn:
+        for trigger in ["Leave_balance_insert", "Leave_balance_delete", "Leave_balance_update"]:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    try:
+        return insert(db, "Leaves", "INSERT INTO Leaves (emp_id, leavetype, startdate, enddate, status) VALUES (?, ?, ?, ?, ?)", rows())
+    finally:
+        database.run_in_transaction(database.create_leave_balances, db)
+
+
+def add_ratings(db, count, emp_ids, seed=0):
+    rng = random.Random(seed)
+    conn = database.connect(db)
+    raters = [row[0] for row in conn.execute("SELECT name FROM HR")] or ["HR"]
+    conn.close()
+
+    def rows():
+        for _ in range(count):
+            yield rng.choice(emp_ids), rng.choice(raters), weighted(rng, RATING_WEIGHTS), rng.choice(COMMENTS)
+
+    # Load without the summary triggers, then rebuild the summaries once
+    with database.transaction(db) as conn:
+        for trigger in ["Performance_summary_insert", "Performance_summary_delete", "Performance_summary_update"]:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    try:
+        return insert(db, "Employee_performance", """
+            INSERT INTO Employee_performance (employee_id, ratedbyhr_name, rating, comments)
+            VALUES (?, ?, ?, ?)
+        """, rows())
+    finally:
+        database.run_in_transaction(database.create_performance_summary, db)
+
+
+def generate(db, employees, punches, leaves, ratings, seed=0):
+    # Adds the requested volumes to db and returns {table: (rows, seconds)}
+    timings = {}
+
+    def timed(name, run):
+        start = time.perf_counter()
+        timings[name] = (run(), time.perf_counter() - start)
+
+    timed("Employee", lambda: add_employees(db, employees, seed))
+    conn = database.connect(db)
+    emp_ids = [row[0] for row in conn.execute("SELECT emp_id FROM Employee")]
+    conn.close()
+
+    if punches:
+        timed("Employee_Attendance", lambda: add_punches(db, punches, emp_ids, seed))
+    timed("Leaves", lambda: add_leaves(db, leaves, emp_ids, seed))
+    timed("Employee_performance", lambda: add_ratings(db, ratings, emp_ids, seed))
+
+    with database.transaction(db) as conn:
+        conn.execute("ANALYZE")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill a copy of ems_data.db with synthetic data")
+    parser.add_argument("output", help="Database file to create (copied from ems_data.db)")
+    parser.add_argument("--preset", choices=list(PRESETS), default="small")
+    for table in ["employees", "punches", "leaves", "ratings"]:
+        parser.add_argument(f"--{table}", type=int, help=f"Override the preset's {table} count")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="Overwrite output if it exists")
+    args = parser.parse_args()
+
+    if os.path.exists(args.output) and not args.force:
+        parser.error(f"{args.output} exists (use --force to overwrite)")
+    for suffix in ["", "-wal", "-shm"]:
+        if os.path.exists(args.output + suffix):
+            os.remove(args.output + suffix)
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), args.output)
+
+    volumes = {table: getattr(args, table) if getattr(args, table) is not None else count
+               for table, count in PRESETS[args.preset].items()}
+    timings = generate(args.output, seed=args.seed, **volumes)
+    database.close_all()
+
+    for table, (rows, seconds) in timings.items():
+        print(f"{table:<22} {rows:>12,} rows  {seconds:8.1f}s  {rows / max(seconds, 1e-9):>10,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
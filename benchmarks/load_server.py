@@ -0,0 +1,141 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import random
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Read-heavy kiosk/clerk traffic; check-ins only when --checkins is given
+READ_MIX = [
+    ("GET", "/employees/{emp_id}/profile", None),
+    ("GET", "/employees/{emp_id}/salary", None),
+    ("GET", "/employees/{emp_id}/leaves", None),
+    ("GET", "/leaves/pending", None),
+]
+CHECKIN = ("POST", "/employees/{emp_id}/check-in", {})
+
+
+async def request(reader, writer, method, path, payload):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = int(re.search(rb"Content-Length: (\d+)", head).group(1))
+    await reader.readexactly(length)
+    return status
+
+
+async def fetch_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(re.search(rb"Content-Length: (\d+)", head).group(1))
+        return json.loads(await reader.readexactly(length))
+    finally:
+        writer.close()
+
+
+async def client(host, port, count, emp_ids, mix, latencies, statuses):
+    # One keep-alive connection sending `count` requests back to back
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random()
+    try:
+        for _ in range(count):
+            method, path, payload = rng.choice(mix)
+            start = time.perf_counter()
+            status = await request(reader, writer, method, path.format(emp_id=rng.choice(emp_ids)), payload)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, connections, total, emp_ids, mix):
+    latencies, statuses = [], {}
+    per_client = max(1, total // connections)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, per_client, emp_ids, mix, latencies, statuses) for _ in range(connections)))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))] if samples else 0.0
+
+
+def start_server(db, workers, profile_cache=True):
+    command = [sys.executable, os.path.join(ROOT, "server.py"), "--db", db, "--port", "0", "--workers", str(workers)]
+    process = subprocess.Popen(command + ([] if profile_cache else ["--no-profile-cache"]), stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    match = re.search(r":(\d+)$", line.strip())
+    if not match:
+        process.kill()
+        raise SystemExit(f"Server did not start: {line!r}")
+    return process, int(match.group(1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local HTTP/JSON server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="Use a running server instead of starting one on a copy of ems_data.db")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=database.POOL_SIZE)
+    parser.add_argument("--checkins", action="store_true", help="Mix check-in writes into the traffic")
+    parser.add_argument("--no-profile-cache", action="store_true", help="Start the server with the profile cache off")
+    options = parser.parse_args()
+
+    workdir = process = None
+    db = os.path.join(ROOT, "ems_data.db")
+    if options.port is None:
+        workdir = tempfile.mkdtemp(prefix="ems_load_")
+        db = os.path.join(workdir, "ems_data.db")
+        shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+        process, options.port = start_server(db, options.workers, not options.no_profile_cache)
+
+    try:
+        conn = database.connect(db)
+        emp_ids = [row[0] for row in conn.execute("SELECT emp_id FROM Employee")]
+        conn.close()
+
+        mix = READ_MIX + ([CHECKIN] if options.checkins else [])
+        elapsed, latencies, statuses = asyncio.run(run_load(options.host, options.port, options.connections,
+                                                            options.requests, emp_ids, mix))
+        cache = asyncio.run(fetch_json(options.host, options.port, "/cache/stats"))["profiles"]
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+        database.close_all()
+        if workdir:
+            shutil.rmtree(workdir)
+
+    print(f"{len(latencies)} requests over {options.connections} keep-alive connections, {options.workers} database workers")
+    print(tabulate([[f"{len(latencies) / elapsed:.0f}", f"{percentile(latencies, 0.50) * 1000:.2f}",
+                     f"{percentile(latencies, 0.99) * 1000:.2f}", ", ".join(f"{code}: {n}" for code, n in sorted(statuses.items()))]],
+                   headers=["Requests/s", "p50 (ms)", "p99 (ms)", "Status codes"], tablefmt="double_grid"))
+    if cache["enabled"]:
+        print(f"Profile cache: {cache['hits']} hits, {cache['misses']} misses (hit rate {cache['hit_rate']}), "
+              f"{cache['entries']} entries")
+    else:
+        print("Profile cache: off")
+
+
+if __name__ == "__main__":
+    main()
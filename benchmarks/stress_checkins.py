@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import multiprocessing
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import services
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_DATE = date.today().isoformat()
+
+
+def configure(options):
+    database.JOURNAL_MODE = options.journal_mode
+    database.BUSY_TIMEOUT_MS = options.busy_timeout_ms
+
+
+def checkin_worker(args):
+    db, options, worker = args
+    configure(options)
+
+    latencies = []
+    failures = 0
+    for i in range(options.checkins):
+        emp_id = worker * options.checkins + i + 1
+
+        # The check-in Employee.mark_attendance runs
+        start = time.perf_counter()
+        try:
+            services.check_in(emp_id, db=db)
+        except sqlite3.OperationalError:
+            failures += 1
+        latencies.append(time.perf_counter() - start)
+    return latencies, failures
+
+
+def report_worker(db, options, stop, results):
+    configure(options)
+
+    latencies = []
+    failures = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            # HR.employee_attendance_report query
+            services.attendance_for_date(REPORT_DATE, db)
+        except sqlite3.OperationalError:
+            failures += 1
+        latencies.append(time.perf_counter() - start)
+    results.put((latencies, failures))
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))] if samples else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent check-in storm against a copy of ems_data.db")
+    parser.add_argument("--workers", type=int, default=32, help="concurrent check-in processes")
+    parser.add_argument("--checkins", type=int, default=100, help="check-ins per worker")
+    parser.add_argument("--reporters", type=int, default=2, help="concurrent attendance report processes")
+    parser.add_argument("--journal-mode", default=database.JOURNAL_MODE)
+    parser.add_argument("--busy-timeout-ms", type=int, default=database.BUSY_TIMEOUT_MS)
+    options = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="ems_stress_")
+    db = os.path.join(workdir, "ems_data.db")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), db)
+
+    try:
+        # Apply migrations and journal mode once before the storm
+        configure(options)
+        conn = database.connect(db)
+        baseline = conn.execute("SELECT COUNT(*) FROM Employee_Attendance WHERE date = ?", (REPORT_DATE,)).fetchone()[0]
+        conn.close()
+        database.close_all()
+
+        stop = multiprocessing.Event()
+        results = multiprocessing.Queue()
+        reporters = [multiprocessing.Process(target=report_worker, args=(db, options, stop, results))
+                     for _ in range(options.reporters)]
+        for process in reporters:
+            process.start()
+
+        start = time.perf_counter()
+        with multiprocessing.Pool(options.workers) as pool:
+            outcomes = pool.map(checkin_worker, [(db, options, worker) for worker in range(options.workers)])
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        report_outcomes = [results.get() for _ in reporters]
+        for process in reporters:
+            process.join()
+
+        conn = sqlite3.connect(db)
+        recorded = conn.execute("SELECT COUNT(*) FROM Employee_Attendance WHERE date = ?", (REPORT_DATE,)).fetchone()[0] - baseline
+        conn.close()
+    finally:
+        shutil.rmtree(workdir)
+
+    expected = options.workers * options.checkins
+    checkin_latencies = [sample for latencies, _ in outcomes for sample in latencies]
+    report_latencies = [sample for latencies, _ in report_outcomes for sample in latencies]
+    checkin_failures = sum(failures for _, failures in outcomes)
+    report_failures = sum(failures for _, failures in report_outcomes)
+
+    print(f"Journal mode {options.journal_mode}, busy timeout {options.busy_timeout_ms} ms, "
+          f"{options.workers} check-in workers, {options.reporters} report workers")
+    print(tabulate([
+        ["Check-ins", expected, checkin_failures, f"{percentile(checkin_latencies, 0.5) * 1000:.2f}",
+         f"{percentile(checkin_latencies, 0.99) * 1000:.2f}", f"{expected / elapsed:.0f}/s"],
+        ["Attendance reports", len(report_latencies), report_failures, f"{percentile(report_latencies, 0.5) * 1000:.2f}",
+         f"{percentile(report_latencies, 0.99) * 1000:.2f}", ""],
+    ], headers=["Operation", "Count", "Failed", "p50 (ms)", "p99 (ms)", "Throughput"], tablefmt="double_grid"))
+
+    lost = expected - recorded
+    print(f"\nPunches expected {expected}, recorded {recorded}, lost {lost}")
+    if lost or checkin_failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
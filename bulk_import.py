@@ -0,0 +1,169 @@
+import os
+import csv
+import json
+from datetime import date
+
+import database
+import validators
+
+CHUNK_SIZE = 1000
+
+FIELDS = ["name", "password", "age", "gender", "address", "department", "position",
+          "salary", "email", "contactnumber", "degree"]
+
+INSERT_EMPLOYEE = """
+    INSERT INTO Employee (name, password, age, gender, address, department, position, salary, email, contactnumber, joining_date, degree)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def read_rows(path):
+    # Stream (line number, dict) pairs from a CSV file with a header row or a JSONL file
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as file:
+            for line_no, line in enumerate(file, start=1):
+                if line.strip():
+                    try:
+                        yield line_no, json.loads(line)
+                    except ValueError:
+                        yield line_no, None
+    else:
+        with open(path, newline="", encoding="utf-8") as file:
+            for line_no, row in enumerate(csv.DictReader(file), start=2):
+                yield line_no, row
+
+
+def validate_row(row):
+    # Same rules as HR.add_employee; returns (values, errors)
+    if not isinstance(row, dict):
+        return None, ["Malformed row"]
+
+    value = {field: str(row.get(field) if row.get(field) is not None else "").strip() for field in FIELDS}
+    value["gender"] = value["gender"].capitalize()
+
+    errors = []
+    if not validators.valid_name(value["name"]):
+        errors.append("Invalid Name")
+    if not validators.valid_password(value["password"]):
+        errors.append("Invalid Password")
+    if not validators.valid_age(value["age"]):
+        errors.append("Invalid Age")
+    if not validators.valid_gender(value["gender"]):
+        errors.append("Invalid Gender")
+    if not validators.valid_department(value["department"]):
+        errors.append("Invalid Department")
+    elif not validators.valid_position(value["department"], value["position"]):
+        errors.append("Invalid Position")
+    if not validators.valid_salary(value["salary"]):
+        errors.append("Invalid Salary")
+    if not validators.valid_email(value["email"]):
+        errors.append("Invalid Email")
+    if not validators.valid_contact(value["contactnumber"]):
+        errors.append("Invalid Contact Number")
+
+    if errors:
+        return None, errors
+    return value, []
+
+
+def existing_values(conn, column, values):
+    # One IN (...) lookup per chunk against the UNIQUE index instead of a query per row
+    values = list(values)
+    if not values:
+        return set()
+    placeholders = ", ".join("?" * len(values))
+    cursor = conn.execute(f"SELECT {column} FROM Employee WHERE {column} IN ({placeholders})", values)
+    return {row[0] for row in cursor}
+
+
+def insert_chunk(conn, chunk, reject):
+    taken_emails = existing_values(conn, "email", (value["email"] for _, value in chunk))
+    taken_contacts = existing_values(conn, "contactnumber", (value["contactnumber"] for _, value in chunk))
+
+    joining_date = str(date.today())
+    records = []
+    for line_no, value in chunk:
+        errors = []
+        if value["email"] in taken_emails:
+            errors.append("Email already exists")
+        if value["contactnumber"] in taken_contacts:
+            errors.append("Contact number already exists")
+        if errors:
+            reject(line_no, value, errors)
+            continue
+        records.append((value["name"], value["password"], int(value["age"]), value["gender"], value["address"],
+                        value["department"], value["position"], int(value["salary"]), value["email"],
+                        value["contactnumber"], joining_date, value["degree"]))
+
+    conn.executemany(INSERT_EMPLOYEE, records)
+    if records:
+        database.bump_versions(conn, "Employee")
+    return len(records)
+
+
+def import_employees(path, db=database.DB_PATH, chunk_size=CHUNK_SIZE, error_report=None):
+    error_report = error_report or os.path.splitext(path)[0] + "_errors.csv"
+    summary = {"read": 0, "imported": 0, "rejected": 0, "error_report": None}
+
+    with open(error_report, "w", newline="", encoding="utf-8") as report_file:
+        report = csv.writer(report_file)
+        report.writerow(["line"] + FIELDS + ["errors"])
+
+        def reject(line_no, row, errors):
+            row = row if isinstance(row, dict) else {}
+            report.writerow([line_no] + [row.get(field, "") for field in FIELDS] + ["; ".join(errors)])
+            summary["rejected"] += 1
+
+        # Duplicates inside the file itself are caught before touching the database
+        seen_emails = set()
+        seen_contacts = set()
+        chunk = []
+
+        def flush():
+            # Uniqueness check and insert share one short write transaction per chunk
+            summary["imported"] += database.run_in_transaction(lambda conn: insert_chunk(conn, chunk, reject), db)
+            chunk.clear()
+
+        for line_no, row in read_rows(path):
+            summary["read"] += 1
+            value, errors = validate_row(row)
+            if value:
+                if value["email"] in seen_emails:
+                    errors.append("Duplicate email in file")
+                if value["contactnumber"] in seen_contacts:
+                    errors.append("Duplicate contact number in file")
+            if errors:
+                reject(line_no, row, errors)
+                continue
+
+            seen_emails.add(value["email"])
+            seen_contacts.add(value["contactnumber"])
+            chunk.append((line_no, value))
+            if len(chunk) >= chunk_size:
+                flush()
+
+        if chunk:
+            flush()
+
+    if summary["rejected"]:
+        summary["error_report"] = error_report
+    else:
+        os.remove(error_report)
+    return summary
+
+
+if __name__ == "__main__":
+    # python3 bulk_import.py employees.csv|employees.jsonl [--db ems_data.db] [--chunk-size 1000] [--errors report.csv]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk onboard employees from a CSV or JSONL file")
+    parser.add_argument("path")
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--errors", default=None, help="where to write rejected rows")
+    args = parser.parse_args()
+
+    result = import_employees(args.path, args.db, args.chunk_size, args.errors)
+    print(f"Read {result['read']}, imported {result['imported']}, rejected {result['rejected']}")
+    if result["error_report"]:
+        print(f"Rejected rows written to {result['error_report']}")
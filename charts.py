@@ -0,0 +1,147 @@
+import os
+import sys
+
+# "interactive" opens a window per chart; "headless" renders straight to files with Agg.
+# Without a display on Linux we fall back to headless automatically.
+CHART_MODE = os.environ.get("EMS_CHART_MODE", "interactive")
+CHART_DIR = os.environ.get("EMS_CHART_DIR", "charts")
+CHART_FORMAT = os.environ.get("EMS_CHART_FORMAT", "png")   # png or svg
+
+_pyplot = None
+
+
+def is_headless():
+    if CHART_MODE == "headless":
+        return True
+    no_display = not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY")
+    return sys.platform.startswith("linux") and no_display
+
+
+def pyplot():
+    # matplotlib is only imported the first time a chart is actually drawn
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        if is_headless():
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+
+def chart_path(name, directory=None, fmt=None):
+    directory = directory or CHART_DIR
+    os.makedirs(directory, exist_ok=True)
+    safe_name = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in name)
+    return os.path.join(directory, f"{safe_name}.{fmt or CHART_FORMAT}")
+
+
+def draw_bar(ax, labels, values, title, xlabel, ylabel, color='skyblue', rotation=None):
+    ax.bar(labels, values, color=color)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    if rotation:
+        ax.tick_params(axis='x', labelrotation=rotation)
+
+
+class ChartBatch:
+    # Renders many charts to files with one Agg figure, cleared between charts
+    def __init__(self, directory=None, fmt=None, figsize=(10, 6)):
+        from matplotlib.figure import Figure
+
+        self.directory = directory
+        self.fmt = fmt
+        self.figsize = figsize
+        self.figure = Figure(figsize=figsize)
+        self.paths = []
+
+    def bar_chart(self, name, labels, values, title, xlabel, ylabel, color='skyblue', rotation=None, figsize=None):
+        self.figure.clear()
+        self.figure.set_size_inches(*(figsize or self.figsize))
+        draw_bar(self.figure.add_subplot(), labels, values, title, xlabel, ylabel, color, rotation)
+        self.figure.tight_layout()
+
+        path = chart_path(name, self.directory, self.fmt)
+        self.figure.savefig(path)
+        self.paths.append(path)
+        return path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.figure.clear()
+
+
+_batch = None
+
+
+def bar_chart(name, labels, values, title, xlabel, ylabel, color='skyblue', rotation=None, figsize=None):
+    # Show the chart, or in headless mode save it and return the file path
+    global _batch
+    if is_headless():
+        if _batch is None:
+            _batch = ChartBatch()
+        return _batch.bar_chart(name, labels, values, title, xlabel, ylabel, color, rotation, figsize)
+
+    plt = pyplot()
+    fig = plt.figure(figsize=figsize)
+    draw_bar(fig.add_subplot(), labels, values, title, xlabel, ylabel, color, rotation)
+    fig.tight_layout()
+    plt.show()
+    plt.close(fig)
+    return None
+
+
+def render_reports(db, dates, directory=None, fmt=None):
+    # Batch mode: every department salary chart, the HR salary chart and one
+    # attendance chart per date, rendered in one process without a display
+    import database
+
+    conn = database.connect(db)
+    cursor = conn.cursor()
+    try:
+        with ChartBatch(directory, fmt) as batch:
+            cursor.execute("SELECT department, SUM(salary) FROM Employee GROUP BY department")
+            for department, total in cursor.fetchall():
+                batch.bar_chart(f"salary_report_{department}", [department], [total],
+                                f'Salary Report for {department}', 'Department', 'Total Salary (INR)')
+
+            cursor.execute("SELECT hr_id, salary FROM HR")
+            hr_data = cursor.fetchall()
+            if hr_data:
+                batch.bar_chart("hr_salary_report", [str(row[0]) for row in hr_data], [row[1] for row in hr_data],
+                                'HR Salary Report', 'HR ID', 'Salary (INR)', color='orange')
+
+            for day in dates:
+                cursor.execute("""
+                    SELECT emp_id, SUM(total_work_hours)
+                    FROM Employee_Attendance
+                    WHERE date = ?
+                    GROUP BY emp_id
+                """, (day,))
+                attendance_data = cursor.fetchall()
+                if attendance_data:
+                    batch.bar_chart(f"attendance_report_{day}", [str(row[0]) for row in attendance_data],
+                                    [row[1] or 0 for row in attendance_data], f'Employee Attendance Report - {day}',
+                                    'Employee ID', 'Total Working Hours', rotation=45)
+            return batch.paths
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    # python3 charts.py [--db ems_data.db] [--out charts] [--format png|svg] [DATE ...]
+    import argparse
+    import database
+
+    parser = argparse.ArgumentParser(description="Render report charts to files without a display")
+    parser.add_argument("dates", nargs="*", help="attendance dates (YYYY-MM-DD)")
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--out", default=CHART_DIR)
+    parser.add_argument("--format", default=CHART_FORMAT, choices=["png", "svg"])
+    args = parser.parse_args()
+
+    for path in render_reports(args.db, args.dates, args.out, args.format):
+        print(path)
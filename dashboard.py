@@ -0,0 +1,137 @@
+import os
+import time
+import threading
+from datetime import date
+
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+
+# Manager dashboard: headcount and salary bill per department, pending leaves, who is on
+# leave today and today's check-ins. Each section is cached per database file together with
+# the Data_Version counters of the tables it reads (and the day, for the sections about
+# today); every write path bumps those counters in its transaction (database.bump_versions),
+# so a dashboard load with nothing changed is one read of three counters, and a check-in
+# only recomputes the attendance part. A section is also recomputed once it is older than
+# TTL_SECONDS, which bounds how long a write that skipped the counters (direct SQL, another
+# tool) can go unseen.
+#
+#   EMS_DASHBOARD_TTL          seconds a cached section is served at most (default 60)
+#
+#   python3 dashboard.py [--repeat 3] [--db ems_data.db]
+
+TTL_SECONDS = float(os.environ.get("EMS_DASHBOARD_TTL", "60"))
+
+_lock = threading.Lock()
+_cache = {}  # (db path, section) -> (key, loaded at, value)
+STATS = {"hits": 0, "misses": 0}
+
+
+def load_departments(conn, today):
+    rows = conn.execute("""
+        SELECT department, COUNT(*), COALESCE(SUM(salary), 0)
+        FROM Employee
+        GROUP BY department
+        ORDER BY department
+    """).fetchall()
+    return {
+        "departments": [{"department": department, "employees": count, "salary": total} for department, count, total in rows],
+        "employees": sum(row[1] for row in rows),
+        "payroll_total": sum(row[2] for row in rows),
+    }
+
+
+def load_leaves(conn, today):
+    pending = conn.execute("SELECT COUNT(*) FROM Leaves WHERE status = 'PENDING'").fetchone()[0]
+    on_leave = conn.execute("""
+        SELECT COUNT(DISTINCT emp_id) FROM Leaves
+        WHERE status = 'APPROVED' AND enddate >= ? AND startdate <= ?
+    """, (today, today)).fetchone()[0]
+    return {"pending_leaves": pending, "on_leave_today": on_leave}
+
+
+def load_attendance(conn, today):
+    checked_in, still_in = conn.execute("""
+        SELECT COUNT(DISTINCT emp_id), COUNT(*) - COUNT(total_work_hours)
+        FROM Employee_Attendance
+        WHERE date = ?
+    """, (today,)).fetchone()
+    return {"checked_in_today": checked_in, "still_checked_in": still_in or 0}
+
+
+# (section, tables it reads, whether it depends on today's date, loader)
+SECTIONS = [
+    ("departments", ["Employee"], False, load_departments),
+    ("leaves", ["Leaves"], True, load_leaves),
+    ("attendance", ["Employee_Attendance"], True, load_attendance),
+]
+
+
+def load_dashboard(db=database.DB_PATH):
+    # The dashboard as a dict; sections whose tables have not been written since they were
+    # cached are served from memory. Counters and recomputed sections come from one snapshot
+    path = os.path.abspath(db)
+    today = date.today().isoformat()
+    dashboard = {"as_of": today}
+    with database.transaction(db) as conn:
+        versions = dict(conn.execute("SELECT table_name, version FROM Data_Version"))
+        for section, tables, dated, loader in SECTIONS:
+            key = (tuple(versions.get(table) for table in tables), today if dated else None)
+            now = time.monotonic()
+            with _lock:
+                cached = _cache.get((path, section))
+                hit = cached is not None and cached[0] == key and now - cached[1] < TTL_SECONDS
+                STATS["hits" if hit else "misses"] += 1
+            if hit:
+                value = cached[2]
+            else:
+                value = loader(conn, today)
+                with _lock:
+                    _cache[(path, section)] = (key, now, value)
+            dashboard.update(value)
+    return dashboard
+
+
+def cache_stats():
+    with _lock:
+        lookups = STATS["hits"] + STATS["misses"]
+        return {**STATS, "hit_rate": round(STATS["hits"] / lookups, 3) if lookups else None}
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+
+
+def show_dashboard(db=database.DB_PATH):
+    # Dashboard screen used by the Manager menu
+    dashboard = load_dashboard(db)
+    print(colored(f"\nCompany Overview ({dashboard['as_of']})", "green", attrs=['bold']))
+    print(tabulate([
+        ["Employees", dashboard["employees"]],
+        ["Monthly salary bill (INR)", f"{dashboard['payroll_total']:.2f}"],
+        ["Pending leave requests", dashboard["pending_leaves"]],
+        ["On approved leave today", dashboard["on_leave_today"]],
+        ["Checked in today", dashboard["checked_in_today"]],
+        ["Still checked in", dashboard["still_checked_in"]],
+    ], tablefmt="double_grid", disable_numparse=True))
+    print(tabulate([[row["department"], row["employees"], row["salary"]] for row in dashboard["departments"]],
+                   headers=["Department", "Employees", "Salary Bill"], tablefmt="double_grid", floatfmt=".2f"))
+    stats = cache_stats()
+    print(colored(f"Cache: {stats['hits']} hits, {stats['misses']} misses", "cyan"))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manager dashboard with cached aggregates")
+    parser.add_argument("--repeat", type=int, default=1, help="Load it this many times and report the timings")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    for _ in range(args.repeat - 1):
+        start = time.perf_counter()
+        load_dashboard(args.db)
+        print(f"Loaded in {(time.perf_counter() - start) * 1000:.2f} ms")
+    show_dashboard(args.db)
@@ -0,0 +1,666 @@
+import os
+import time
+import random
+import sqlite3
+import threading
+import queue
+import atexit
+from contextlib import contextmanager
+
+DB_PATH = 'ems_data.db'
+
+POOL_SIZE = 5
+POOL_TIMEOUT = 30           # seconds to wait for a free connection
+STATEMENT_CACHE_SIZE = 256  # prepared statements kept per connection
+
+# Concurrency: WAL lets reports read while check-ins write. Writers wait up to
+# BUSY_TIMEOUT_MS for the lock inside SQLite, then run_in_transaction() retries
+# with exponential backoff.
+JOURNAL_MODE = os.environ.get("EMS_JOURNAL_MODE", "WAL")
+BUSY_TIMEOUT_MS = int(os.environ.get("EMS_BUSY_TIMEOUT_MS", "5000"))
+BUSY_RETRIES = 5
+BUSY_BACKOFF = 0.05         # seconds before the first retry, doubled after each
+
+# Per-statement timing, slow-query log and plans (see query_stats.py); off unless EMS_QUERY_STATS=1
+QUERY_STATS = os.environ.get("EMS_QUERY_STATS", "0") not in ("", "0")
+
+# Every connection handed out by the pool gets these, so they live in one place
+PRAGMAS = [
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+]
+
+def create_employee_search_index(conn):
+    # FTS5 index over Employee kept in sync by triggers; skipped when SQLite lacks FTS5
+    # (search.py then falls back to LIKE)
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS Employee_fts USING fts5(
+                name, email, department, position, address,
+                content='Employee', content_rowid='emp_id', prefix='2 3'
+            )
+        """)
+    except sqlite3.OperationalError as error:
+        if "fts5" not in str(error):
+            raise
+        return
+
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS Employee_fts_insert AFTER INSERT ON Employee BEGIN
+            INSERT INTO Employee_fts (rowid, name, email, department, position, address)
+            VALUES (new.emp_id, new.name, new.email, new.department, new.position, new.address);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS Employee_fts_delete AFTER DELETE ON Employee BEGIN
+            INSERT INTO Employee_fts (Employee_fts, rowid, name, email, department, position, address)
+            VALUES ('delete', old.emp_id, old.name, old.email, old.department, old.position, old.address);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS Employee_fts_update AFTER UPDATE OF name, email, department, position, address ON Employee BEGIN
+            INSERT INTO Employee_fts (Employee_fts, rowid, name, email, department, position, address)
+            VALUES ('delete', old.emp_id, old.name, old.email, old.department, old.position, old.address);
+            INSERT INTO Employee_fts (rowid, name, email, department, position, address)
+            VALUES (new.emp_id, new.name, new.email, new.department, new.position, new.address);
+        END
+    """)
+    conn.execute("INSERT INTO Employee_fts (Employee_fts) VALUES ('rebuild')")
+
+
+def rebuild_attendance_rollups(conn):
+    # Recompute the daily and monthly attendance rollups from raw punches (backfills, reconciliation)
+    conn.execute("DELETE FROM Attendance_Daily")
+    conn.execute("DELETE FROM Attendance_Monthly")
+    conn.execute("""
+        INSERT INTO Attendance_Daily (emp_id, date, total_work_hours, full_days, half_days, punches)
+        SELECT emp_id, date, SUM(COALESCE(total_work_hours, 0)), SUM(type IS 'Full Day'), SUM(type IS 'Half Day'), COUNT(*)
+        FROM Employee_Attendance
+        GROUP BY emp_id, date
+    """)
+    conn.execute("""
+        INSERT INTO Attendance_Monthly (emp_id, month, total_work_hours, full_days, half_days, punches)
+        SELECT emp_id, substr(date, 1, 7), SUM(total_work_hours), SUM(full_days), SUM(half_days), SUM(punches)
+        FROM Attendance_Daily
+        GROUP BY emp_id, substr(date, 1, 7)
+    """)
+
+
+def _rollup_upsert(table, key, sign, row):
+    # One trigger statement adding (sign=+) or removing (sign=-) a punch row's contribution
+    key_value = f"{row}.date" if key == "date" else f"substr({row}.date, 1, 7)"
+    return f"""
+        INSERT INTO {table} (emp_id, {key}, total_work_hours, full_days, half_days, punches)
+        VALUES ({row}.emp_id, {key_value}, {sign}COALESCE({row}.total_work_hours, 0),
+                {sign}({row}.type IS 'Full Day'), {sign}({row}.type IS 'Half Day'), {sign}1)
+        ON CONFLICT (emp_id, {key}) DO UPDATE SET
+            total_work_hours = total_work_hours + excluded.total_work_hours,
+            full_days = full_days + excluded.full_days,
+            half_days = half_days + excluded.half_days,
+            punches = punches + excluded.punches;
+    """
+
+
+def create_attendance_rollups(conn):
+    # Per employee per day and per month attendance totals, kept current by triggers
+    # on Employee_Attendance so check-ins and check-outs update them incrementally
+    for table, key in [("Attendance_Daily", "date"), ("Attendance_Monthly", "month")]:
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                emp_id INTEGER,
+                {key} TEXT,
+                total_work_hours REAL NOT NULL DEFAULT 0,
+                full_days INTEGER NOT NULL DEFAULT 0,
+                half_days INTEGER NOT NULL DEFAULT 0,
+                punches INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (emp_id, {key})
+            ) WITHOUT ROWID
+        """)
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table.lower()}_{key} ON {table} ({key}, emp_id)")
+
+    add = _rollup_upsert("Attendance_Daily", "date", "+", "new") + _rollup_upsert("Attendance_Monthly", "month", "+", "new")
+    remove = _rollup_upsert("Attendance_Daily", "date", "-", "old") + _rollup_upsert("Attendance_Monthly", "month", "-", "old")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS Attendance_rollup_insert AFTER INSERT ON Employee_Attendance BEGIN {add} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS Attendance_rollup_delete AFTER DELETE ON Employee_Attendance BEGIN {remove} END")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS Attendance_rollup_update
+        AFTER UPDATE OF emp_id, date, total_work_hours, type ON Employee_Attendance BEGIN {remove} {add} END
+    """)
+    rebuild_attendance_rollups(conn)
+
+
+# Annual days per leave type, seeded into Leave_Entitlement (change them there, or with leave_balance.py)
+DEFAULT_LEAVE_ENTITLEMENTS = {"Sick Leave": 12, "Vacation Leave": 15, "Casual Leave": 8}
+
+
+def _leave_year_parts(row):
+    # (year, days) SQL for a leave's share of its start year and, when it crosses a year end,
+    # of its end year; row is "new.", "old." or "" for the Leaves columns themselves. Leaves
+    # spanning more than two calendar years are refused (Leaves_year_span_*), so these two
+    # parts always match leave_balance.days_by_year
+    start, end = f"{row}startdate", f"{row}enddate"
+    start_year = f"CAST(substr({start}, 1, 4) AS INTEGER)"
+    end_year = f"CAST(substr({end}, 1, 4) AS INTEGER)"
+    first = f"MAX(CAST(julianday(MIN({end}, substr({start}, 1, 4) || '-12-31')) - julianday({start}) + 1 AS INTEGER), 0)"
+    second = f"MAX(CAST(julianday({end}) - julianday(substr({end}, 1, 4) || '-01-01') + 1 AS INTEGER), 0)"
+    return [(start_year, first, "1"), (end_year, second, f"{end_year} > {start_year}")]
+
+
+def _leave_balance_upserts(sign, row):
+    # Trigger statements adding (sign=+) or removing (sign=-) a leave's used or pending days
+    statements = ""
+    for year, days, condition in _leave_year_parts(row):
+        statements += f"""
+            INSERT INTO Leave_Balance (emp_id, leavetype, year, used_days, pending_days)
+            SELECT {row}emp_id, {row}leavetype, {year},
+                   {sign}({row}status = 'APPROVED') * COALESCE({days}, 0), {sign}({row}status = 'PENDING') * COALESCE({days}, 0)
+            WHERE {row}status IN ('APPROVED', 'PENDING') AND {condition}
+            ON CONFLICT (emp_id, leavetype, year) DO UPDATE SET
+                used_days = used_days + excluded.used_days,
+                pending_days = pending_days + excluded.pending_days;
+        """
+    return statements
+
+
+def rebuild_leave_balances(conn):
+    # Recompute every employee's used and pending days from Leaves (reconciliation)
+    conn.execute("DELETE FROM Leave_Balance")
+    parts = " UNION ALL ".join(f"""
+        SELECT emp_id, leavetype, {year} AS year,
+               (status = 'APPROVED') * COALESCE({days}, 0) AS used, (status = 'PENDING') * COALESCE({days}, 0) AS pending
+        FROM Leaves
+        WHERE status IN ('APPROVED', 'PENDING') AND {condition}
+    """ for year, days, condition in _leave_year_parts(""))
+    conn.execute(f"""
+        INSERT INTO Leave_Balance (emp_id, leavetype, year, used_days, pending_days)
+        SELECT emp_id, leavetype, year, SUM(used), SUM(pending) FROM ({parts}) GROUP BY emp_id, leavetype, year
+    """)
+
+
+def create_leave_balances(conn):
+    # Per employee, leave type and year: days approved and days still pending, kept current
+    # by triggers on Leaves so approving, rejecting or reversing a leave adjusts one row
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Leave_Entitlement (
+            leavetype TEXT PRIMARY KEY,
+            days INTEGER NOT NULL
+        )
+    """)
+    conn.executemany("INSERT OR IGNORE INTO Leave_Entitlement (leavetype, days) VALUES (?, ?)",
+                     DEFAULT_LEAVE_ENTITLEMENTS.items())
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Leave_Balance (
+            emp_id INTEGER,
+            leavetype TEXT,
+            year INTEGER,
+            used_days INTEGER NOT NULL DEFAULT 0,
+            pending_days INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (emp_id, leavetype, year)
+        ) WITHOUT ROWID
+    """)
+
+    for event in ["INSERT", "UPDATE OF startdate, enddate"]:
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS Leaves_year_span_{event.split()[0].lower()} BEFORE {event} ON Leaves
+            WHEN CAST(substr(new.enddate, 1, 4) AS INTEGER) > CAST(substr(new.startdate, 1, 4) AS INTEGER) + 1
+            BEGIN
+                SELECT RAISE(ABORT, 'A leave can span at most two calendar years');
+            END
+        """)
+
+    add, remove = _leave_balance_upserts("+", "new."), _leave_balance_upserts("-", "old.")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS Leave_balance_insert AFTER INSERT ON Leaves BEGIN {add} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS Leave_balance_delete AFTER DELETE ON Leaves BEGIN {remove} END")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS Leave_balance_update
+        AFTER UPDATE OF emp_id, leavetype, startdate, enddate, status ON Leaves BEGIN {remove} {add} END
+    """)
+    rebuild_leave_balances(conn)
+
+
+def _performance_summary_select(where=""):
+    # Performance_Summary rows computed from Employee_performance; the latest rating is the
+    # one with the highest ep_id and the previous one is the rating before it
+    return f"""
+        SELECT employee_id, COUNT(*), SUM(rating), MAX(ep_id),
+               MAX(CASE WHEN position = 1 THEN rating END), MAX(CASE WHEN position = 2 THEN rating END)
+        FROM (
+            SELECT employee_id, ep_id, rating,
+                   ROW_NUMBER() OVER (PARTITION BY employee_id ORDER BY ep_id DESC) AS position
+            FROM Employee_performance {where}
+        )
+        GROUP BY employee_id
+    """
+
+
+def _performance_refresh(row):
+    # Trigger statements recomputing one employee's summary and dropping a rating from its rater's counts
+    return f"""
+        DELETE FROM Performance_Summary WHERE emp_id = {row}employee_id;
+        INSERT INTO Performance_Summary {_performance_summary_select(f"WHERE employee_id = {row}employee_id")};
+        UPDATE Rater_Distribution SET ratings = ratings - 1
+        WHERE rater = COALESCE({row}ratedbyhr_name, '') AND rating = {row}rating;
+        DELETE FROM Rater_Distribution
+        WHERE rater = COALESCE({row}ratedbyhr_name, '') AND rating = {row}rating AND ratings <= 0;
+    """
+
+
+def rebuild_performance_summary(conn):
+    # Recompute every summary and rater distribution from Employee_performance (reconciliation)
+    conn.execute("DELETE FROM Performance_Summary")
+    conn.execute(f"INSERT INTO Performance_Summary {_performance_summary_select()}")
+    conn.execute("DELETE FROM Rater_Distribution")
+    conn.execute("""
+        INSERT INTO Rater_Distribution (rater, rating, ratings)
+        SELECT COALESCE(ratedbyhr_name, ''), rating, COUNT(*) FROM Employee_performance GROUP BY 1, 2
+    """)
+
+
+def create_performance_summary(conn):
+    # Per employee rating count, sum, latest and previous rating, and per HR rater how many of
+    # each rating they gave. A new rating updates both with one upsert each; deletes and edits
+    # (rare) recompute the employee's summary from its ratings
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Performance_Summary (
+            emp_id INTEGER PRIMARY KEY,
+            ratings INTEGER NOT NULL,
+            rating_sum INTEGER NOT NULL,
+            latest_ep_id INTEGER NOT NULL,
+            latest_rating INTEGER NOT NULL,
+            previous_rating INTEGER
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Rater_Distribution (
+            rater TEXT,
+            rating INTEGER,
+            ratings INTEGER NOT NULL,
+            PRIMARY KEY (rater, rating)
+        ) WITHOUT ROWID
+    """)
+
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS Performance_summary_insert AFTER INSERT ON Employee_performance BEGIN
+            INSERT INTO Performance_Summary (emp_id, ratings, rating_sum, latest_ep_id, latest_rating, previous_rating)
+            VALUES (new.employee_id, 1, new.rating, new.ep_id, new.rating, NULL)
+            ON CONFLICT (emp_id) DO UPDATE SET
+                ratings = ratings + 1,
+                rating_sum = rating_sum + excluded.rating_sum,
+                previous_rating = CASE WHEN excluded.latest_ep_id > latest_ep_id THEN latest_rating ELSE previous_rating END,
+                latest_rating = CASE WHEN excluded.latest_ep_id > latest_ep_id THEN excluded.latest_rating ELSE latest_rating END,
+                latest_ep_id = MAX(latest_ep_id, excluded.latest_ep_id);
+            INSERT INTO Rater_Distribution (rater, rating, ratings) VALUES (COALESCE(new.ratedbyhr_name, ''), new.rating, 1)
+            ON CONFLICT (rater, rating) DO UPDATE SET ratings = ratings + 1;
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS Performance_summary_delete AFTER DELETE ON Employee_performance BEGIN
+            {_performance_refresh("old.")}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS Performance_summary_update
+        AFTER UPDATE OF employee_id, ratedbyhr_name, rating ON Employee_performance BEGIN
+            {_performance_refresh("old.")}
+            DELETE FROM Performance_Summary WHERE emp_id = new.employee_id;
+            INSERT INTO Performance_Summary {_performance_summary_select("WHERE employee_id = new.employee_id")};
+            INSERT INTO Rater_Distribution (rater, rating, ratings) VALUES (COALESCE(new.ratedbyhr_name, ''), new.rating, 1)
+            ON CONFLICT (rater, rating) DO UPDATE SET ratings = ratings + 1;
+        END
+    """)
+    rebuild_performance_summary(conn)
+
+
+# Tables whose writes bump their Data_Version counter (see dashboard.py)
+VERSIONED_TABLES = ["Employee", "Leaves", "Employee_Attendance"]
+
+
+def create_data_versions(conn):
+    # One counter per table, bumped by each write transaction that changes it (bump_versions),
+    # so cached aggregates compare a few counters instead of re-running their queries. Not
+    # per-row triggers: those cost bulk imports and badge ingest a counter update per row
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS Data_Version (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    """)
+    conn.executemany("INSERT OR IGNORE INTO Data_Version (table_name, version) VALUES (?, 0)",
+                     [(table,) for table in VERSIONED_TABLES])
+
+
+def bump_versions(conn, *tables):
+    # Marks tables as changed; every writer of a VERSIONED_TABLES table calls it once, inside
+    # the same transaction as its writes, so readers see the rows and the counter together
+    conn.executemany("UPDATE Data_Version SET version = version + 1 WHERE table_name = ?", [(table,) for table in tables])
+
+
+# Schema migrations, applied in order on first use of a database file.
+# PRAGMA user_version records how many have been applied. Each entry is a
+# list of SQL statements or a callable taking the connection.
+MIGRATIONS = [
+    # 1: indexes for the hot query predicates
+    [
+        # Employee.mark_attendance check-out lookup (covering)
+        "CREATE INDEX IF NOT EXISTS idx_attendance_emp_date ON Employee_Attendance (emp_id, date, check_in_time)",
+        # Daily attendance report: WHERE date = ? GROUP BY emp_id SUM(total_work_hours) (covering)
+        "CREATE INDEX IF NOT EXISTS idx_attendance_date ON Employee_Attendance (date, emp_id, total_work_hours)",
+        # view_applied_leaves / view_leave_history by employee (covering)
+        "CREATE INDEX IF NOT EXISTS idx_leaves_emp ON Leaves (emp_id, startdate, enddate, status, leavetype)",
+        # Pending queue in approve_or_reject_leave: a partial index stays as small as the queue
+        "CREATE INDEX IF NOT EXISTS idx_leaves_pending ON Leaves (emp_id, leavetype, startdate, enddate) WHERE status = 'PENDING'",
+        # Department list and per-department salary totals (covering)
+        "CREATE INDEX IF NOT EXISTS idx_employee_department ON Employee (department, salary)",
+        "CREATE INDEX IF NOT EXISTS idx_performance_employee ON Employee_performance (employee_id, rating)",
+    ],
+    # 2: employee picker pages. emp_id goes between department and salary in the department
+    # index, so a department's page is a range seek in emp_id order and the per-department
+    # salary totals stay covering; names are matched as a NOCASE prefix range
+    [
+        "DROP INDEX IF EXISTS idx_employee_department_page",
+        "DROP INDEX IF EXISTS idx_employee_department",
+        "CREATE INDEX IF NOT EXISTS idx_employee_department ON Employee (department, emp_id, salary)",
+        "CREATE INDEX IF NOT EXISTS idx_employee_name ON Employee (name COLLATE NOCASE)",
+    ],
+    # 3: full-text employee search
+    create_employee_search_index,
+    # 4: daily and monthly attendance rollups
+    create_attendance_rollups,
+    # 5: audit trail of salary changes (single updates, promotions and bulk revisions)
+    [
+        """
+        CREATE TABLE IF NOT EXISTS Salary_History (
+            history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            emp_id INTEGER NOT NULL,
+            old_salary REAL,
+            new_salary REAL NOT NULL,
+            changed_at TEXT NOT NULL,
+            changed_by TEXT,
+            reason TEXT,
+            FOREIGN KEY (emp_id) REFERENCES Employee (emp_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_salary_history_emp ON Salary_History (emp_id, changed_at)",
+    ],
+    # 6: monthly payroll results, one row per employee per month (re-running a month replaces it)
+    [
+        """
+        CREATE TABLE IF NOT EXISTS Payroll (
+            month TEXT NOT NULL,
+            emp_id INTEGER NOT NULL,
+            salary REAL NOT NULL,
+            working_days INTEGER NOT NULL,
+            full_days INTEGER NOT NULL,
+            half_days INTEGER NOT NULL,
+            leave_days INTEGER NOT NULL,
+            paid_days REAL NOT NULL,
+            loss_of_pay REAL NOT NULL,
+            provident_fund REAL NOT NULL,
+            deductions REAL NOT NULL,
+            net_pay REAL NOT NULL,
+            run_at TEXT NOT NULL,
+            PRIMARY KEY (month, emp_id)
+        ) WITHOUT ROWID
+        """,
+    ],
+    # 7: leave entitlements and the per employee, type and year leave balance ledger
+    create_leave_balances,
+    # 8: overlap check in apply_leave; ordered by enddate so the seek skips every leave that ended
+    # before the new one starts, and partial so rejected leaves are never visited
+    [
+        "CREATE INDEX IF NOT EXISTS idx_leaves_active_end ON Leaves (emp_id, enddate, startdate) "
+        "WHERE status IN ('PENDING', 'APPROVED')",
+    ],
+    # 9: team availability calendar; leaves of one status by end date, covering so the approved
+    # leaves overlapping a date range are read without touching the table. Its status prefix
+    # also serves the pending queue, which makes the partial idx_leaves_pending redundant
+    [
+        "CREATE INDEX IF NOT EXISTS idx_leaves_status_end ON Leaves (status, enddate, startdate, emp_id)",
+        "DROP INDEX IF EXISTS idx_leaves_pending",
+    ],
+    # 10: per employee rating summaries and per rater rating distribution
+    create_performance_summary,
+    # 11: per table write counters for the cached manager dashboard
+    create_data_versions,
+]
+
+
+class PooledConnection:
+    # Thin proxy around a pooled sqlite3 connection: close() hands it back to the pool
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+        self._closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._pool.release(self._conn)
+
+    def __del__(self):
+        # Safety net for code paths that return without closing
+        if self.__dict__.get("_closed") is False:
+            try:
+                self.close()
+            except Exception:
+                pass
+
+
+def migrate(conn):
+    for number, migration in enumerate(MIGRATIONS, start=1):
+        if number <= conn.execute("PRAGMA user_version").fetchone()[0]:
+            continue
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have applied it while we waited for the lock
+            if number > conn.execute("PRAGMA user_version").fetchone()[0]:
+                if callable(migration):
+                    migration(conn)
+                else:
+                    for statement in migration:
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {number}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+_instrumented = None
+
+
+def _instrumented_connection():
+    # query_stats is only imported when instrumentation is switched on
+    global _instrumented
+    if _instrumented is None:
+        import query_stats
+        _instrumented = query_stats.instrument(PooledConnection)
+    return _instrumented
+
+
+class ConnectionPool:
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._migrated = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _new_connection(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE,
+                               timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA journal_mode = {JOURNAL_MODE}")
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+
+        with self._lock:
+            if not self._migrated:
+                try:
+                    migrate(conn)
+                except Exception:
+                    conn.close()
+                    raise
+                self._migrated = True
+        return conn
+
+    def acquire(self):
+        # A thread that already holds a connection gets the same one back (nested calls share it)
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            self._local.depth += 1
+            return self._proxy(held)
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    conn = self._new_connection()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    conn = self._idle.get(timeout=POOL_TIMEOUT)
+                except queue.Empty:
+                    raise sqlite3.OperationalError(f"No free database connection after {POOL_TIMEOUT}s")
+
+        self._local.conn = conn
+        self._local.depth = 1
+        return self._proxy(conn)
+
+    def _proxy(self, conn):
+        if QUERY_STATS:
+            return _instrumented_connection()(self, conn)
+        return PooledConnection(self, conn)
+
+    def release(self, conn):
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        self._local.conn = None
+
+        # Never hand a half-finished transaction to the next user
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    def close_all(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db=DB_PATH):
+    pool = _pools.get(db)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db)
+            if pool is None:
+                pool = ConnectionPool(db)
+                _pools[db] = pool
+    return pool
+
+
+def connect(db=DB_PATH):
+    return get_pool(db).acquire()
+
+
+def is_busy(error):
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return "locked" in str(error) or "busy" in str(error)
+
+
+@contextmanager
+def transaction(db=DB_PATH, immediate=False):
+    conn = connect(db)
+    try:
+        # Nested use runs inside a savepoint of the outer transaction on the same thread's
+        # connection: a failing inner block undoes only its own work, and only the outermost
+        # block commits
+        outer = not conn.in_transaction
+        if outer:
+            # IMMEDIATE takes the write lock up front, so a busy database fails
+            # here instead of half-way through the work
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        else:
+            conn.execute("SAVEPOINT nested_transaction")
+        try:
+            yield conn
+            if outer:
+                conn.commit()
+            else:
+                conn.execute("RELEASE nested_transaction")
+        except BaseException:
+            if outer:
+                if conn.in_transaction:
+                    conn.rollback()
+            elif conn.in_transaction:
+                conn.execute("ROLLBACK TO nested_transaction")
+                conn.execute("RELEASE nested_transaction")
+            raise
+    finally:
+        conn.close()
+
+
+def run_in_transaction(work, db=DB_PATH, retries=BUSY_RETRIES):
+    # Run work(conn) in a short write transaction, retrying with backoff while the database is busy
+    attempt = 0
+    while True:
+        try:
+            with transaction(db, immediate=True) as conn:
+                return work(conn)
+        except sqlite3.OperationalError as error:
+            if not is_busy(error) or attempt >= retries:
+                raise
+            time.sleep(BUSY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5))
+            attempt += 1
+
+
+def close_all():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
+        _pools.clear()
+
+
+atexit.register(close_all)
+
+
+if __name__ == "__main__":
+    # python3 database.py [db_path]  -> apply pending migrations to an existing database
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else DB_PATH
+    conn = connect(path)
+    print(f"{path}: schema version {conn.execute('PRAGMA user_version').fetchone()[0]} of {len(MIGRATIONS)}")
+    conn.close()
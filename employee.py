@@ -1,28 +1,24 @@
-import sqlite3
+import database
+import services
+import leave_balance
 import os
+from datetime import date
 from tabulate import tabulate
 from termcolor import colored
-from datetime import datetime, date
 
 class Employee:
     def __init__(self, emp_id, name):
         self.emp_id = emp_id
         self.name = name
-        self.db = 'ems_data.db'
+        self.db = database.DB_PATH
 
     @staticmethod
     def login():
-        conn = sqlite3.connect('ems_data.db')
-        cursor = conn.cursor()
-
         print(colored("\nEmployee Login", "cyan", attrs=['bold']))
         emp_id = input("Enter your Employee ID: ").strip()
         password = input("Enter your Password: ").strip()
 
-        cursor.execute("SELECT emp_id, name FROM Employee WHERE emp_id = ? AND password = ?", (emp_id, password))
-        user = cursor.fetchone()
-
-        conn.close()
+        user = services.authenticate_employee(emp_id, password)
 
         if user:
             print(colored(f"\nLogin successful! Welcome, {user[1]}.", "green", attrs=['bold']))
@@ -46,62 +42,37 @@ class Employee:
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def mark_attendance(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         print(colored("\n1) Check-in", "cyan"))
         print(colored("2) Check-out", "red"))
 
         choice = input("Enter your choice (1/2): ").strip()
 
-        today_date = date.today().isoformat()
-        now_time = datetime.now().strftime("%H:%M:%S")
-
         if choice == "1":
-            cursor.execute(
-                "INSERT INTO Employee_Attendance (emp_id, date, check_in_time) VALUES (?, ?, ?)",
-                (self.emp_id, today_date, now_time)
-            )
-            conn.commit()
+            services.check_in(self.emp_id, db=self.db)
             print(colored("\nCheck-in recorded successfully!", "green"))
 
         elif choice == "2":
-            cursor.execute(
-                "SELECT check_in_time FROM Employee_Attendance WHERE emp_id = ? AND date = ?",
-                (self.emp_id, today_date)
-            )
-            check_in = cursor.fetchone()
-            
-            if check_in:
-                check_in_time = datetime.strptime(check_in[0], "%H:%M:%S")
-                check_out_time = datetime.strptime(now_time, "%H:%M:%S")
-                total_hours = (check_out_time - check_in_time).seconds / 3600
-                status = "Full Day" if total_hours >= 8 else "Half Day"
-
-                cursor.execute(
-                    "UPDATE Employee_Attendance SET check_out_time = ?, total_work_hours = ?, type = ? WHERE emp_id = ? AND date = ?",
-                    (now_time, total_hours, status, self.emp_id, today_date)
-                )
-                conn.commit()
+            try:
+                total_hours, status = services.check_out(self.emp_id, db=self.db)
                 print(colored(f"\nCheck-out recorded! Total hours worked: {total_hours:.2f}. Status: {status}", "green"))
-            else:
-                print(colored("\nYou must check-in first!", "red"))
+            except services.ServiceError as e:
+                print(colored(f"\n{e}", "red"))
 
         else:
             print(colored("\nInvalid choice!", "red"))
-
-        conn.close()
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def apply_leave(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
+        balances = services.leave_balances(self.emp_id, db=self.db)
+        if balances:
+            print(colored(f"\nYour Leave Balance ({date.today().year}):", "cyan"))
+            print(tabulate(balances, headers=leave_balance.HEADERS, tablefmt="double_grid"))
 
-        leave_types = [["1", "Sick Leave"], ["2", "Vacation Leave"], ["3", "Casual Leave"]]
+        leave_types = [[str(i), leave_type] for i, leave_type in enumerate(services.LEAVE_TYPES, 1)]
         print(tabulate(leave_types, headers=[colored("Option", "cyan"), colored("Leave Type", "yellow")], tablefmt="double_grid"))
 
         choice = input("Select Leave Type (1/2/3): ").strip()
-        leave_type = {"1": "Sick Leave", "2": "Vacation Leave", "3": "Casual Leave"}.get(choice)
+        leave_type = dict(leave_types).get(choice)
 
         if not leave_type:
             print(colored("\nInvalid choice!", "red"))
@@ -110,68 +81,45 @@ class Employee:
         start_date = input("Enter Start Date (YYYY-MM-DD): ").strip()
         end_date = input("Enter End Date (YYYY-MM-DD): ").strip()
 
-        if start_date < str(date.today()) or end_date < start_date:
-            print(colored("\nInvalid dates! Start date must be after today and end date after start date.", "red"))
-            return
-
-        cursor.execute(
-            "INSERT INTO Leaves (emp_id, leavetype, startdate, enddate, status) VALUES (?, ?, ?, ?, ?)",
-            (self.emp_id, leave_type, start_date, end_date, "PENDING")
-        )
-        conn.commit()
-        conn.close()
-
-        print(colored("\nLeave request submitted successfully! Status: PENDING", "green"))
+        try:
+            services.apply_leave(self.emp_id, leave_type, start_date, end_date, db=self.db)
+            print(colored("\nLeave request submitted successfully! Status: PENDING", "green"))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def view_applied_leaves(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT leavetype, startdate, enddate, status FROM Leaves WHERE emp_id = ?", (self.emp_id,))
-        leaves = cursor.fetchall()
+        leaves = services.list_leaves(self.emp_id, db=self.db)
 
         if leaves:
             print(colored("\nYour Applied Leaves:", "green"))
             print(tabulate(leaves, headers=["Leave Type", "Start Date", "End Date", "Status"], tablefmt="double_grid"))
         else:
             print(colored("\nNo applied leaves found.", "red"))
-
-        conn.close()
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def check_salary(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT salary FROM Employee WHERE emp_id = ?", (self.emp_id,))
-        salary = cursor.fetchone()
+        salary = services.get_salary(self.emp_id, db=self.db)
 
-        if salary:
-            print(colored(f"\nYour current salary is: {salary[0]} USD", "green"))
+        if salary is not None:
+            print(colored(f"\nYour current salary is: {salary} USD", "green"))
         else:
             print(colored("\nSalary details not found.", "red"))
-
-        conn.close()
 # -----------------------------------------------------------------------------------------------------------------------------------
 
 
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def view_and_update_profile(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         # Fetch employee details
-        cursor.execute(
-            "SELECT age, gender, address, department, position, salary, email, contactnumber, joining_date, degree FROM Employee WHERE emp_id = ?",
-            (self.emp_id,)
-        )
-        data = cursor.fetchone()
+        data = services.get_profile(self.emp_id, db=self.db)
+        if data is None:
+            print(colored("\nProfile details not found.", "red"))
+            return
 
         headers = ["Age", "Gender", "Address", "Department", "Position", "Salary", "Email", "Contact No.", "Joining Date", "Degree"]
         print(colored("\nYour Profile Details:", "green"))
-        print(tabulate([data], headers=headers, tablefmt="double_grid"))
+        print(tabulate([list(data.values())], headers=headers, tablefmt="double_grid"))
 
         # Ask user for fields to update (with skip option)
         print(colored("\nUpdate Your Profile (Press Enter to skip any field):", "cyan"))
@@ -193,17 +141,15 @@ class Employee:
         if new_degree:
             updates["degree"] = new_degree
 
-        # Prepare and execute update query
-        if updates:
-            query = "UPDATE Employee SET " + ", ".join(f"{col} = ?" for col in updates.keys()) + " WHERE emp_id = ?"
-            values = list(updates.values()) + [self.emp_id]
-            cursor.execute(query, values)
-            conn.commit()
-            print(colored("\nProfile updated successfully!", "green"))
-        else:
+        if not updates:
             print(colored("\nNo changes made to your profile.", "yellow"))
+            return
 
-        conn.close()
+        try:
+            services.update_profile(self.emp_id, db=self.db, **updates)
+            print(colored("\nProfile updated successfully!", "green"))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 # -----------------------------------------------------------------------------------------------------------------------------------
     
     def run(self):
@@ -228,8 +174,9 @@ class Employee:
                 print(colored("\nInvalid choice! Please try again.", "red"))
                 
 # Login and menu loop
-while True:
-    employee = Employee.login()
-    if employee:
-        employee.run()
-        break
\ No newline at end of file
+if __name__ == "__main__":
+    while True:
+        employee = Employee.login()
+        if employee:
+            employee.run()
+            break
@@ -1,30 +1,33 @@
-import sqlite3
+import database
+import services
 import os
 from tabulate import tabulate
 from termcolor import colored
-from datetime import date
-import matplotlib.pyplot as plt
+import charts
+import attendance_reports
+import salary_analytics
+import salary_revision
+import payroll
+import validators
+import bulk_import
+import picker
+import leave_export
+import leave_calendar
 
 
 class HR:
     def __init__(self, hr_id, name):
         self.hr_id = hr_id
         self.name = name
-        self.db = 'ems_data.db'
+        self.db = database.DB_PATH
 
     @staticmethod
     def login():
-        conn = sqlite3.connect('ems_data.db')
-        cursor = conn.cursor()
-
         print(colored("\nHR Login", "cyan", attrs=['bold']))
         hr_id = input("Enter your HR ID: ").strip()
         password = input("Enter your Password: ").strip()
 
-        cursor.execute("SELECT hr_id, name FROM HR WHERE hr_id = ? AND password = ?", (hr_id, password))
-        user = cursor.fetchone()
-
-        conn.close()
+        user = services.authenticate_hr(hr_id, password)
 
         if user:
             print(colored(f"\nLogin successful! Welcome, {user[1]}.", "green", attrs=['bold']))
@@ -54,7 +57,8 @@ class HR:
             ["2", "Delete Employee"],
             ["3", "Update Employee"],
             ["4", "Search Employee"],
-            ["5", "Back to Main Menu"]
+            ["5", "Bulk Import Employees (CSV/JSONL)"],
+            ["6", "Back to Main Menu"]
         ]
         print(colored("\nManage Employees", "green", attrs=['bold']))
         print(tabulate(options, headers=[colored("Option", "cyan"), colored("Action", "yellow")], tablefmt="double_grid"))
@@ -69,27 +73,21 @@ class HR:
         elif choice == "4":
             self.search_employee()
         elif choice == "5":
+            self.bulk_import_employees()
+        elif choice == "6":
             return
         else:
             print(colored("\nInvalid choice!", "red"))
 
     def add_employee(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        departments = {
-            "IT": ["Software Engineer", "Data Analyst", "System Admin", "Backend Developer", "QA Engineer"],
-            "Finance": ["Accountant", "Financial Analyst", "Auditor", "Finance Manager"],
-            "Marketing": ["Marketing Executive", "SEO Specialist", "Content Strategist", "Brand Manager"],
-            "Operations": ["Operations Manager", "Logistics Coordinator", "Inventory Manager", "Supply Chain Analyst"]
-        }
+        departments = validators.DEPARTMENTS
 
         print(colored("\nAdd New Employee", "cyan", attrs=['bold']))
 
         # Name validation: at least 5 letters, no digits or special characters
         while True:
             name = input("Enter Name : ").strip()
-            if len(name) >= 5 and all(char.isalpha() or char.isspace() for char in name):
+            if validators.valid_name(name):
                 break
             print(colored("Invalid Name! Please enter at least 5 characters with only letters and spaces.", "red"))
 
@@ -97,21 +95,21 @@ class HR:
         # Password validation: at least 4 characters
         while True:
             password = input("Enter Password : ").strip()
-            if len(password) >= 4:
+            if validators.valid_password(password):
                 break
             print(colored("Invalid Password! Please enter at least 4 characters.", "red"))
 
         # Age validation: numeric only
         while True:
             age = input("Enter Age : ").strip()
-            if age.isdigit() and int(age) > 0:
+            if validators.valid_age(age):
                 break
             print(colored("Invalid Age! Please enter a positive number.", "red"))
 
         # Gender validation: Male/Female only
         while True:
             gender = input("Enter Gender (Male/Female): ").strip().capitalize()
-            if gender in ["Male", "Female"]:
+            if validators.valid_gender(gender):
                 break
             print(colored("Invalid Gender! Please enter Male or Female.", "red"))
 
@@ -125,7 +123,7 @@ class HR:
         # Department validation
         while True:
             department = input("\nSelect a Department: ").strip()
-            if department in departments:
+            if validators.valid_department(department):
                 break
             print(colored("Invalid Department! Please select from the available options.", "red"))
 
@@ -136,97 +134,60 @@ class HR:
         # Position validation
         while True:
             position = input("\nSelect a Position: ").strip()
-            if position in departments[department]:
+            if validators.valid_position(department, position):
                 break
             print(colored("Invalid Position! Please select from the available options.", "red"))
 
         # Salary validation: positive number only
         while True:
             salary = input("Enter Salary (positive number): ").strip()
-            if salary.isdigit() and int(salary) > 0:
+            if validators.valid_salary(salary):
                 break
             print(colored("Invalid Salary! Please enter a positive number.", "red"))
 
         # Email validation: must contain "@" and "."
         while True:
             email = input("Enter Email: ").strip()
-            if "@" in email and "." in email and email.index("@") < email.index("."):
+            if validators.valid_email(email):
                 break
             print(colored("Invalid Email! Please enter a valid email address.", "red"))
 
         # Contact number validation: exactly 10 digits
         while True:
             contactnumber = input("Enter Contact Number (10 digits): ").strip()
-            if contactnumber.isdigit() and len(contactnumber) == 10:
+            if validators.valid_contact(contactnumber):
                 break
             print(colored("Invalid Contact Number! Please enter exactly 10 digits.", "red"))
 
-        # Joining date
-        joining_date = str(date.today())
-
         # Degree input
         degree = input("Enter Degree: ").strip()
 
         # Database insertion
         try:
-            cursor.execute("""
-                INSERT INTO Employee (name, password, age, gender, address, department, position, salary, email, contactnumber, joining_date, degree)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (name, password, age, gender, address, department, position, salary, email, contactnumber, joining_date, degree))
-            conn.commit()
+            services.add_employee(name, password, age, gender, address, department, position, salary, email, contactnumber,
+                                  degree, db=self.db)
             print(colored("\nEmployee added successfully!", "green"))
-        except sqlite3.IntegrityError:
-            print(colored("\nError: Email or contact number already exists!", "red"))
-
-        conn.close()
+        except services.ServiceError as e:
+            print(colored(f"\nError: {e}", "red"))
 
     def delete_employee(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
+        emp_id = picker.pick_employee(self.db, "Enter the Employee ID to delete", "Current Employees:")
+        if emp_id is None:
             return
 
-        print(colored("\nCurrent Employees:", "green"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        emp_id = input("\nEnter the Employee ID to delete: ").strip()
-        cursor.execute("SELECT * FROM Employee WHERE emp_id = ?", (emp_id,))
-        if not cursor.fetchone():
-            print(colored("\nInvalid Employee ID!", "red"))
-        else:
-            cursor.execute("DELETE FROM Employee WHERE emp_id = ?", (emp_id,))
-            conn.commit()
+        try:
+            services.delete_employee(emp_id, db=self.db)
             print(colored("\nEmployee deleted successfully!", "green"))
-
-        conn.close()
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 
     def update_employee(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        # Fetch and display current employees
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
-            return
-
-        print(colored("\nCurrent Employees:", "green"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        # Keep asking for valid emp_id until found
+        # Page through current employees, asking until a valid emp_id is found
         while True:
-            emp_id = input("\nEnter the Employee ID to update: ").strip()
-            cursor.execute("SELECT * FROM Employee WHERE emp_id = ?", (emp_id,))
-            if cursor.fetchone():
+            emp_id = picker.pick_employee(self.db, "Enter the Employee ID to update", "Current Employees:")
+            if emp_id is None:
+                return
+            if services.employee_exists(emp_id, self.db):
                 break
             print(colored("Invalid Employee ID! Please enter a valid one.", "red"))
 
@@ -235,28 +196,28 @@ class HR:
         # Password validation: at least 4 characters or empty to skip
         while True:
             password = input("Enter new Password (at least 4 characters): ").strip()
-            if not password or len(password) >= 4:
+            if not password or validators.valid_password(password):
                 break
             print(colored("Invalid Password! Please enter at least 4 characters.", "red"))
 
         # Age validation: numeric only or empty to skip
         while True:
             age = input("Enter new Age (numeric only): ").strip()
-            if not age or (age.isdigit() and int(age) > 0):
+            if not age or validators.valid_age(age):
                 break
             print(colored("Invalid Age! Please enter a positive number.", "red"))
 
         # Email validation: must contain '@' and '.' or empty to skip
         while True:
             email = input("Enter new Email: ").strip()
-            if not email or ("@" in email and "." in email and email.index("@") < email.index(".")):
+            if not email or validators.valid_email(email):
                 break
             print(colored("Invalid Email! Please enter a valid email address.", "red"))
 
         # Contact number validation: exactly 10 digits or empty to skip
         while True:
             contactnumber = input("Enter new Contact Number (10 digits): ").strip()
-            if not contactnumber or (contactnumber.isdigit() and len(contactnumber) == 10):
+            if not contactnumber or validators.valid_contact(contactnumber):
                 break
             print(colored("Invalid Contact Number! Please enter exactly 10 digits.", "red"))
 
@@ -273,46 +234,52 @@ class HR:
 
         # Update query
         if updates:
-            query = "UPDATE Employee SET " + ", ".join(f"{col} = ?" for col in updates.keys()) + " WHERE emp_id = ?"
-            values = list(updates.values()) + [emp_id]
             try:
-                cursor.execute(query, values)
-                conn.commit()
+                services.update_employee(emp_id, db=self.db, **updates)
                 print(colored("\nEmployee details updated successfully!", "green"))
-            except sqlite3.IntegrityError:
-                print(colored("\nError: Email or contact number already exists!", "red"))
+            except services.ServiceError as e:
+                print(colored(f"\nError: {e}", "red"))
         else:
             print(colored("\nNo updates made.", "yellow"))
 
-        conn.close()
+    def bulk_import_employees(self):
+        print(colored("\nBulk Import Employees", "cyan", attrs=['bold']))
+        print("Columns: " + ", ".join(bulk_import.FIELDS))
 
-    def search_employee(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
+        path = input("Enter path to CSV or JSONL file: ").strip()
+        if not os.path.isfile(path):
+            print(colored("\nFile not found!", "red"))
+            return
 
+        result = bulk_import.import_employees(path, self.db)
+        print(tabulate([[result["read"], result["imported"], result["rejected"]]],
+                       headers=["Rows Read", "Imported", "Rejected"], tablefmt="double_grid"))
+        if result["error_report"]:
+            print(colored(f"\nRejected rows written to {result['error_report']}", "yellow"))
+        else:
+            print(colored("\nAll employees imported successfully!", "green"))
+
+    def search_employee(self):
         print(colored("\nSearch Employee", "cyan"))
-        search_by = input("Search by (1: ID, 2: Name): ").strip()
+        search_by = input("Search by (1: ID, 2: Name/Email/Department/Position/Address): ").strip()
 
         if search_by == "1":
             emp_id = input("Enter Employee ID: ").strip()
-            cursor.execute("SELECT * FROM Employee WHERE emp_id = ?", (emp_id,))
+            employee = services.get_employee(emp_id, self.db)
+            result = [employee] if employee else []
         elif search_by == "2":
-            name = input("Enter Employee Name: ").strip()
-            cursor.execute("SELECT * FROM Employee WHERE name LIKE ?", ('%' + name + '%',))
+            text = input("Enter search text (prefixes work, e.g. 'ami sha'): ").strip()
+            result = services.search_employees(text, self.db)
         else:
             print(colored("\nInvalid choice!", "red"))
-            conn.close()
             return
 
-        result = cursor.fetchall()
         if result:
             print(colored("\nEmployee Details:", "green"))
             print(tabulate(result, headers=["ID", "Name", "Password", "Age", "Gender", "Address", "Dept", "Position", "Salary", "Email", "Contact", "Join Date", "Degree"], tablefmt="double_grid"))
         else:
             print(colored("\nNo employee found!", "red"))
 
-        conn.close()
-
 
 
 # -----------------------------------------------------------------------------------------------------------------------------------
@@ -323,7 +290,9 @@ class HR:
         options = [
             ["1", "Approve/Reject Leave Requests"],
             ["2", "View Leave History"],
-            ["3", "Back to Main Menu"]
+            ["3", "Export All Leave Histories"],
+            ["4", "Team Availability Calendar"],
+            ["5", "Back to Main Menu"]
         ]
         print(colored("\nManage Leaves of Employees", "green", attrs=['bold']))
         print(tabulate(options, headers=[colored("Option", "cyan"), colored("Action", "yellow")], tablefmt="double_grid"))
@@ -334,86 +303,69 @@ class HR:
         elif choice == "2":
             self.view_leave_history()
         elif choice == "3":
+            self.export_leave_histories()
+        elif choice == "4":
+            leave_calendar.show_calendar(self.db)
+        elif choice == "5":
             return
         else:
             print(colored("\nInvalid choice!", "red"))
 
     def approve_or_reject_leave(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         # Show pending leaves
-        cursor.execute("""
-            SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
-            FROM Leaves L
-            JOIN Employee E ON L.emp_id = E.emp_id
-            WHERE L.status = 'PENDING'
-        """)
-        pending_leaves = cursor.fetchall()
+        pending_leaves = services.pending_leaves(self.db)
 
         if not pending_leaves:
             print(colored("\nNo pending leave requests.", "red"))
-            conn.close()
             return  # Exit if no pending leaves
 
         print(colored("\nPending Leave Requests:", "green"))
         print(tabulate(pending_leaves, headers=["Leave ID", "Employee Name", "Leave Type", "Start Date", "End Date", "Status"], tablefmt="double_grid"))
 
-        # Get Leave ID
-        leave_id = input("\nEnter the Leave ID to process: ").strip()
-        cursor.execute("SELECT leave_id FROM Leaves WHERE leave_id = ? AND status = 'PENDING'", (leave_id,))
-        if not cursor.fetchone():
-            print(colored("\nInvalid Leave ID or Leave is not pending.", "red"))
-            conn.close()
-            return
+        # Select leaves: IDs and ranges, or filters
+        print(colored("Enter Leave IDs and ranges (e.g. 12, 15-20), or 'f' to select by department, leave type or dates.", "cyan"))
+        choice = input("\nLeave IDs to process: ").strip()
+
+        selection = {}
+        if choice.lower() == "f":
+            selection["department"] = input("Department (Enter for all): ").strip() or None
+            selection["leave_type"] = input("Leave Type (Enter for all): ").strip() or None
+            selection["start_date"] = input("Leaves overlapping from (YYYY-MM-DD, Enter for any): ").strip() or None
+            selection["end_date"] = input("Leaves overlapping until (YYYY-MM-DD, Enter for any): ").strip() or None
+        else:
+            try:
+                selection["ids"], selection["ranges"] = services.parse_selection(choice)
+            except services.ServiceError as e:
+                print(colored(f"\n{e}", "red"))
+                return
+            if not selection["ids"] and not selection["ranges"]:
+                print(colored("\nNo Leave IDs entered.", "red"))
+                return
 
         # Approve or Reject
-        decision = input("Approve or Reject the leave? (A/R): ").strip().upper()
+        decision = input("Approve or Reject the selected leaves? (A/R): ").strip().upper()
         if decision not in ["A", "R"]:
             print(colored("\nInvalid choice! Enter 'A' for Approve or 'R' for Reject.", "red"))
-            conn.close()
             return
 
-        new_status = "APPROVED" if decision == "A" else "REJECTED"
-        cursor.execute("UPDATE Leaves SET status = ? WHERE leave_id = ?", (new_status, leave_id))
-        conn.commit()
-        print(colored(f"\nLeave request {new_status} successfully!", "green"))
-
-        conn.close()
+        result = services.decide_leaves(decision == "A", db=self.db, **selection)
+        print(colored(f"\n{result['processed']} leave request(s) {result['status']} successfully!",
+                      "green" if result["processed"] else "yellow"))
+        print(tabulate([[result["processed"], result["skipped"], result["already_decided"]]],
+                       headers=["Processed", "Skipped", "Already Decided"], tablefmt="double_grid"))
 
     def view_leave_history(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        # Display available employees with IDs
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
+        # Page through available employees and get a valid Employee ID
+        emp_id = picker.pick_employee(self.db, "Enter Employee ID to view leave history")
+        if emp_id is None:
             return
 
-        print(colored("\nAvailable Employees:", "cyan"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        # Get valid Employee ID
-        emp_ids = [str(emp[0]) for emp in employees]
-        emp_id = input("\nEnter Employee ID to view leave history: ").strip()
-
-        if emp_id not in emp_ids:
+        if not services.employee_exists(emp_id, self.db):
             print(colored("\nInvalid Employee ID! Please select from the list above.", "red"))
-            conn.close()
             return
 
         # Fetch leave history
-        cursor.execute("""
-            SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
-            FROM Leaves L
-            JOIN Employee E ON L.emp_id = E.emp_id
-            WHERE L.emp_id = ?
-        """, (emp_id,))
-        leave_history = cursor.fetchall()
+        leave_history = services.leave_history(emp_id, self.db)
 
         # Display leave history
         if leave_history:
@@ -430,7 +382,20 @@ class HR:
         else:
             print(colored("\nNo leave history found for the given Employee ID.", "red"))
 
-        conn.close()
+    def export_leave_histories(self):
+        print(colored("\nExport All Leave Histories", "cyan", attrs=['bold']))
+        fmt = input("Format (csv/jsonl, Enter for csv): ").strip().lower() or "csv"
+        if fmt not in leave_export.FORMATS:
+            print(colored("\nInvalid format!", "red"))
+            return
+        per_employee = input("One file per employee? (yes/no): ").strip().lower() == "yes"
+        compress = input("Compress with gzip? (yes/no): ").strip().lower() == "yes"
+
+        default = leave_export.default_path(fmt, per_employee, compress)
+        path = input(f"Output {'directory' if per_employee else 'file'} (Enter for {default}): ").strip() or default
+
+        result = leave_export.export_leaves(path, fmt, per_employee, compress, self.db)
+        print(colored(f"\nExported {result['rows']} leaves for {result['employees']} employees to {result['path']}", "green"))
 
 # -----------------------------------------------------------------------------------------------------------------------------------
 
@@ -440,7 +405,9 @@ class HR:
         options = [
             ["1", "View Employee Salary"],
             ["2", "Update Employee Salary"],
-            ["3", "Back to Main Menu"]
+            ["3", "Bulk Salary Revision"],
+            ["4", "Run Monthly Payroll"],
+            ["5", "Back to Main Menu"]
         ]
         print(colored("\nManage Salaries of Employees", "green", attrs=['bold']))
         print(tabulate(options, headers=[colored("Option", "cyan"), colored("Action", "yellow")], tablefmt="double_grid"))
@@ -451,99 +418,66 @@ class HR:
         elif choice == "2":
             self.update_salary()
         elif choice == "3":
+            salary_revision.run_revision_menu(self.name, self.db)
+        elif choice == "4":
+            month = input(f"Enter month (YYYY-MM, Enter for {payroll.previous_month()}): ").strip() or payroll.previous_month()
+            payroll.show_payroll(month, self.db)
+        elif choice == "5":
             return
         else:
             print(colored("\nInvalid choice!", "red"))
 
     # View Employee Salary
     def view_salary(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        # Show all employee IDs and names
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
+        # Page through employee IDs and names, then ask for the Employee ID to view salary
+        emp_id = picker.pick_employee(self.db, "Enter Employee ID to view salary")
+        if emp_id is None:
             return
 
-        print(colored("\nAvailable Employees:", "green"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        # Ask for Employee ID to view salary
-        emp_id = input("\nEnter Employee ID to view salary: ").strip()
-
-        # Fetch salary for the chosen employee
-        cursor.execute("SELECT emp_id, name, salary FROM Employee WHERE emp_id = ?", (emp_id,))
-        employee = cursor.fetchone()
-
-        if employee:
-            print(colored(f"\nSalary Details for {employee[1]}:", "green"))
-            print(tabulate([employee], headers=["Employee ID", "Name", "Salary"], tablefmt="double_grid"))
+        name = services.employee_name(emp_id, self.db)
+        if name:
+            print(colored(f"\nSalary Details for {name}:", "green"))
+            print(tabulate([[emp_id, name, services.get_salary(emp_id, self.db)]],
+                           headers=["Employee ID", "Name", "Salary"], tablefmt="double_grid"))
         else:
             print(colored("\nInvalid Employee ID!", "red"))
 
-        conn.close()
-
     # Update Employee Salary
     def update_salary(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        # Show all employee IDs and names
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
+        # Page through employee IDs and names, then ask for the Employee ID to update salary
+        emp_id = picker.pick_employee(self.db, "Enter Employee ID to update salary")
+        if emp_id is None:
             return
 
-        print(colored("\nAvailable Employees:", "green"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        # Ask for Employee ID to update salary
-        emp_id = input("\nEnter Employee ID to update salary: ").strip()
-
-        # Fetch current salary
-        cursor.execute("SELECT emp_id, name, salary FROM Employee WHERE emp_id = ?", (emp_id,))
-        employee = cursor.fetchone()
-
-        if not employee:
+        name = services.employee_name(emp_id, self.db)
+        if not name:
             print(colored("\nInvalid Employee ID!", "red"))
-            conn.close()
             return
 
-        print(colored(f"\nCurrent Salary Details for {employee[1]}:", "cyan"))
-        print(tabulate([employee], headers=["Employee ID", "Name", "Current Salary"], tablefmt="double_grid"))
+        print(colored(f"\nCurrent Salary Details for {name}:", "cyan"))
+        print(tabulate([[emp_id, name, services.get_salary(emp_id, self.db)]],
+                       headers=["Employee ID", "Name", "Current Salary"], tablefmt="double_grid"))
 
         # Ask for new salary
         new_salary = input("\nEnter new salary: ").strip()
-        if not new_salary.isdigit() or int(new_salary) <= 0:
-            print(colored("\nInvalid salary amount! Please enter a positive number.", "red"))
-            conn.close()
-            return
-
-        # Update salary in Employee table
-        cursor.execute("UPDATE Employee SET salary = ? WHERE emp_id = ?", (new_salary, emp_id))
-        conn.commit()
-        print(colored(f"\nSalary updated successfully to {new_salary}!", "green"))
-
-        conn.close()
+        try:
+            new_salary = services.set_salary(emp_id, new_salary, self.db, changed_by=self.name)
+            print(colored(f"\nSalary updated successfully to {new_salary}!", "green"))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 
     def generate_salary_report(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
+        print(colored("\n1) Department Salary Report", "cyan"))
+        print(colored("2) Salary Analytics (all departments and positions)", "cyan"))
+        if input("Enter your choice (1/2): ").strip() == "2":
+            salary_analytics.show_salary_report(self.db)
+            return
 
         # Get distinct departments
-        cursor.execute("SELECT DISTINCT department FROM Employee LIMIT 5")
-        departments = cursor.fetchall()
+        departments = services.list_departments(db=self.db)
 
         if not departments:
             print(colored("\nNo departments found.", "red"))
-            conn.close()
             return
 
         # Display departments
@@ -554,30 +488,17 @@ class HR:
         selected_department = input("\nEnter the department to generate the salary report: ").strip()
 
         # Calculate total salary by department
-        cursor.execute("""
-            SELECT department, SUM(salary)
-            FROM Employee
-            WHERE department = ?
-            GROUP BY department
-        """, (selected_department,))
-        result = cursor.fetchone()
-
-        if not result:
+        total = services.department_salary_total(selected_department, self.db)
+
+        if total is None:
             print(colored(f"\nNo salary data found for department: {selected_department}", "red"))
-            conn.close()
             return
 
         # Plotting the salary report
-        departments = [result[0]]
-        salaries = [result[1]]
-
-        plt.bar(departments, salaries, color='skyblue')
-        plt.title(f'Salary Report for {selected_department}')
-        plt.xlabel('Department')
-        plt.ylabel('Total Salary (INR)')
-        plt.show()
-
-        conn.close()
+        chart = charts.bar_chart(f'salary_report_{selected_department}', [selected_department], [total],
+                                 f'Salary Report for {selected_department}', 'Department', 'Total Salary (INR)')
+        if chart:
+            print(colored(f"\nChart saved to {chart}", "green"))
 # -----------------------------------------------------------------------------------------------------------------------------------
 
 # -----------------------------------------------------------------------------------------------------------------------------------
@@ -585,53 +506,41 @@ class HR:
         # --------- Employee Rating --------- #
 
     def employee_rating(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        # Fetch employees
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
+        # Page through employees
+        emp_id = picker.pick_employee(self.db, "Enter Employee ID to rate")
+        if emp_id is None:
             return
 
-        print(colored("\nAvailable Employees:", "green"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        emp_id = input("\nEnter Employee ID to rate: ").strip()
-
         # Validate employee ID
-        cursor.execute("SELECT emp_id FROM Employee WHERE emp_id = ?", (emp_id,))
-        if not cursor.fetchone():
+        if not services.employee_exists(emp_id, self.db):
             print(colored("\nInvalid Employee ID!", "red"))
-            conn.close()
             return
 
         rating = input("Enter Rating (1-5): ").strip()
         if rating not in ["1", "2", "3", "4", "5"]:
             print(colored("\nInvalid rating! Please enter a value between 1-5.", "red"))
-            conn.close()
             return
 
         comments = input("Enter Comments: ").strip()
 
-        # Insert into Employee_performance table
-        cursor.execute("""
-            INSERT INTO Employee_performance (employee_id, ratedbyhr_name, rating, comments)
-            VALUES (?, ?, ?, ?)
-        """, (emp_id, self.name, rating, comments))
-        conn.commit()
-        conn.close()
-
-        print(colored("\nEmployee rating submitted successfully!", "green"))
+        try:
+            services.rate_employee(emp_id, self.name, rating, comments, self.db)
+            print(colored("\nEmployee rating submitted successfully!", "green"))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def employee_attendance_report(self):
-        conn = sqlite3.connect(self.db)
+        conn = database.connect(self.db)
         cursor = conn.cursor()
 
+        print(colored("\n1) Single Day Report", "cyan"))
+        print(colored("2) Date Range Report (weekly/monthly/quarterly, per employee or department)", "cyan"))
+        if input("Enter your choice (1/2): ").strip() == "2":
+            attendance_reports.range_report(conn)
+            conn.close()
+            return
+
         # Ask for the date to filter attendance records
         while True:
             date = input("\nEnter the date to view attendance (YYYY-MM-DD): ").strip()
@@ -640,13 +549,7 @@ class HR:
                 continue
             
             # Check if records exist for the entered date
-            cursor.execute("""
-                SELECT emp_id, SUM(total_work_hours)
-                FROM Employee_Attendance
-                WHERE date = ?
-                GROUP BY emp_id
-            """, (date,))
-            attendance_data = cursor.fetchall()
+            attendance_data = services.attendance_for_date(date, self.db)
 
             if attendance_data:
                 break
@@ -662,14 +565,10 @@ class HR:
         work_hours = [row[1] for row in attendance_data]
 
         # Plotting the bar chart
-        plt.figure(figsize=(10, 6))
-        plt.bar(emp_ids, work_hours, color='skyblue')
-        plt.title(f'Employee Attendance Report - {date}')
-        plt.xlabel('Employee ID')
-        plt.ylabel('Total Working Hours')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
+        chart = charts.bar_chart(f'attendance_report_{date}', emp_ids, work_hours, f'Employee Attendance Report - {date}',
+                                 'Employee ID', 'Total Working Hours', rotation=45, figsize=(10, 6))
+        if chart:
+            print(colored(f"\nChart saved to {chart}", "green"))
 
         conn.close()
 # -----------------------------------------------------------------------------------------------------------------------------------
@@ -699,8 +598,9 @@ class HR:
                 print(colored("\nInvalid choice! Please try again.", "red"))
 
 # Login and menu loop
-while True:
-    hr = HR.login()
-    if hr:
-        hr.run()
-        break
\ No newline at end of file
+if __name__ == "__main__":
+    while True:
+        hr = HR.login()
+        if hr:
+            hr.run()
+            break
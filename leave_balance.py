@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+from tabulate import tabulate
+
+import database
+
+# Leave balances per employee, leave type and year. Leave_Balance holds used (approved) and
+# pending days and is kept current by triggers on Leaves, so a balance is one primary-key
+# lookup; Leave_Entitlement holds the annual days per type. Leaves are counted in calendar
+# days, and one that crosses a year end counts towards both years; a leave may span at most
+# two calendar years, so the triggers' start-year/end-year split covers every leave.
+#
+#   python3 leave_balance.py show EMP_ID [--year 2026]
+#   python3 leave_balance.py entitlements [--set "Sick Leave=12"]
+#   python3 leave_balance.py rebuild
+
+HEADERS = ["Leave Type", "Entitlement", "Used", "Pending", "Available"]
+
+
+def days_by_year(start, end):
+    # {year: calendar days of [start, end] in that year}
+    days = {}
+    while start <= end:
+        year_end = min(end, date(start.year, 12, 31))
+        days[start.year] = (year_end - start).days + 1
+        start = year_end + timedelta(days=1)
+    return days
+
+
+def available_days(conn, emp_id, leave_type, year):
+    # Entitlement minus used and pending days, or None when the type has no entitlement (unlimited)
+    entitlement = conn.execute("SELECT days FROM Leave_Entitlement WHERE leavetype = ?", (leave_type,)).fetchone()
+    if entitlement is None:
+        return None
+    taken = conn.execute(
+        "SELECT used_days + pending_days FROM Leave_Balance WHERE emp_id = ? AND leavetype = ? AND year = ?",
+        (emp_id, leave_type, year)
+    ).fetchone()
+    return entitlement[0] - (taken[0] if taken else 0)
+
+
+def balances(conn, emp_id, year):
+    # One row per leave type with an entitlement: [type, entitlement, used, pending, available]
+    return [list(row) for row in conn.execute("""
+        SELECT E.leavetype, E.days, COALESCE(B.used_days, 0), COALESCE(B.pending_days, 0),
+               E.days - COALESCE(B.used_days, 0) - COALESCE(B.pending_days, 0)
+        FROM Leave_Entitlement E
+        LEFT JOIN Leave_Balance B ON B.emp_id = ? AND B.leavetype = E.leavetype AND B.year = ?
+        ORDER BY E.leavetype
+    """, (emp_id, year))]
+
+
+def entitlements(conn):
+    return conn.execute("SELECT leavetype, days FROM Leave_Entitlement ORDER BY leavetype").fetchall()
+
+
+def set_entitlement(conn, leave_type, days):
+    conn.execute("""
+        INSERT INTO Leave_Entitlement (leavetype, days) VALUES (?, ?)
+        ON CONFLICT (leavetype) DO UPDATE SET days = excluded.days
+    """, (leave_type, days))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Leave balances, entitlements and ledger rebuild")
+    parser.add_argument("command", choices=["show", "entitlements", "rebuild"])
+    parser.add_argument("emp_id", nargs="?", type=int)
+    parser.add_argument("--year", type=int, default=date.today().year)
+    parser.add_argument("--set", action="append", default=[], metavar="TYPE=DAYS", help="Change an annual entitlement")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        database.run_in_transaction(database.rebuild_leave_balances, args.db)
+        print("Leave balances rebuilt.")
+    elif args.command == "entitlements":
+        for change in args.set:
+            leave_type, _, days = change.partition("=")
+            if not days.strip().isdigit():
+                parser.error(f"--set expects TYPE=DAYS, got {change!r}")
+            database.run_in_transaction(lambda conn: set_entitlement(conn, leave_type.strip(), int(days)), args.db)
+        with database.transaction(args.db) as conn:
+            print(tabulate(entitlements(conn), headers=["Leave Type", "Days per Year"], tablefmt="double_grid"))
+    else:
+        if args.emp_id is None:
+            parser.error("show needs an EMP_ID")
+        with database.transaction(args.db) as conn:
+            rows = balances(conn, args.emp_id, args.year)
+        print(f"Leave balance of employee {args.emp_id} for {args.year}")
+        print(tabulate(rows, headers=HEADERS, tablefmt="double_grid"))
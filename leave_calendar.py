@@ -0,0 +1,136 @@
+import json
+from datetime import date, timedelta
+from operator import itemgetter
+
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+
+# Team availability: who is off on each day of a date range, from APPROVED leaves. One query
+# reads the leaves overlapping the range straight from idx_leaves_status_end, and a single
+# sweep walks the days alongside the leaves sorted by first and by last day off, so the cost
+# grows with the leaves found rather than leaves x days. Names and the department filter come
+# from one read of just the employees on leave instead of a join per leave.
+#
+#   python3 leave_calendar.py 2026-10-01 2026-12-31 [--department IT] [--names] [--db ems_data.db]
+
+SHOWN_NAMES = 8
+
+
+def load_absences(conn, start, end):
+    # (emp_id, first day off, last day off) of each approved leave overlapping [start, end],
+    # clipped to the range; dates are ISO strings so they sort and compare as text
+    return conn.execute("""
+        SELECT emp_id, MAX(startdate, ?), MIN(enddate, ?)
+        FROM Leaves
+        WHERE status = 'APPROVED' AND enddate >= ? AND startdate <= ? AND startdate <= enddate
+    """, (start, end, start, end)).fetchall()
+
+
+def employee_names(conn, emp_ids, department=None):
+    # {emp_id: name} for just the given employees (those in department, if set): one primary
+    # key probe each, driven by the id list
+    query = """
+        SELECT E.emp_id, E.name
+        FROM json_each(?) J
+        CROSS JOIN Employee E ON E.emp_id = J.value
+    """ + ("WHERE E.department = ?" if department else "")
+    return dict(conn.execute(query, [json.dumps(sorted(emp_ids))] + ([department] if department else [])))
+
+
+def absence_calendar(conn, start, end, department=None, names=True):
+    # [(day, absent count, sorted names or None)] for every day of [start, end], dates as
+    # "YYYY-MM-DD". Someone with two overlapping approved leaves is counted once
+    first, last = date.fromisoformat(start), date.fromisoformat(end)
+    leaves = load_absences(conn, first.isoformat(), last.isoformat())
+    people = employee_names(conn, {leave[0] for leave in leaves}, department) if names or department else None
+    if department:
+        leaves = [leave for leave in leaves if leave[0] in people]
+    starts = sorted(leaves, key=itemgetter(1))
+    ends = sorted(leaves, key=itemgetter(2))
+
+    calendar = []
+    absent = {}  # emp_id -> leaves covering the current day
+    started = ended = 0
+    for offset in range((last - first).days + 1):
+        day = (first + timedelta(days=offset)).isoformat()
+        while started < len(starts) and starts[started][1] <= day:
+            emp_id = starts[started][0]
+            absent[emp_id] = absent.get(emp_id, 0) + 1
+            started += 1
+        while ended < len(ends) and ends[ended][2] < day:
+            emp_id = ends[ended][0]
+            if absent[emp_id] == 1:
+                del absent[emp_id]
+            else:
+                absent[emp_id] -= 1
+            ended += 1
+        calendar.append((day, len(absent), sorted(people.get(emp_id, "") for emp_id in absent) if names else None))
+    return calendar
+
+
+def parse_range(start, end):
+    # Validated ISO (start, end), or None
+    try:
+        first, last = date.fromisoformat(start), date.fromisoformat(end)
+    except (TypeError, ValueError):
+        return None
+    return (first.isoformat(), last.isoformat()) if first <= last else None
+
+
+def calendar_rows(calendar):
+    # Table rows for the menus and the CLI, with long name lists cut short
+    rows = []
+    for day, count, names in calendar:
+        row = [day, date.fromisoformat(day).strftime("%a"), count]
+        if names is not None:
+            shown = ", ".join(names[:SHOWN_NAMES])
+            row.append(shown + (f" (+{len(names) - SHOWN_NAMES} more)" if len(names) > SHOWN_NAMES else ""))
+        rows.append(row)
+    return rows
+
+
+def show_calendar(db=database.DB_PATH):
+    # Interactive team availability calendar used by the HR and Manager menus
+    print(colored("\nTeam Availability Calendar", "cyan", attrs=['bold']))
+    dates = parse_range(input("Start date (YYYY-MM-DD): ").strip(), input("End date (YYYY-MM-DD): ").strip())
+    if not dates:
+        print(colored("\nInvalid date range! Use YYYY-MM-DD with the start on or before the end.", "red"))
+        return
+    department = input("Department (Enter for all): ").strip() or None
+
+    conn = database.connect(db)
+    try:
+        calendar = absence_calendar(conn, *dates, department)
+    finally:
+        conn.close()
+
+    if not any(count for _, count, _ in calendar):
+        print(colored("\nNobody is on approved leave in that range.", "yellow"))
+        return
+    print(colored(f"\nApproved leaves, {dates[0]} to {dates[1]}" + (f" ({department})" if department else ""), "green"))
+    print(tabulate(calendar_rows(calendar), headers=["Date", "Day", "Absent", "Who"], tablefmt="double_grid"))
+    peak = max(calendar, key=lambda entry: entry[1])
+    print(colored(f"\nMost absent: {peak[1]} on {peak[0]}", "green"))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Daily absence counts from approved leaves")
+    parser.add_argument("start")
+    parser.add_argument("end")
+    parser.add_argument("--department")
+    parser.add_argument("--names", action="store_true", help="List who is off each day")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    dates = parse_range(args.start, args.end)
+    if not dates:
+        parser.error("start and end must be YYYY-MM-DD dates with start <= end")
+    conn = database.connect(args.db)
+    calendar = absence_calendar(conn, *dates, args.department, args.names)
+    conn.close()
+    headers = ["Date", "Day", "Absent"] + (["Who"] if args.names else [])
+    print(tabulate(calendar_rows(calendar), headers=headers, tablefmt="double_grid"))
@@ -0,0 +1,112 @@
+import os
+import csv
+import gzip
+import json
+
+import database
+
+BATCH_SIZE = 1000
+FORMATS = ["csv", "jsonl"]
+
+FIELDS = ["leave_id", "emp_id", "name", "department", "leavetype", "startdate", "enddate", "status"]
+
+# Ordered like idx_leaves_emp (emp_id, startdate, ...), so SQLite walks the index instead of sorting
+# the whole table; only leaves sharing an employee and start date are ordered by leave_id
+EXPORT_QUERY = """
+    SELECT L.leave_id, L.emp_id, E.name, E.department, L.leavetype, L.startdate, L.enddate, L.status
+    FROM Leaves L
+    JOIN Employee E ON E.emp_id = L.emp_id
+    ORDER BY L.emp_id, L.startdate, L.leave_id
+"""
+
+
+def iter_leaves(conn, batch_size=BATCH_SIZE):
+    # Stream every leave, employee by employee, holding at most one batch in memory
+    cursor = conn.execute(EXPORT_QUERY)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield from rows
+
+
+def open_output(path, compress=False):
+    if compress:
+        return gzip.open(path, "wt", newline="", encoding="utf-8")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+class RowWriter:
+    # Writes rows to an open file as CSV (with header) or JSONL
+    def __init__(self, file, fmt):
+        self.fmt = fmt
+        self.file = file
+        if fmt == "csv":
+            self.csv = csv.writer(file)
+            self.csv.writerow(FIELDS)
+
+    def write(self, row):
+        if self.fmt == "csv":
+            self.csv.writerow(row)
+        else:
+            self.file.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+
+
+def export_leaves(path, fmt="csv", per_employee=False, compress=False, db=database.DB_PATH):
+    # One ordered query over Leaves JOIN Employee written row by row, either to one file or
+    # to Leave_History_EmpID_<id>.<fmt>[.gz] files inside the directory `path`
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; use one of {', '.join(FORMATS)}")
+    suffix = f".{fmt}" + (".gz" if compress else "")
+
+    conn = database.connect(db)
+    rows = employees = 0
+    file = writer = None
+    current = None
+    try:
+        if per_employee:
+            os.makedirs(path, exist_ok=True)
+        else:
+            file = open_output(path, compress)
+            writer = RowWriter(file, fmt)
+
+        for row in iter_leaves(conn):
+            if row[1] != current:
+                current = row[1]
+                employees += 1
+                if per_employee:
+                    if file:
+                        file.close()
+                    file = open_output(os.path.join(path, f"Leave_History_EmpID_{current}{suffix}"), compress)
+                    writer = RowWriter(file, fmt)
+            writer.write(row)
+            rows += 1
+    finally:
+        if file:
+            file.close()
+        conn.close()
+
+    return {"rows": rows, "employees": employees, "path": path}
+
+
+def default_path(fmt, per_employee, compress):
+    if per_employee:
+        return "leave_histories"
+    return f"leave_histories.{fmt}" + (".gz" if compress else "")
+
+
+if __name__ == "__main__":
+    # python3 leave_export.py [PATH] [--format csv|jsonl] [--per-employee] [--gzip] [--db ems_data.db]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export every employee's leave history")
+    parser.add_argument("path", nargs="?", help="Output file, or directory with --per-employee")
+    parser.add_argument("--format", default="csv", choices=FORMATS)
+    parser.add_argument("--per-employee", action="store_true", help="One file per employee inside PATH")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    path = args.path or default_path(args.format, args.per_employee, args.gzip)
+    result = export_leaves(path, args.format, args.per_employee, args.gzip, args.db)
+    print(f"Exported {result['rows']} leaves for {result['employees']} employees to {result['path']}")
@@ -0,0 +1,55 @@
+from tabulate import tabulate
+
+import database
+
+# Overlapping leaves. apply_leave checks a new request against the employee's PENDING and
+# APPROVED leaves with one index seek; existing overlaps (from before the check) are found by
+# one sorted sweep over all active leaves.
+#
+#   python3 leave_overlaps.py [--db ems_data.db]   -> report existing overlapping leaves
+
+def find_overlap(conn, emp_id, start_date, end_date):
+    # First active leave of the employee overlapping [start_date, end_date], or None.
+    # idx_leaves_active_end seeks straight to leaves ending on or after start_date
+    return conn.execute("""
+        SELECT leave_id, leavetype, startdate, enddate, status
+        FROM Leaves
+        WHERE emp_id = ? AND status IN ('PENDING', 'APPROVED') AND enddate >= ? AND startdate <= ?
+        ORDER BY enddate
+        LIMIT 1
+    """, (emp_id, start_date, end_date)).fetchone()
+
+
+def existing_overlaps(conn):
+    # Pairs of active leaves of the same employee that overlap: a sweep over each employee's
+    # leaves in start order, remembering the leave that reaches furthest so far
+    pairs = []
+    current, furthest = None, None
+    for emp_id, leave_id, start, end in conn.execute("""
+        SELECT emp_id, leave_id, startdate, enddate FROM Leaves
+        WHERE status IN ('PENDING', 'APPROVED')
+        ORDER BY emp_id, startdate, enddate
+    """):
+        if emp_id != current:
+            current, furthest = emp_id, None
+        elif start <= furthest[2]:
+            pairs.append((emp_id, furthest[0], furthest[1], furthest[2], leave_id, start, end))
+        if furthest is None or end > furthest[2]:
+            furthest = (leave_id, start, end)
+    return pairs
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report overlapping PENDING/APPROVED leaves")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    conn = database.connect(args.db)
+    pairs = existing_overlaps(conn)
+    conn.close()
+    if pairs:
+        print(tabulate(pairs, headers=["Emp ID", "Leave ID", "Start", "End", "Overlapping Leave ID", "Start", "End"],
+                       tablefmt="double_grid"))
+    print(f"{len(pairs)} overlapping leave pair(s) found.")
@@ -1,27 +1,41 @@
-import os
 from tabulate import tabulate
 from termcolor import colored
 
+
+def run_role(role):
+    # Login and menu loop for the chosen role, in this process
+    while True:
+        user = role.login()
+        if user:
+            user.run()
+            break
+
+
 def main():
     options = [["1", colored("HR", "yellow")], ["2", colored("Employee", "yellow")], ["3", colored("Manager", "yellow")]]
-    
+
     while True:
         print(colored("\nWelcome to Employee Management System", "green"))
         print(tabulate(options, headers=[colored("Option", "green"), colored("Role", "green")], tablefmt="double_grid"))
-        
+
         choice = input(colored("Enter your choice (1/2/3): ", "cyan")).strip()
-        
+
+        # Role modules are imported on demand so each login only loads what it uses
         if choice == "1":
-            os.system('python3 hr.py')
+            from hr import HR
+            run_role(HR)
             break
         elif choice == "2":
-            os.system('python3 employee.py')
+            from employee import Employee
+            run_role(Employee)
             break
         elif choice == "3":
-            os.system('python3 manager.py')
+            from manager import Manager
+            run_role(Manager)
             break
         else:
             print(colored("Invalid choice! Please enter 1, 2, or 3.", "red"))
 
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,32 @@
-import sqlite3
+import database
+import services
 import os
 from tabulate import tabulate
 from termcolor import colored
-from datetime import datetime, date
-import matplotlib.pyplot as plt
+import charts
+import attendance_reports
+import salary_analytics
+import salary_revision
+import picker
+import leave_export
+import leave_calendar
+import performance
+import dashboard
 
 
 class Manager:
     def __init__(self, id, name):
         self.id = id
         self.name = name
-        self.db = 'ems_data.db'
+        self.db = database.DB_PATH
 
     @staticmethod
     def login():
-        conn = sqlite3.connect('ems_data.db')
-        cursor = conn.cursor()
-
         print(colored("\nManager Login", "cyan", attrs=['bold']))
         manager_id = input("Enter your Manager ID: ").strip()
         password = input("Enter your Password: ").strip()
 
-        cursor.execute("SELECT id, name FROM Manager WHERE id = ? AND password = ?", (manager_id, password))
-        user = cursor.fetchone()
-
-        conn.close()
+        user = services.authenticate_manager(manager_id, password)
 
         if user:
             print(colored(f"\nLogin successful! Welcome, {user[1]}", "green", attrs=['bold']))
@@ -44,6 +46,8 @@ class Manager:
             elif choice == "2":
                 self.manage_employees()
             elif choice == "3":
+                self.company_overview()
+            elif choice == "4":
                 print(colored("\nLogging out...", "cyan"))
                 break
             else:
@@ -54,12 +58,17 @@ class Manager:
         options = [
             ["1", "Manage HRs"],
             ["2", "Manage Employees"],
-            ["3", "Logout"]
+            ["3", "Company Overview"],
+            ["4", "Logout"]
         ]
         print(colored("\nManager Dashboard", "green", attrs=['bold']))
         print(tabulate(options, headers=[colored("Option", "cyan"), colored("Action", "yellow")], tablefmt="double_grid"))
 # -----------------------------------------------------------------------------------------------------------------------------------
     
+    def company_overview(self):
+        dashboard.show_dashboard(self.db)
+# -----------------------------------------------------------------------------------------------------------------------------------
+
     def manage_hrs(self):
         while True:
             options = [
@@ -86,9 +95,6 @@ class Manager:
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def add_hr(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         print(colored("\nAdd HR", "cyan"))
 
         # Name input validation
@@ -123,7 +129,6 @@ class Manager:
         while True:
             salary = input("Enter Salary: ").strip()
             if salary.isdigit():
-                salary = int(salary)
                 break
             print(colored("\nInvalid salary! Salary must be a numeric value.", "red"))
 
@@ -131,25 +136,19 @@ class Manager:
         degree = input("Enter Degree: ").strip()
 
         # Insert data into HR table
-        cursor.execute("INSERT INTO HR (name, email, password, contactnumber, salary, degree) VALUES (?, ?, ?, ?, ?, ?)",
-                    (name, email, password, contactnumber, salary, degree))
-        conn.commit()
-        conn.close()
-
-        print(colored("\nHR added successfully!", "green"))
+        try:
+            services.add_hr(name, email, password, contactnumber, salary, degree, self.db)
+            print(colored("\nHR added successfully!", "green"))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 
 
     def remove_hr(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         # Fetch and display available HRs
-        cursor.execute("SELECT hr_id, name FROM HR")
-        hrs = cursor.fetchall()
+        hrs = services.list_hrs(self.db)
 
         if not hrs:
             print(colored("\nNo HRs found.", "red"))
-            conn.close()
             return
 
         print(colored("\nHR List:", "cyan"))
@@ -159,40 +158,31 @@ class Manager:
         hr_id = input("\nEnter HR ID to remove: ").strip()
         if not hr_id.isdigit():
             print(colored("\nInvalid HR ID! Must be a numeric value.", "red"))
-            conn.close()
             return
 
-        cursor.execute("SELECT * FROM HR WHERE hr_id = ?", (hr_id,))
-        if not cursor.fetchone():
+        if not services.hr_exists(hr_id, self.db):
             print(colored("\nHR ID not found!", "red"))
-            conn.close()
             return
 
         # Confirm before deletion
         confirm = input("Are you sure you want to remove this HR? (yes/no): ").strip().lower()
         if confirm != "yes":
             print(colored("\nHR removal canceled.", "yellow"))
-            conn.close()
             return
 
-        cursor.execute("DELETE FROM HR WHERE hr_id = ?", (hr_id,))
-        conn.commit()
-        conn.close()
-
-        print(colored("\nHR removed successfully!", "green"))
+        try:
+            services.remove_hr(hr_id, self.db)
+            print(colored("\nHR removed successfully!", "green"))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
 
 
     def update_hr_details(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         # Fetch and display available HRs
-        cursor.execute("SELECT hr_id, name FROM HR")
-        hrs = cursor.fetchall()
+        hrs = services.list_hrs(self.db)
 
         if not hrs:
             print(colored("\nNo HRs found.", "red"))
-            conn.close()
             return
 
         print(colored("\nHR List:", "cyan"))
@@ -202,18 +192,14 @@ class Manager:
         hr_id = input("\nEnter HR ID to update (or 'skip' to cancel): ").strip()
         if hr_id.lower() == "skip":
             print(colored("\nNo changes made.", "yellow"))
-            conn.close()
             return
 
         if not hr_id.isdigit():
             print(colored("\nInvalid HR ID! Must be a numeric value.", "red"))
-            conn.close()
             return
 
-        cursor.execute("SELECT * FROM HR WHERE hr_id = ?", (hr_id,))
-        if not cursor.fetchone():
+        if not services.hr_exists(hr_id, self.db):
             print(colored("\nHR ID not found!", "red"))
-            conn.close()
             return
 
         # Collect updates
@@ -223,46 +209,39 @@ class Manager:
         degree = input("Enter new Degree (or 'skip' to keep unchanged): ").strip()
 
         # Prepare updates
-        updates = []
-        values = []
+        updates = {}
 
         if email.lower() != "skip":
             if "@" in email and "." in email.split("@")[-1]:
-                updates.append("email = ?")
-                values.append(email)
+                updates["email"] = email
             else:
                 print(colored("\nInvalid Email! Skipping email update.", "yellow"))
 
         if contact.lower() != "skip":
             if contact.isdigit() and len(contact) == 10:
-                updates.append("contactnumber = ?")
-                values.append(contact)
+                updates["contactnumber"] = contact
             else:
                 print(colored("\nInvalid Contact Number! Skipping contact update.", "yellow"))
 
         if salary.lower() != "skip":
             if salary.isdigit():
-                updates.append("salary = ?")
-                values.append(int(salary))
+                updates["salary"] = int(salary)
             else:
                 print(colored("\nInvalid Salary! Skipping salary update.", "yellow"))
 
         if degree.lower() != "skip":
-            updates.append("degree = ?")
-            values.append(degree)
+            updates["degree"] = degree
 
         # Update if any changes
         if updates:
-            query = f"UPDATE HR SET {', '.join(updates)} WHERE hr_id = ?"
-            values.append(hr_id)
-            cursor.execute(query, values)
-            conn.commit()
-            print(colored("\nHR details updated successfully!", "green"))
+            try:
+                services.update_hr(hr_id, self.db, **updates)
+                print(colored("\nHR details updated successfully!", "green"))
+            except services.ServiceError as e:
+                print(colored(f"\n{e}", "red"))
         else:
             print(colored("\nNo changes made.", "yellow"))
 
-        conn.close()
-
     
 # -----------------------------------------------------------------------------------------------------------------------------------
 # -----------------------------------------------------------------------------------------------------------------------------------
@@ -307,7 +286,9 @@ class Manager:
         options = [
             ["1", "Approve/Reject Leave Requests"],
             ["2", "View Leave History"],
-            ["3", "Back to Main Menu"]
+            ["3", "Export All Leave Histories"],
+            ["4", "Team Availability Calendar"],
+            ["5", "Back to Main Menu"]
         ]
         print(colored("\nManage Leaves of Employees", "green", attrs=['bold']))
         print(tabulate(options, headers=[colored("Option", "cyan"), colored("Action", "yellow")], tablefmt="double_grid"))
@@ -318,86 +299,69 @@ class Manager:
         elif choice == "2":
             self.view_leave_history()
         elif choice == "3":
+            self.export_leave_histories()
+        elif choice == "4":
+            leave_calendar.show_calendar(self.db)
+        elif choice == "5":
             return
         else:
             print(colored("\nInvalid choice!", "red"))
 
     def approve_or_reject_leave(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         # Show pending leaves
-        cursor.execute("""
-            SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
-            FROM Leaves L
-            JOIN Employee E ON L.emp_id = E.emp_id
-            WHERE L.status = 'PENDING'
-        """)
-        pending_leaves = cursor.fetchall()
+        pending_leaves = services.pending_leaves(self.db)
 
         if not pending_leaves:
             print(colored("\nNo pending leave requests.", "red"))
-            conn.close()
             return  # Exit if no pending leaves
 
         print(colored("\nPending Leave Requests:", "green"))
         print(tabulate(pending_leaves, headers=["Leave ID", "Employee Name", "Leave Type", "Start Date", "End Date", "Status"], tablefmt="double_grid"))
 
-        # Get Leave ID
-        leave_id = input("\nEnter the Leave ID to process: ").strip()
-        cursor.execute("SELECT leave_id FROM Leaves WHERE leave_id = ? AND status = 'PENDING'", (leave_id,))
-        if not cursor.fetchone():
-            print(colored("\nInvalid Leave ID or Leave is not pending.", "red"))
-            conn.close()
-            return
+        # Select leaves: IDs and ranges, or filters
+        print(colored("Enter Leave IDs and ranges (e.g. 12, 15-20), or 'f' to select by department, leave type or dates.", "cyan"))
+        choice = input("\nLeave IDs to process: ").strip()
+
+        selection = {}
+        if choice.lower() == "f":
+            selection["department"] = input("Department (Enter for all): ").strip() or None
+            selection["leave_type"] = input("Leave Type (Enter for all): ").strip() or None
+            selection["start_date"] = input("Leaves overlapping from (YYYY-MM-DD, Enter for any): ").strip() or None
+            selection["end_date"] = input("Leaves overlapping until (YYYY-MM-DD, Enter for any): ").strip() or None
+        else:
+            try:
+                selection["ids"], selection["ranges"] = services.parse_selection(choice)
+            except services.ServiceError as e:
+                print(colored(f"\n{e}", "red"))
+                return
+            if not selection["ids"] and not selection["ranges"]:
+                print(colored("\nNo Leave IDs entered.", "red"))
+                return
 
         # Approve or Reject
-        decision = input("Approve or Reject the leave? (A/R): ").strip().upper()
+        decision = input("Approve or Reject the selected leaves? (A/R): ").strip().upper()
         if decision not in ["A", "R"]:
             print(colored("\nInvalid choice! Enter 'A' for Approve or 'R' for Reject.", "red"))
-            conn.close()
             return
 
-        new_status = "APPROVED" if decision == "A" else "REJECTED"
-        cursor.execute("UPDATE Leaves SET status = ? WHERE leave_id = ?", (new_status, leave_id))
-        conn.commit()
-        print(colored(f"\nLeave request {new_status} successfully!", "green"))
-
-        conn.close()
+        result = services.decide_leaves(decision == "A", db=self.db, **selection)
+        print(colored(f"\n{result['processed']} leave request(s) {result['status']} successfully!",
+                      "green" if result["processed"] else "yellow"))
+        print(tabulate([[result["processed"], result["skipped"], result["already_decided"]]],
+                       headers=["Processed", "Skipped", "Already Decided"], tablefmt="double_grid"))
 
     def view_leave_history(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        # Display available employees with IDs
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
+        # Page through available employees and get a valid Employee ID
+        emp_id = picker.pick_employee(self.db, "Enter Employee ID to view leave history")
+        if emp_id is None:
             return
 
-        print(colored("\nAvailable Employees:", "cyan"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-        # Get valid Employee ID
-        emp_ids = [str(emp[0]) for emp in employees]
-        emp_id = input("\nEnter Employee ID to view leave history: ").strip()
-
-        if emp_id not in emp_ids:
+        if not services.employee_exists(emp_id, self.db):
             print(colored("\nInvalid Employee ID! Please select from the list above.", "red"))
-            conn.close()
             return
 
         # Fetch leave history
-        cursor.execute("""
-            SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
-            FROM Leaves L
-            JOIN Employee E ON L.emp_id = E.emp_id
-            WHERE L.emp_id = ?
-        """, (emp_id,))
-        leave_history = cursor.fetchall()
+        leave_history = services.leave_history(emp_id, self.db)
 
         # Display leave history
         if leave_history:
@@ -414,13 +378,24 @@ class Manager:
         else:
             print(colored("\nNo leave history found for the given Employee ID.", "red"))
 
-        conn.close()
+    def export_leave_histories(self):
+        print(colored("\nExport All Leave Histories", "cyan", attrs=['bold']))
+        fmt = input("Format (csv/jsonl, Enter for csv): ").strip().lower() or "csv"
+        if fmt not in leave_export.FORMATS:
+            print(colored("\nInvalid format!", "red"))
+            return
+        per_employee = input("One file per employee? (yes/no): ").strip().lower() == "yes"
+        compress = input("Compress with gzip? (yes/no): ").strip().lower() == "yes"
+
+        default = leave_export.default_path(fmt, per_employee, compress)
+        path = input(f"Output {'directory' if per_employee else 'file'} (Enter for {default}): ").strip() or default
+
+        result = leave_export.export_leaves(path, fmt, per_employee, compress, self.db)
+        print(colored(f"\nExported {result['rows']} leaves for {result['employees']} employees to {result['path']}", "green"))
+
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def manage_company_passwords(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         while True:
             print(colored("\nManage Company Passwords", "cyan"))
             print(tabulate([
@@ -434,66 +409,39 @@ class Manager:
 
             if choice == "1":
                 # Show available HRs
-                cursor.execute("SELECT hr_id, name FROM HR")
-                hrs = cursor.fetchall()
+                hrs = services.list_hrs(self.db)
                 print(colored("\nAvailable HRs:", "cyan"))
                 print(tabulate(hrs, headers=["HR ID", "Name"], tablefmt="double_grid"))
 
                 hr_id = input("\nEnter HR ID to change password: ").strip()
-                cursor.execute("SELECT password FROM HR WHERE hr_id = ?", (hr_id,))
-                current_password = cursor.fetchone()
-
-                if current_password:
-                    print(colored(f"\nCurrent HR Password: {current_password[0]}", "yellow"))
-                    while True:
-                        new_password = input("Enter new Password: ").strip()
-                        if len(new_password) >= 4:
-                            cursor.execute("UPDATE HR SET password = ? WHERE hr_id = ?", (new_password, hr_id))
-                            conn.commit()
-                            print(colored("\nHR password updated successfully!", "green"))
-                            break
-                        print(colored("\nPassword too short! Must be at least 4 characters.", "red"))
+                current_password = services.get_password("hr", hr_id, self.db)
+
+                if current_password is not None:
+                    print(colored(f"\nCurrent HR Password: {current_password}", "yellow"))
+                    self.change_password("hr", hr_id, "HR")
                 else:
                     print(colored("\nInvalid HR ID!", "red"))
 
             elif choice == "2":
-                # Show available Employees
-                cursor.execute("SELECT emp_id, name FROM Employee")
-                emps = cursor.fetchall()
-                print(colored("\nAvailable Employees:", "cyan"))
-                print(tabulate(emps, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
-                emp_id = input("\nEnter Employee ID to change password: ").strip()
-                cursor.execute("SELECT password FROM Employee WHERE emp_id = ?", (emp_id,))
-                current_password = cursor.fetchone()
-
-                if current_password:
-                    print(colored(f"\nCurrent Employee Password: {current_password[0]}", "yellow"))
-                    while True:
-                        new_password = input("Enter new Password: ").strip()
-                        if len(new_password) >= 4:
-                            cursor.execute("UPDATE Employee SET password = ? WHERE emp_id = ?", (new_password, emp_id))
-                            conn.commit()
-                            print(colored("\nEmployee password updated successfully!", "green"))
-                            break
-                        print(colored("\nPassword too short! Must be at least 4 characters.", "red"))
+                # Page through available Employees
+                emp_id = picker.pick_employee(self.db, "Enter Employee ID to change password")
+                if emp_id is None:
+                    continue
+
+                current_password = services.get_password("employee", emp_id, self.db)
+
+                if current_password is not None:
+                    print(colored(f"\nCurrent Employee Password: {current_password}", "yellow"))
+                    self.change_password("employee", emp_id, "Employee")
                 else:
                     print(colored("\nInvalid Employee ID!", "red"))
 
             elif choice == "3":
                 # Change Manager password
-                cursor.execute("SELECT password FROM Manager WHERE id = 1")
-                current_password = cursor.fetchone()
+                current_password = services.get_password("manager", 1, self.db)
 
-                print(colored(f"\nCurrent Manager Password: {current_password[0]}", "yellow"))
-                while True:
-                    new_password = input("Enter new Password: ").strip()
-                    if len(new_password) >= 4:
-                        cursor.execute("UPDATE Manager SET password = ? WHERE id = 1", (new_password,))
-                        conn.commit()
-                        print(colored("\nManager password updated successfully!", "green"))
-                        break
-                    print(colored("\nPassword too short! Must be at least 4 characters.", "red"))
+                print(colored(f"\nCurrent Manager Password: {current_password}", "yellow"))
+                self.change_password("manager", 1, "Manager")
 
             elif choice == "4":
                 print(colored("\nExiting password management...", "yellow"))
@@ -502,87 +450,57 @@ class Manager:
             else:
                 print(colored("\nInvalid choice! Please enter a number between 1 and 4.", "red"))
 
-        conn.close()
+    def change_password(self, account, account_id, label):
+        # Ask until the new password is accepted
+        while True:
+            new_password = input("Enter new Password: ").strip()
+            try:
+                services.set_password(account, account_id, new_password, self.db)
+                print(colored(f"\n{label} password updated successfully!", "green"))
+                return
+            except services.ServiceError as e:
+                print(colored(f"\n{e}", "red"))
 
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def view_employee_performance(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT ep_id, employee_id, ratedbyhr_name, rating, comments 
-            FROM Employee_performance
-        """)
-        performance_records = cursor.fetchall()
-
-        if performance_records:
-            print(colored("\nEmployee Performance Records:", "green"))
-            print(tabulate(performance_records, headers=["EP ID", "Employee ID", "Rated by HR", "Rating", "Comments"], tablefmt="double_grid"))
-        else:
-            print(colored("\nNo performance records found.", "red"))
-
-        conn.close()
+        performance.show_performance(self.db)
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def remove_employee(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT emp_id, name FROM Employee")
-        employees = cursor.fetchall()
-
-        if not employees:
-            print(colored("\nNo employees found.", "red"))
-            conn.close()
-            return
-
-        print(colored("\nEmployee List:", "cyan"))
-        print(tabulate(employees, headers=["Employee ID", "Name"], tablefmt="double_grid"))
-
         while True:
-            emp_id = input("\nEnter the Employee ID to remove: ").strip()
-
-            # Validate input is numeric
-            if not emp_id.isdigit():
-                print(colored("\nInvalid input! Please enter a valid numeric Employee ID.", "red"))
-                continue
+            emp_id = picker.pick_employee(self.db, "Enter the Employee ID to remove", "Employee List:")
+            if emp_id is None:
+                break
 
             emp_id = int(emp_id)
 
-            # Check if Employee ID exists
-            cursor.execute("SELECT emp_id FROM Employee WHERE emp_id = ?", (emp_id,))
-            if not cursor.fetchone():
+            # Check the Employee ID exists, then delete it
+            try:
+                services.delete_employee(emp_id, self.db)
+            except services.ServiceError:
                 print(colored("\nEmployee ID not found! Please enter a valid ID from the list.", "red"))
                 continue
 
-            # Proceed with deletion
-            cursor.execute("DELETE FROM Employee WHERE emp_id = ?", (emp_id,))
-            conn.commit()
             print(colored(f"\nEmployee with ID {emp_id} has been removed successfully!", "green"))
             break
-
-        conn.close()
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def generate_salary_report(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
         while True:
             print(colored("\nGenerate Salary Report", "cyan"))
             print(tabulate([
                 ["1", "Employee Salary Report"],
                 ["2", "HR Salary Report"],
-                ["3", "Exit"]
+                ["3", "Salary Analytics (all departments and positions)"],
+                ["4", "Exit"]
             ], headers=["Option", "Report Type"], tablefmt="double_grid"))
 
-            choice = input("\nEnter your choice (1-3): ").strip()
+            choice = input("\nEnter your choice (1-4): ").strip()
 
             if choice == "1":
                 # Employee Salary Report
-                cursor.execute("SELECT DISTINCT department FROM Employee LIMIT 5")
-                departments = cursor.fetchall()
+                departments = services.list_departments(db=self.db)
 
                 if not departments:
                     print(colored("\nNo departments found.", "red"))
@@ -593,79 +511,67 @@ class Manager:
 
                 selected_department = input("\nEnter the department to generate the salary report: ").strip()
 
-                cursor.execute("""
-                    SELECT department, SUM(salary)
-                    FROM Employee
-                    WHERE department = ?
-                    GROUP BY department
-                """, (selected_department,))
-                result = cursor.fetchone()
+                total = services.department_salary_total(selected_department, self.db)
 
-                if not result:
+                if total is None:
                     print(colored(f"\nNo salary data found for department: {selected_department}", "red"))
                     continue
 
                 # Plotting
-                departments = [result[0]]
-                salaries = [result[1]]
-
-                plt.bar(departments, salaries, color='skyblue')
-                plt.title(f'Salary Report for {selected_department}')
-                plt.xlabel('Department')
-                plt.ylabel('Total Salary (INR)')
-                plt.show()
+                chart = charts.bar_chart(f'salary_report_{selected_department}', [selected_department], [total],
+                                         f'Salary Report for {selected_department}', 'Department', 'Total Salary (INR)')
+                if chart:
+                    print(colored(f"\nChart saved to {chart}", "green"))
 
             elif choice == "2":
                 # HR Salary Report
-                cursor.execute("SELECT hr_id, salary FROM HR")
-                hr_data = cursor.fetchall()
+                hr_data = services.hr_salaries(self.db)
 
                 if not hr_data:
                     print(colored("\nNo HR salary data found.", "red"))
                     continue
 
                 print(colored("\nHR Salary Data:", "green"))
-                print(tabulate(hr_data, headers=["HR ID", "Salary (INR)"], tablefmt="double_grid"))
+                print(tabulate(hr_data, headers=["HR ID", "Name", "Salary (INR)"], tablefmt="double_grid"))
 
                 hr_ids = [str(row[0]) for row in hr_data]
-                salaries = [row[1] for row in hr_data]
+                salaries = [row[2] for row in hr_data]
 
-                plt.bar(hr_ids, salaries, color='orange')
-                plt.title('HR Salary Report')
-                plt.xlabel('HR ID')
-                plt.ylabel('Salary (INR)')
-                plt.show()
+                chart = charts.bar_chart('hr_salary_report', hr_ids, salaries, 'HR Salary Report', 'HR ID', 'Salary (INR)', color='orange')
+                if chart:
+                    print(colored(f"\nChart saved to {chart}", "green"))
 
             elif choice == "3":
+                salary_analytics.show_salary_report(self.db)
+
+            elif choice == "4":
                 print(colored("\nExiting salary report generation...", "yellow"))
                 break
 
             else:
-                print(colored("\nInvalid choice! Please enter a number between 1 and 3.", "red"))
-
-        conn.close()
+                print(colored("\nInvalid choice! Please enter a number between 1 and 4.", "red"))
 # -----------------------------------------------------------------------------------------------------------------------------------
 
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def promote_employee_or_hr(self):
-        conn = sqlite3.connect(self.db)
-        cursor = conn.cursor()
-
+        # Reads and promotions go through services; no connection is held across the prompts
         while True:
             print(colored("\nPromotion Menu:", "green"))
-            print("1) Promote HR\n2) Promote Employee\n3) Exit")
+            print("1) Promote HR\n2) Promote Employee\n3) Bulk Salary Revision (Employees)\n4) Exit")
 
-            choice = input("\nEnter your choice (1/2/3): ").strip()
-            if choice == "3":
+            choice = input("\nEnter your choice (1/2/3/4): ").strip()
+            if choice == "4":
                 break
+            elif choice == "3":
+                salary_revision.run_revision_menu(self.name, self.db)
+                continue
             elif choice not in ["1", "2"]:
-                print(colored("\nInvalid choice! Please enter 1, 2, or 3.", "red"))
+                print(colored("\nInvalid choice! Please enter 1, 2, 3, or 4.", "red"))
                 continue
 
             if choice == "1":  # Promote HR
-                cursor.execute("SELECT hr_id, name, salary FROM HR")
-                hrs = cursor.fetchall()
+                hrs = services.hr_salaries(self.db)
 
                 if not hrs:
                     print(colored("\nNo HR available for promotion.", "red"))
@@ -690,36 +596,27 @@ class Manager:
                         continue
 
                     try:
-                        new_salary = float(new_salary)
-                        if new_salary <= current_salary:
-                            print(colored("\nNew salary must be greater than the current salary!", "red"))
-                            continue
-
-                        cursor.execute("UPDATE HR SET salary = ? WHERE hr_id = ?", (new_salary, hr_id))
-                        conn.commit()
+                        services.promote_hr(hr_id, float(new_salary), self.db)
                         print(colored("\nHR salary updated successfully!", "green"))
                         break
                     except ValueError:
                         print(colored("\nInvalid salary amount. Please enter a valid number.", "red"))
+                    except services.ServiceError as e:
+                        print(colored(f"\n{e}", "red"))
 
             elif choice == "2":  # Promote Employee
-                cursor.execute("SELECT emp_id, name, department, position, salary FROM Employee")
-                employees = cursor.fetchall()
-
-                if not employees:
-                    print(colored("\nNo employees available for promotion.", "red"))
+                emp_id = picker.pick_employee(self.db, "Enter Employee ID to promote", "Available Employees for Promotion:",
+                                              columns=("emp_id", "name", "department", "position", "salary"),
+                                              headers=("Emp ID", "Name", "Department", "Position", "Current Salary (INR)"))
+                if emp_id is None:
                     continue
 
-                print(colored("\nAvailable Employees for Promotion:", "green"))
-                print(tabulate(employees, headers=["Emp ID", "Name", "Department", "Position", "Current Salary (INR)"], tablefmt="double_grid"))
-
-                emp_ids = [str(emp[0]) for emp in employees]
-                emp_id = input("\nEnter Employee ID to promote: ").strip()
-                if emp_id not in emp_ids:
+                profile = services.get_profile(emp_id, self.db)
+                if not profile:
                     print(colored("\nInvalid Employee ID. Please select from the list.", "red"))
                     continue
 
-                current_salary = next(emp[4] for emp in employees if str(emp[0]) == emp_id)
+                current_salary = profile["salary"]
                 print(colored(f"\nCurrent Salary for Employee ID {emp_id}: INR {current_salary}", "yellow"))
 
                 while True:
@@ -729,26 +626,27 @@ class Manager:
                         continue
 
                     try:
-                        new_salary = float(new_salary)
-                        if new_salary <= current_salary:
-                            print(colored("\nNew salary must be greater than the current salary!", "red"))
-                            continue
-
-                        cursor.execute("UPDATE Employee SET salary = ? WHERE emp_id = ?", (new_salary, emp_id))
-                        conn.commit()
+                        services.promote_employee(emp_id, float(new_salary), self.db, changed_by=self.name)
                         print(colored("\nEmployee salary updated successfully!", "green"))
                         break
                     except ValueError:
                         print(colored("\nInvalid salary amount. Please enter a valid number.", "red"))
-
-        conn.close()
+                    except services.ServiceError as e:
+                        print(colored(f"\n{e}", "red"))
 
 # -----------------------------------------------------------------------------------------------------------------------------------
 
     def employee_attendance_report(self):
-        conn = sqlite3.connect(self.db)
+        conn = database.connect(self.db)
         cursor = conn.cursor()
 
+        print(colored("\n1) Single Day Report", "cyan"))
+        print(colored("2) Date Range Report (weekly/monthly/quarterly, per employee or department)", "cyan"))
+        if input("Enter your choice (1/2): ").strip() == "2":
+            attendance_reports.range_report(conn)
+            conn.close()
+            return
+
         # Ask for the date to filter attendance records
         while True:
             date = input("\nEnter the date to view attendance (YYYY-MM-DD): ").strip()
@@ -757,13 +655,7 @@ class Manager:
                 continue
             
             # Check if records exist for the entered date
-            cursor.execute("""
-                SELECT emp_id, SUM(total_work_hours)
-                FROM Employee_Attendance
-                WHERE date = ?
-                GROUP BY emp_id
-            """, (date,))
-            attendance_data = cursor.fetchall()
+            attendance_data = services.attendance_for_date(date, self.db)
 
             if attendance_data:
                 break
@@ -779,22 +671,19 @@ class Manager:
         work_hours = [row[1] for row in attendance_data]
 
         # Plotting the bar chart
-        plt.figure(figsize=(10, 6))
-        plt.bar(emp_ids, work_hours, color='skyblue')
-        plt.title(f'Employee Attendance Report - {date}')
-        plt.xlabel('Employee ID')
-        plt.ylabel('Total Working Hours')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
+        chart = charts.bar_chart(f'attendance_report_{date}', emp_ids, work_hours, f'Employee Attendance Report - {date}',
+                                 'Employee ID', 'Total Working Hours', rotation=45, figsize=(10, 6))
+        if chart:
+            print(colored(f"\nChart saved to {chart}", "green"))
 
         conn.close()
 # -----------------------------------------------------------------------------------------------------------------------------------
 
 
 # Login and menu loop
-while True:
-    manager = Manager.login()
-    if manager:
-        manager.run()
-        break
+if __name__ == "__main__":
+    while True:
+        manager = Manager.login()
+        if manager:
+            manager.run()
+            break
@@ -0,0 +1,215 @@
+from datetime import date, datetime, timedelta
+
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+import services
+
+# Monthly payroll for every employee in one vectorized pass. Employee.salary is the monthly
+# salary; it is earned per working day (Monday to Friday, from the joining date if later):
+#
+#   paid days   = full days + half days / 2 + approved leave days, capped at working days
+#   loss of pay = salary * (working days - paid days) / working days
+#   PF          = PROVIDENT_FUND_RATE * (salary - loss of pay)
+#   net pay     = salary - loss of pay - PF
+#
+# Full and half days are distinct weekdays in the Attendance_Daily rollup: a day with any
+# Full Day punch is a full day, otherwise a day with a Half Day punch is a half day, so
+# repeated punches and weekend work do not add paid days. Leave days come from approved
+# leaves clipped to the month. Overlapping leaves of one employee are merged first, and a
+# leave day the employee also punched in on is paid through attendance, not again as leave.
+# Results replace the month's rows in the Payroll table.
+#
+#   python3 payroll.py 2026-09 [--db ems_data.db]
+
+PROVIDENT_FUND_RATE = 0.12
+PAID_LEAVE_TYPES = services.LEAVE_TYPES
+
+COLUMNS = ["emp_id", "salary", "working_days", "full_days", "half_days", "leave_days", "paid_days",
+           "loss_of_pay", "provident_fund", "deductions", "net_pay"]
+
+
+def month_bounds(month):
+    # "2026-09" -> ("2026-09-01", "2026-09-30")
+    try:
+        first = datetime.strptime(month, "%Y-%m").date()
+    except (TypeError, ValueError):
+        raise services.ServiceError("Invalid month! Use the YYYY-MM format.")
+    last = (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return first.isoformat(), last.isoformat()
+
+
+def previous_month(today=None):
+    first = (today or date.today()).replace(day=1)
+    return (first - timedelta(days=1)).strftime("%Y-%m")
+
+
+def load_month(conn, month):
+    # Four set-based reads: employees (with the day they start earning this month), the
+    # month's full and half weekdays, approved leaves overlapping the month and the days inside
+    # those leaves that have attendance
+    first, last = month_bounds(month)
+    employees = conn.execute("""
+        SELECT emp_id, salary, CASE WHEN joining_date > ? THEN joining_date ELSE ? END
+        FROM Employee
+        WHERE salary IS NOT NULL AND (joining_date IS NULL OR joining_date <= ?)
+        ORDER BY emp_id
+    """, (first, first, last)).fetchall()
+    attendance = conn.execute("""
+        SELECT emp_id, SUM(full_days > 0), SUM(full_days = 0 AND half_days > 0)
+        FROM Attendance_Daily
+        WHERE date BETWEEN ? AND ? AND strftime('%w', date) NOT IN ('0', '6')
+        GROUP BY emp_id
+    """, (first, last)).fetchall()
+    placeholders = ", ".join("?" * len(PAID_LEAVE_TYPES))
+    leaves = conn.execute(f"""
+        SELECT emp_id, MAX(startdate, ?), MIN(enddate, ?)
+        FROM Leaves
+        WHERE status = 'APPROVED' AND startdate <= ? AND enddate >= ? AND leavetype IN ({placeholders})
+    """, [first, last, last, first] + list(PAID_LEAVE_TYPES)).fetchall()
+    attended = conn.execute(f"""
+        SELECT DISTINCT D.emp_id, D.date
+        FROM Leaves L
+        JOIN Attendance_Daily D ON D.emp_id = L.emp_id AND D.date BETWEEN MAX(L.startdate, ?) AND MIN(L.enddate, ?)
+        WHERE L.status = 'APPROVED' AND L.startdate <= ? AND L.enddate >= ? AND L.leavetype IN ({placeholders})
+          AND D.full_days + D.half_days > 0
+    """, [first, last, last, first] + list(PAID_LEAVE_TYPES)).fetchall()
+    return employees, attendance, leaves, attended
+
+
+def compute_payroll(month, employees, attendance, leaves, attended=()):
+    # Every step is an array operation over all employees; returns {column: array}
+    import numpy as np
+
+    first, last = month_bounds(month)
+    end = np.datetime64(last) + 1
+
+    emp_ids = np.array([row[0] for row in employees], dtype=np.int64)
+    salary = np.array([row[1] for row in employees], dtype=float)
+    start = np.array([row[2] for row in employees], dtype="datetime64[D]")
+    working_days = np.busday_count(start, end)
+    if not employees:
+        return {name: np.array([]) for name in COLUMNS}
+
+    def position(ids):
+        # Index of each emp_id in the sorted emp_ids array, and which of them are in it at all
+        ids = np.asarray(ids, dtype=np.int64)
+        index = np.minimum(np.searchsorted(emp_ids, ids), len(emp_ids) - 1)
+        return index, emp_ids[index] == ids
+
+    full_days = np.zeros(len(emp_ids), dtype=np.int64)
+    half_days = np.zeros(len(emp_ids), dtype=np.int64)
+    if attendance:
+        index, found = position([row[0] for row in attendance])
+        np.add.at(full_days, index[found], np.array([row[1] for row in attendance], dtype=np.int64)[found])
+        np.add.at(half_days, index[found], np.array([row[2] for row in attendance], dtype=np.int64)[found])
+
+    leave_days = np.zeros(len(emp_ids), dtype=np.int64)
+    if leaves:
+        index, found = position([row[0] for row in leaves])
+        leave_start = np.array([row[1] for row in leaves], dtype="datetime64[D]")
+        leave_end = np.array([row[2] for row in leaves], dtype="datetime64[D]") + 1
+        # Only weekdays on or after the employee starts earning count
+        leave_start = np.maximum(leave_start, start[index])
+        index, leave_start, leave_end = index[found], leave_start[found], leave_end[found]
+        # Merge each employee's overlapping leaves: in (employee, start) order a leave only
+        # counts from the furthest day the same employee's earlier leaves already reached
+        order = np.lexsort((leave_start, index))
+        index, leave_start, leave_end = index[order], leave_start[order], leave_end[order]
+        ends = leave_end.astype(np.int64)
+        span = ends.max(initial=0) + 1
+        reached = np.maximum.accumulate(index * span + ends) - index * span
+        reached_before = np.r_[ends[:1], reached[:-1]].astype("datetime64[D]")
+        same = np.r_[False, index[1:] == index[:-1]]
+        leave_start = np.where(same, np.maximum(leave_start, reached_before), leave_start)
+        days = np.busday_count(leave_start, np.maximum(leave_end, leave_start))
+        np.add.at(leave_days, index, days)
+
+    if len(attended):
+        # Leave weekdays that also have punches are already paid as full or half days
+        index, found = position([row[0] for row in attended])
+        day = np.array([row[1] for row in attended], dtype="datetime64[D]")
+        found &= (day >= start[index]) & np.is_busday(day)
+        np.subtract.at(leave_days, index[found], 1)
+
+    paid_days = np.minimum(full_days + half_days / 2 + leave_days, working_days)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        daily_rate = np.where(working_days > 0, salary / working_days, 0.0)
+    loss_of_pay = np.round(daily_rate * (working_days - paid_days), 2)
+    provident_fund = np.round((salary - loss_of_pay) * PROVIDENT_FUND_RATE, 2)
+    deductions = loss_of_pay + provident_fund
+    net_pay = np.round(salary - deductions, 2)
+
+    keep = working_days > 0
+    return {name: values[keep] for name, values in [
+        ("emp_id", emp_ids), ("salary", salary), ("working_days", working_days), ("full_days", full_days),
+        ("half_days", half_days), ("leave_days", leave_days), ("paid_days", paid_days), ("loss_of_pay", loss_of_pay),
+        ("provident_fund", provident_fund), ("deductions", deductions), ("net_pay", net_pay),
+    ]}
+
+
+def run_payroll(month, db=database.DB_PATH):
+    # Computes the month and replaces its Payroll rows in one transaction; returns totals
+    month_bounds(month)
+    run_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def work(conn):
+        result = compute_payroll(month, *load_month(conn, month))
+        conn.execute("DELETE FROM Payroll WHERE month = ?", (month,))
+        conn.executemany(f"""
+            INSERT INTO Payroll (month, {', '.join(COLUMNS)}, run_at)
+            VALUES (?, {', '.join('?' * len(COLUMNS))}, ?)
+        """, ((month, *row, run_at) for row in zip(*(result[name].tolist() for name in COLUMNS))))
+        return result
+
+    result = database.run_in_transaction(work, db)
+    return {
+        "month": month,
+        "employees": len(result["emp_id"]),
+        "gross": float(result["salary"].sum()),
+        "loss_of_pay": float(result["loss_of_pay"].sum()),
+        "provident_fund": float(result["provident_fund"].sum()),
+        "net_pay": float(result["net_pay"].sum()),
+    }
+
+
+def payroll_by_department(month, db=database.DB_PATH):
+    return services.fetch_all("""
+        SELECT E.department, COUNT(*), SUM(P.salary), SUM(P.loss_of_pay), SUM(P.provident_fund), SUM(P.net_pay)
+        FROM Payroll P
+        JOIN Employee E ON E.emp_id = P.emp_id
+        WHERE P.month = ?
+        GROUP BY E.department
+        ORDER BY E.department
+    """, (month,), db)
+
+
+def show_payroll(month, db=database.DB_PATH):
+    # Interactive payroll run used by the HR menu
+    try:
+        result = run_payroll(month, db)
+    except services.ServiceError as e:
+        print(colored(f"\n{e}", "red"))
+        return
+    if not result["employees"]:
+        print(colored(f"\nNo employees to pay for {month}.", "yellow"))
+        return
+
+    print(colored(f"\nPayroll for {month} ({result['employees']} employees, INR):", "green"))
+    print(tabulate(payroll_by_department(month, db),
+                   headers=["Department", "Employees", "Gross", "Loss of Pay", "Provident Fund", "Net Pay"],
+                   tablefmt="double_grid", floatfmt=".2f"))
+    print(colored(f"\nTotal net pay: {result['net_pay']:.2f} INR", "green"))
+
+
+if __name__ == "__main__":
+    # python3 payroll.py [YYYY-MM] [--db ems_data.db]  (defaults to last month)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the monthly payroll into the Payroll table")
+    parser.add_argument("month", nargs="?", default=previous_month())
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    show_payroll(args.month, args.db)
@@ -0,0 +1,176 @@
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+
+# Performance analytics from the rating summaries instead of raw Employee_performance rows.
+# Performance_Summary (count, sum, latest and previous rating per employee) and
+# Rater_Distribution (ratings of each value per HR rater) are kept current by triggers, so
+# the reports read one row per employee or per rater; raw comments are paged only on demand.
+#
+#   python3 performance.py top [--n 5] [--department IT]
+#   python3 performance.py bottom [--n 5] [--department IT]
+#   python3 performance.py raters
+#   python3 performance.py comments [--emp-id 7] [--before EP_ID] [--page-size 20]
+#   python3 performance.py rebuild
+
+RANKING_HEADERS = ["Department", "Rank", "Employee ID", "Name", "Ratings", "Mean", "Latest", "Trend"]
+RATER_HEADERS = ["Rated by HR", "1", "2", "3", "4", "5", "Total", "Mean"]
+COMMENT_HEADERS = ["EP ID", "Employee ID", "Name", "Rated by HR", "Rating", "Comments"]
+PAGE_SIZE = 20
+TOP_N = 5
+
+
+def trend(latest, previous):
+    # Change from the previous rating to the latest one, e.g. "+2", "-1", "=" ("" with a single rating)
+    if previous is None:
+        return ""
+    return f"{latest - previous:+d}" if latest != previous else "="
+
+
+def ranking(conn, n=TOP_N, department=None, bottom=False):
+    # The n best (or worst) rated employees of each department by mean rating; ties go to the
+    # employee with more ratings, then the lower Employee ID
+    order = "ASC" if bottom else "DESC"
+    query = f"""
+        SELECT department, position, emp_id, name, ratings, mean, latest_rating, previous_rating
+        FROM (
+            SELECT E.department, S.emp_id, E.name, S.ratings, S.rating_sum * 1.0 / S.ratings AS mean,
+                   S.latest_rating, S.previous_rating,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY E.department
+                       ORDER BY S.rating_sum * 1.0 / S.ratings {order}, S.ratings DESC, S.emp_id
+                   ) AS position
+            FROM Performance_Summary S
+            JOIN Employee E ON E.emp_id = S.emp_id
+            {"WHERE E.department = ?" if department else ""}
+        )
+        WHERE position <= ?
+        ORDER BY department, position
+    """
+    params = ([department] if department else []) + [n]
+    return [[dept, position, emp_id, name, ratings, round(mean, 2), latest, trend(latest, previous)]
+            for dept, position, emp_id, name, ratings, mean, latest, previous in conn.execute(query, params)]
+
+
+def rater_distribution(conn):
+    # [rater, ratings of 1, .., ratings of 5, total, mean] per HR rater
+    counts = {}
+    for rater, rating, ratings in conn.execute("SELECT rater, rating, ratings FROM Rater_Distribution ORDER BY rater"):
+        counts.setdefault(rater, {})[rating] = ratings
+    rows = []
+    for rater, by_rating in counts.items():
+        total = sum(by_rating.values())
+        mean = sum(rating * ratings for rating, ratings in by_rating.items()) / total
+        rows.append([rater or "(unknown)"] + [by_rating.get(rating, 0) for rating in range(1, 6)] + [total, round(mean, 2)])
+    return rows
+
+
+def comments_page(conn, emp_id=None, before=None, page_size=PAGE_SIZE):
+    # One page of raw ratings with comments, newest first. Pass the last EP ID of a page as
+    # before to get the next one; returns (rows, has_more)
+    conditions, params = [], []
+    if emp_id is not None:
+        conditions.append("P.employee_id = ?")
+        params.append(emp_id)
+    if before is not None:
+        conditions.append("P.ep_id < ?")
+        params.append(before)
+    rows = conn.execute(f"""
+        SELECT P.ep_id, P.employee_id, E.name, P.ratedbyhr_name, P.rating, P.comments
+        FROM Employee_performance P
+        LEFT JOIN Employee E ON E.emp_id = P.employee_id
+        {"WHERE " + " AND ".join(conditions) if conditions else ""}
+        ORDER BY P.ep_id DESC
+        LIMIT ?
+    """, params + [page_size + 1]).fetchall()
+    return rows[:page_size], len(rows) > page_size
+
+
+def browse_comments(conn, emp_id=None):
+    # Interactive paging through raw comments: Enter or "n" for the next page, anything else stops
+    before = None
+    while True:
+        rows, has_more = comments_page(conn, emp_id, before)
+        if not rows:
+            print(colored("\nNo performance records found.", "red"))
+            return
+        print(tabulate(rows, headers=COMMENT_HEADERS, tablefmt="double_grid"))
+        if not has_more or input("[n] next page, anything else to stop: ").strip().lower() not in ("", "n"):
+            return
+        before = rows[-1][0]
+
+
+def show_performance(db=database.DB_PATH):
+    # Interactive performance view used by the Manager menu
+    options = [
+        ["1", "Top Performers by Department"],
+        ["2", "Bottom Performers by Department"],
+        ["3", "Rating Distribution per HR Rater"],
+        ["4", "Browse Rating Comments"],
+        ["5", "Back"]
+    ]
+    print(colored("\nEmployee Performance", "green", attrs=['bold']))
+    print(tabulate(options, headers=[colored("Option", "cyan"), colored("Action", "yellow")], tablefmt="double_grid"))
+    choice = input("Enter your choice: ").strip()
+
+    conn = database.connect(db)
+    try:
+        if choice in ("1", "2"):
+            n = input(f"How many per department (Enter for {TOP_N}): ").strip()
+            if n and not (n.isdigit() and int(n) > 0):
+                print(colored("\nInvalid number!", "red"))
+                return
+            department = input("Department (Enter for all): ").strip() or None
+            rows = ranking(conn, int(n or TOP_N), department, bottom=choice == "2")
+            if rows:
+                print(tabulate(rows, headers=RANKING_HEADERS, tablefmt="double_grid"))
+            else:
+                print(colored("\nNo performance records found.", "red"))
+        elif choice == "3":
+            rows = rater_distribution(conn)
+            if rows:
+                print(tabulate(rows, headers=RATER_HEADERS, tablefmt="double_grid"))
+            else:
+                print(colored("\nNo performance records found.", "red"))
+        elif choice == "4":
+            emp_id = input("Employee ID (Enter for all): ").strip()
+            if emp_id and not emp_id.isdigit():
+                print(colored("\nInvalid Employee ID!", "red"))
+                return
+            browse_comments(conn, int(emp_id) if emp_id else None)
+        elif choice != "5":
+            print(colored("\nInvalid choice!", "red"))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Performance rankings, rater distribution and rating comments")
+    parser.add_argument("command", choices=["top", "bottom", "raters", "comments", "rebuild"])
+    parser.add_argument("--n", type=int, default=TOP_N)
+    parser.add_argument("--department")
+    parser.add_argument("--emp-id", type=int)
+    parser.add_argument("--before", type=int, help="EP ID the page starts after (newest first)")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        database.run_in_transaction(database.rebuild_performance_summary, args.db)
+        print("Performance summaries rebuilt.")
+    else:
+        conn = database.connect(args.db)
+        if args.command in ("top", "bottom"):
+            print(tabulate(ranking(conn, args.n, args.department, args.command == "bottom"),
+                           headers=RANKING_HEADERS, tablefmt="double_grid"))
+        elif args.command == "raters":
+            print(tabulate(rater_distribution(conn), headers=RATER_HEADERS, tablefmt="double_grid"))
+        else:
+            rows, has_more = comments_page(conn, args.emp_id, args.before, args.page_size)
+            print(tabulate(rows, headers=COMMENT_HEADERS, tablefmt="double_grid"))
+            if has_more:
+                print(f"Next page: --before {rows[-1][0]}")
+        conn.close()
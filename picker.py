@@ -0,0 +1,98 @@
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+
+PAGE_SIZE = 20
+
+
+def prefix_range(prefix):
+    # (low, high) with every NOCASE match of prefix in low <= name < high. NOCASE only folds
+    # ASCII letters, so only those are lowered; the last character is bumped for the bound
+    low = "".join(char.lower() if char.isascii() else char for char in prefix)
+    return low, low[:-1] + chr(ord(low[-1]) + 1)
+
+
+def fetch_page(cursor, after_id=0, department=None, name_prefix=None, columns=("emp_id", "name"), page_size=PAGE_SIZE):
+    # Keyset pagination: only the rows of one page (plus one to detect a next page) are read
+    where = ["emp_id > ?"]
+    params = [after_id]
+    if department:
+        where.append("department = ?")
+        params.append(department)
+    if name_prefix:
+        # Case-insensitive prefix as a range on idx_employee_name: ami <= name < amj
+        where.append("name COLLATE NOCASE >= ? AND name COLLATE NOCASE < ?")
+        params.extend(prefix_range(name_prefix))
+
+    cursor.execute(
+        f"SELECT {', '.join(columns)} FROM Employee WHERE {' AND '.join(where)} ORDER BY emp_id LIMIT ?",
+        params + [page_size + 1]
+    )
+    rows = cursor.fetchall()
+    return rows[:page_size], len(rows) > page_size
+
+
+def pick_employee(db, prompt, title="Available Employees:", columns=("emp_id", "name"),
+                  headers=("Employee ID", "Name"), page_size=PAGE_SIZE):
+    # Shows one page of employees at a time and returns the Employee ID typed, or None if cancelled.
+    # Each page is read on a pooled connection that goes back to the pool before the prompt,
+    # so none is held while waiting for input
+    def read_page(after_id):
+        conn = database.connect(db)
+        try:
+            return fetch_page(conn.cursor(), after_id, department, name_prefix, columns, page_size)
+        finally:
+            conn.close()
+
+    department = None
+    name_prefix = None
+    page_starts = [0]
+
+    while True:
+        rows, has_more = read_page(page_starts[-1])
+
+        filtered = department or name_prefix
+        if not rows and len(page_starts) == 1 and not filtered:
+            print(colored("\nNo employees found.", "red"))
+            return None
+
+        filters = []
+        if department:
+            filters.append(f"department {department}")
+        if name_prefix:
+            filters.append(f"name starting '{name_prefix}'")
+        heading = f"\n{title.rstrip(':')} (page {len(page_starts)}{', ' + ', '.join(filters) if filters else ''}):"
+        print(colored(heading, "green"))
+        if rows:
+            print(tabulate(rows, headers=list(headers), tablefmt="double_grid"))
+        else:
+            print(colored("No employees match.", "yellow"))
+
+        print(colored("[n] next page  [p] previous page  [d <department>] filter  [/<name>] narrow by name  [q] cancel", "cyan"))
+        choice = input(f"\n{prompt}: ").strip()
+
+        if choice.isdigit():
+            return choice
+
+        command = choice.lower()
+        if command == "n":
+            if has_more:
+                page_starts.append(rows[-1][0])
+            else:
+                print(colored("\nAlready on the last page.", "yellow"))
+        elif command == "p":
+            if len(page_starts) > 1:
+                page_starts.pop()
+            else:
+                print(colored("\nAlready on the first page.", "yellow"))
+        elif command == "d" or command.startswith("d "):
+            department = choice[1:].strip() or None
+            page_starts = [0]
+        elif choice.startswith("/"):
+            name_prefix = choice[1:].strip() or None
+            page_starts = [0]
+        elif command == "q":
+            return None
+        else:
+            print(colored("\nInvalid input! Enter an Employee ID or one of the commands above.", "red"))
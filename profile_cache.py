@@ -0,0 +1,98 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# Read-through cache of employee profile rows for self-service reads (profile and salary
+# screens, GET /employees/<id>/profile and /salary). Bounded LRU with a TTL: every write path
+# in services.py that touches an Employee row invalidates it after its transaction commits,
+# and the TTL bounds how long a write made by another process (or directly in SQL) can go
+# unseen. Hit rate and counters are in stats().
+#
+#   EMS_PROFILE_CACHE=0        switch the cache off
+#   EMS_PROFILE_CACHE_SIZE     most profiles kept (default 10000)
+#   EMS_PROFILE_CACHE_TTL      seconds a profile is served before it is read again (default 30)
+
+ENABLED = os.environ.get("EMS_PROFILE_CACHE", "1") != "0"
+MAX_ENTRIES = int(os.environ.get("EMS_PROFILE_CACHE_SIZE", "10000"))
+TTL_SECONDS = float(os.environ.get("EMS_PROFILE_CACHE_TTL", "30"))
+
+COUNTERS = ["hits", "misses", "expired", "evictions", "invalidations"]
+
+_lock = threading.Lock()
+_entries = OrderedDict()  # (db path, emp_id) -> (loaded at, profile), least recently used first
+_generation = 0  # bumped by every invalidation, so a load racing a write is not cached
+_stats = dict.fromkeys(COUNTERS, 0)
+
+
+def configure(enabled=None, max_entries=None, ttl=None):
+    global ENABLED, MAX_ENTRIES, TTL_SECONDS
+    with _lock:
+        if enabled is not None:
+            ENABLED = enabled
+        if max_entries is not None:
+            MAX_ENTRIES = max_entries
+        if ttl is not None:
+            TTL_SECONDS = ttl
+        if not ENABLED:
+            _entries.clear()
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def get(db, emp_id, load):
+    # The cached profile of emp_id, or load() on a miss; None results (no such employee) are not kept
+    if not ENABLED:
+        return load()
+    key = (os.path.abspath(db), int(emp_id))
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and now - entry[0] < TTL_SECONDS:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            return dict(entry[1])
+        if entry is not None:
+            del _entries[key]
+            _stats["expired"] += 1
+        _stats["misses"] += 1
+        generation = _generation
+
+    profile = load()
+    if profile is not None:
+        with _lock:
+            if generation == _generation:
+                _entries[key] = (now, dict(profile))
+                _entries.move_to_end(key)
+                if len(_entries) > MAX_ENTRIES:
+                    _entries.popitem(last=False)
+                    _stats["evictions"] += 1
+    return profile
+
+
+def invalidate(db, emp_ids=None):
+    # Drop the given employees' profiles, or every profile of the database when emp_ids is None
+    global _generation
+    path = os.path.abspath(db)
+    with _lock:
+        _generation += 1
+        _stats["invalidations"] += 1
+        if emp_ids is None:
+            for key in [key for key in _entries if key[0] == path]:
+                del _entries[key]
+        else:
+            for emp_id in emp_ids:
+                _entries.pop((path, int(emp_id)), None)
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+
+
+def stats():
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {**_stats, "enabled": ENABLED, "entries": len(_entries), "max_entries": MAX_ENTRIES,
+                "ttl_seconds": TTL_SECONDS, "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else None}
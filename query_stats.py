@@ -0,0 +1,261 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+
+# Opt-in SQL instrumentation. With EMS_QUERY_STATS=1 every pooled connection records, per
+# statement, where it was issued (role and method), how long it took including fetching,
+# and how many rows and bytes came back. Records are appended to a JSONL log; statements
+# slower than the threshold also go to a readable slow-query log with their query plan.
+#
+#   EMS_QUERY_STATS=1 python3 main.py
+#   python3 query_stats.py summary [--top 20] [--by statement|site]
+
+LOG_PATH = os.environ.get("EMS_QUERY_LOG", "query_stats.jsonl")
+SLOW_LOG_PATH = os.environ.get("EMS_SLOW_QUERY_LOG", "slow_queries.log")
+SLOW_QUERY_MS = float(os.environ.get("EMS_SLOW_QUERY_MS", "100"))
+
+# Menu classes live in these modules; the innermost method of one of them names the call site
+ROLE_MODULES = {"employee", "hr", "manager"}
+SKIP_FILES = {os.path.abspath(__file__), os.path.abspath(os.path.join(os.path.dirname(__file__), "database.py"))}
+
+_lock = threading.Lock()
+_log = None
+
+
+def call_site():
+    # (role, site): e.g. ("HR.view_salary", "services.get_salary:87")
+    frame = sys._getframe(2)
+    site = role = None
+    while frame is not None:
+        code = frame.f_code
+        if os.path.abspath(code.co_filename) not in SKIP_FILES and "contextlib" not in code.co_filename:
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            if site is None:
+                site = f"{module}.{code.co_name}:{frame.f_lineno}"
+            if module in ROLE_MODULES and "self" in frame.f_locals:
+                role = f"{type(frame.f_locals['self']).__name__}.{code.co_name}"
+                break
+        frame = frame.f_back
+    return role or "-", site or "-"
+
+
+def row_bytes(row):
+    size = 0
+    for value in row:
+        if isinstance(value, (str, bytes)):
+            size += len(value)
+        elif value is not None:
+            size += 8
+    return size
+
+
+def write_log(record):
+    global _log
+    with _lock:
+        if _log is None:
+            _log = open(LOG_PATH, "a", buffering=1)
+        _log.write(json.dumps(record) + "\n")
+
+
+def query_plan(conn, sql, params):
+    # EXPLAIN QUERY PLAN output drawn as a tree, like the sqlite3 shell
+    try:
+        rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    except Exception as error:
+        return f"(no plan: {error})"
+    depth = {0: -1}
+    lines = []
+    for node, parent, _, detail in rows:
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + "|--" + detail)
+    return "\n".join(lines) or "(no plan)"
+
+
+def write_slow_log(record, plan):
+    with _lock:
+        with open(SLOW_LOG_PATH, "a") as file:
+            file.write(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['at']))}  {record['ms']:.1f} ms  "
+                       f"{record['role']} ({record['site']})  rows={record['rows']} bytes={record['bytes']}\n"
+                       f"{record['sql']}\nQUERY PLAN\n{plan}\n\n")
+
+
+class Statement:
+    # One execution of one statement; fetches add to its time, rows and bytes until it is finished
+    def __init__(self, conn, sql, params, seconds, rows=0):
+        self.conn = conn
+        self.sql = " ".join(sql.split())
+        self.params = params
+        self.role, self.site = call_site()
+        self.at = time.time()
+        self.seconds = seconds
+        self.rows = rows
+        self.bytes = 0
+        self.finished = False
+
+    def fetched(self, rows, seconds):
+        self.rows += len(rows)
+        self.bytes += sum(row_bytes(row) for row in rows)
+        self.seconds += seconds
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        record = {"at": round(self.at, 3), "role": self.role, "site": self.site, "sql": self.sql,
+                  "ms": round(self.seconds * 1000, 3), "rows": self.rows, "bytes": self.bytes}
+        write_log(record)
+        if record["ms"] >= SLOW_QUERY_MS and not self.sql.upper().startswith(("BEGIN", "COMMIT", "ROLLBACK", "PRAGMA")):
+            write_slow_log(record, query_plan(self.conn, self.sql, self.params))
+
+
+class InstrumentedCursor:
+    def __init__(self, conn, cursor):
+        self._conn = conn
+        self._cursor = cursor
+        self._statement = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _finish(self):
+        if self._statement is not None:
+            self._statement.finish()
+            self._statement = None
+
+    def execute(self, sql, params=()):
+        self._finish()
+        start = time.perf_counter()
+        self._cursor.execute(sql, params)
+        self._statement = Statement(self._conn, sql, params, time.perf_counter() - start)
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._finish()
+        start = time.perf_counter()
+        self._cursor.executemany(sql, seq_of_params)
+        self._statement = Statement(self._conn, sql, (), time.perf_counter() - start, max(self._cursor.rowcount, 0))
+        return self
+
+    def _fetch(self, fetch, *args):
+        start = time.perf_counter()
+        rows = fetch(*args)
+        if self._statement is not None:
+            self._statement.fetched(rows if isinstance(rows, list) else [rows] if rows is not None else [],
+                                    time.perf_counter() - start)
+        return rows
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone)
+
+    def fetchmany(self, size=None):
+        return self._fetch(self._cursor.fetchmany, size or self._cursor.arraysize)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            self._finish()
+            raise StopIteration
+        return row
+
+    def close(self):
+        self._finish()
+        self._cursor.close()
+
+
+def instrument(connection_class):
+    # Subclass of database.PooledConnection whose statements are recorded
+    class InstrumentedConnection(connection_class):
+        def _track(self, cursor):
+            self.__dict__.setdefault("_cursors", []).append(cursor)
+            return cursor
+
+        def cursor(self):
+            return self._track(InstrumentedCursor(self._conn, self._conn.cursor()))
+
+        def execute(self, sql, params=()):
+            return self.cursor().execute(sql, params)
+
+        def executemany(self, sql, seq_of_params):
+            return self.cursor().executemany(sql, seq_of_params)
+
+        def commit(self):
+            start = time.perf_counter()
+            self._conn.commit()
+            Statement(self._conn, "COMMIT", (), time.perf_counter() - start).finish()
+
+        def close(self):
+            for cursor in self.__dict__.pop("_cursors", []):
+                cursor._finish()
+            super().close()
+
+    return InstrumentedConnection
+
+
+def close():
+    global _log
+    with _lock:
+        if _log is not None:
+            _log.close()
+            _log = None
+
+
+atexit.register(close)
+
+
+def load(path=LOG_PATH):
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def summarize(records, by="statement"):
+    # Per statement (or per call site): calls, total/mean/max ms, rows and bytes, largest total first
+    groups = {}
+    for record in records:
+        key = record["sql"] if by == "statement" else f"{record['role']} ({record['site']})"
+        group = groups.setdefault(key, {"calls": 0, "ms": 0.0, "max": 0.0, "rows": 0, "bytes": 0, "sites": {}})
+        group["calls"] += 1
+        group["ms"] += record["ms"]
+        group["max"] = max(group["max"], record["ms"])
+        group["rows"] += record["rows"]
+        group["bytes"] += record["bytes"]
+        other = record["role"] if by == "statement" else record["sql"]
+        group["sites"][other] = group["sites"].get(other, 0) + record["ms"]
+    return sorted(groups.items(), key=lambda item: item[1]["ms"], reverse=True)
+
+
+if __name__ == "__main__":
+    # python3 query_stats.py summary [--log query_stats.jsonl] [--top 20] [--by statement|site]
+    import argparse
+    from tabulate import tabulate
+
+    parser = argparse.ArgumentParser(description="Summarize recorded SQL statement timings")
+    parser.add_argument("command", choices=["summary"])
+    parser.add_argument("--log", default=LOG_PATH)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--by", choices=["statement", "site"], default="statement")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log):
+        parser.error(f"{args.log} not found (run with EMS_QUERY_STATS=1 first)")
+
+    rows = []
+    for key, group in summarize(load(args.log), args.by)[:args.top]:
+        heaviest = max(group["sites"], key=group["sites"].get)
+        rows.append([key if len(key) <= 70 else key[:67] + "...", heaviest if len(heaviest) <= 50 else heaviest[:47] + "...",
+                     group["calls"], f"{group['ms']:.1f}", f"{group['ms'] / group['calls']:.2f}", f"{group['max']:.1f}",
+                     group["rows"], group["bytes"]])
+    headers = ["Statement" if args.by == "statement" else "Call site", "Top caller" if args.by == "statement" else "Top statement",
+               "Calls", "Total ms", "Mean ms", "Max ms", "Rows", "Bytes"]
+    print(tabulate(rows, headers=headers, tablefmt="double_grid"))
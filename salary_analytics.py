@@ -0,0 +1,82 @@
+from tabulate import tabulate
+from termcolor import colored
+
+import charts
+import database
+import services
+
+PERCENTILES = (25, 75, 90)
+
+HEADERS = ["Level", "Group", "Headcount", "Total", "Mean", "Median"] + [f"P{q}" for q in PERCENTILES] + ["Min", "Max"]
+
+
+def group_stats(keys, salaries):
+    # Vectorized per-group statistics: sort once by (group, salary), then read every
+    # group's totals, extremes and interpolated percentiles off the sorted array
+    import numpy as np
+
+    groups, inverse = np.unique(keys, return_inverse=True)
+    order = np.lexsort((salaries, inverse))
+    ordered = salaries[order]
+
+    counts = np.bincount(inverse, minlength=len(groups))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    totals = np.add.reduceat(ordered, starts)
+
+    def percentile(q):
+        position = starts + (counts - 1) * (q / 100)
+        low = np.floor(position).astype(int)
+        high = np.ceil(position).astype(int)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    stats = {
+        "headcount": counts,
+        "total": totals,
+        "mean": totals / counts,
+        "median": percentile(50),
+        "min": ordered[starts],
+        "max": ordered[starts + counts - 1],
+    }
+    for q in PERCENTILES:
+        stats[f"p{q}"] = percentile(q)
+    return groups, stats
+
+
+def salary_report(db=database.DB_PATH):
+    # Rows for every department, every department/position and the whole company
+    import numpy as np
+
+    data = services.salary_rows(db)
+    if not data:
+        return []
+
+    departments = np.array([row[0] or "Unassigned" for row in data])
+    positions = np.array([f"{row[0] or 'Unassigned'} / {row[1] or 'Unassigned'}" for row in data])
+    salaries = np.array([row[2] for row in data], dtype=float)
+
+    rows = []
+    for level, keys in [("All", np.full(len(data), "All")), ("Department", departments), ("Position", positions)]:
+        groups, stats = group_stats(keys, salaries)
+        for i, group in enumerate(groups):
+            rows.append([level, str(group), int(stats["headcount"][i])] +
+                        [round(float(stats[name][i]), 2) for name in ["total", "mean", "median"]] +
+                        [round(float(stats[f"p{q}"][i]), 2) for q in PERCENTILES] +
+                        [round(float(stats["min"][i]), 2), round(float(stats["max"][i]), 2)])
+    return rows
+
+
+def show_salary_report(db=database.DB_PATH):
+    # Interactive all-department report used by the HR and Manager menus
+    rows = salary_report(db)
+    if not rows:
+        print(colored("\nNo salary data found.", "red"))
+        return
+
+    print(colored("\nSalary Analytics (all departments and positions, INR):", "green"))
+    print(tabulate(rows, headers=HEADERS, tablefmt="double_grid"))
+
+    departments = [row for row in rows if row[0] == "Department"]
+    chart = charts.bar_chart('salary_analytics', [row[1] for row in departments], [row[3] for row in departments],
+                             'Total Salary by Department', 'Department', 'Total Salary (INR)', rotation=45)
+    if chart:
+        print(colored(f"\nChart saved to {chart}", "green"))
@@ -0,0 +1,247 @@
+import math
+from datetime import datetime
+
+from tabulate import tabulate
+from termcolor import colored
+
+import database
+import services
+import profile_cache
+
+# Bulk salary revisions. A revision is an ordered list of rules; each rule raises salaries
+# by a percentage or a flat amount for employees matching its department, position and
+# minimum average rating. An employee gets the first rule that matches, and the whole
+# revision is one INSERT ... SELECT into Salary_History plus one UPDATE, in one transaction.
+#
+#   python3 salary_revision.py --rule "percent 8 department=IT" --rule "flat 2000 min_rating=4" [--apply]
+
+KINDS = ["percent", "flat"]
+PREVIEW_ROWS = 20
+
+
+def make_rule(kind, amount, department=None, position=None, min_rating=None):
+    if kind not in KINDS:
+        raise services.ServiceError(f"Unknown rule type {kind!r}; use percent or flat.")
+    try:
+        amount = float(amount)
+        min_rating = float(min_rating) if min_rating not in (None, "") else None
+    except (TypeError, ValueError):
+        raise services.ServiceError("Amount and minimum rating must be numbers.")
+    if not math.isfinite(amount):
+        raise services.ServiceError("Amount must be a finite number.")
+    if kind == "percent" and amount <= -100:
+        raise services.ServiceError("A percentage cut must be smaller than 100%.")
+    if min_rating is not None and not 1 <= min_rating <= 5:
+        raise services.ServiceError("Minimum rating must be between 1 and 5.")
+    return {"kind": kind, "amount": amount, "department": department or None,
+            "position": position or None, "min_rating": min_rating}
+
+
+def parse_rule(text):
+    # "percent 8 department=IT position=Developer min_rating=4"
+    parts = text.split()
+    if len(parts) < 2:
+        raise services.ServiceError(f"Rule {text!r} needs a type and an amount.")
+    filters = {}
+    for part in parts[2:]:
+        key, sep, value = part.partition("=")
+        if not sep or key not in ("department", "position", "min_rating"):
+            raise services.ServiceError(f"Unknown filter {part!r}; use department=, position= or min_rating=.")
+        filters[key] = value
+    return make_rule(parts[0], parts[1], **filters)
+
+
+def describe(rule):
+    change = f"+{rule['amount']:g}%" if rule["kind"] == "percent" else f"+{rule['amount']:g} INR"
+    filters = [rule["department"], rule["position"]]
+    if rule["min_rating"] is not None:
+        filters.append(f"rating >= {rule['min_rating']:g}")
+    return f"{change.replace('+-', '-')} ({', '.join(f for f in filters if f) or 'everyone'})"
+
+
+def rule_sql(rule):
+    # (match condition, params, new salary expression, params)
+    conditions, params = [], []
+    if rule["department"]:
+        conditions.append("department = ?")
+        params.append(rule["department"])
+    if rule["position"]:
+        conditions.append("position = ?")
+        params.append(rule["position"])
+    if rule["min_rating"] is not None:
+        # Mean rating from the per-employee summary, one row per rated employee
+        conditions.append("emp_id IN (SELECT emp_id FROM Performance_Summary WHERE rating_sum >= ? * ratings)")
+        params.append(rule["min_rating"])
+    if rule["kind"] == "percent":
+        expression = "ROUND(salary * (100 + ?) / 100.0, 2)"
+    else:
+        expression = "ROUND(salary + ?, 2)"
+    return " AND ".join(conditions) or "1", params, expression, [rule["amount"]]
+
+
+def revision_cases(rules):
+    # CASE expressions for the new salary and the (1-based) number of the first matching rule
+    new_salary, rule_number, salary_params, rule_params = [], [], [], []
+    for number, rule in enumerate(rules, start=1):
+        condition, condition_params, expression, expression_params = rule_sql(rule)
+        new_salary.append(f"WHEN {condition} THEN {expression}")
+        salary_params += condition_params + expression_params
+        rule_number.append(f"WHEN {condition} THEN {number}")
+        rule_params += condition_params
+    return (f"CASE {' '.join(new_salary)} END", salary_params), (f"CASE {' '.join(rule_number)} END", rule_params)
+
+
+def revision_sql(rules):
+    # Every matched employee with old salary, new salary and rule number
+    (new_salary, salary_params), (rule_number, rule_params) = revision_cases(rules)
+    sql = f"""
+        SELECT * FROM (
+            SELECT emp_id, name, department, position, salary AS old_salary,
+                   {new_salary} AS new_salary, {rule_number} AS rule
+            FROM Employee
+            WHERE salary IS NOT NULL
+        ) WHERE rule IS NOT NULL
+    """
+    return sql, salary_params + rule_params
+
+
+def summarize(conn, rules, select, params):
+    totals = conn.execute(f"""
+        SELECT rule, COUNT(*), SUM(old_salary), SUM(new_salary), MIN(new_salary)
+        FROM ({select}) GROUP BY rule ORDER BY rule
+    """, params).fetchall()
+    changes = conn.execute(f"""
+        SELECT emp_id, name, department, position, old_salary, new_salary
+        FROM ({select}) ORDER BY new_salary - old_salary DESC, emp_id LIMIT {PREVIEW_ROWS}
+    """, params).fetchall()
+
+    by_rule = [{"rule": describe(rules[number - 1]), "employees": count, "old_total": old, "new_total": new}
+               for number, count, old, new, _ in totals]
+    return {
+        "employees": sum(row[1] for row in totals),
+        "old_total": sum(row[2] for row in totals),
+        "new_total": sum(row[3] for row in totals),
+        "lowest_new_salary": min((row[4] for row in totals), default=None),
+        "rules": by_rule,
+        "changes": changes,
+        "applied": False,
+    }
+
+
+def revise_salaries(rules, changed_by=None, reason="Salary revision", dry_run=True, db=database.DB_PATH):
+    # Preview (dry_run) or apply a revision; returns totals overall and per rule plus the largest changes
+    if not rules:
+        raise services.ServiceError("Add at least one rule.")
+    select, params = revision_sql(rules)
+
+    if dry_run:
+        conn = database.connect(db)
+        try:
+            return summarize(conn, rules, select, params)
+        finally:
+            conn.close()
+
+    def work(conn):
+        result = summarize(conn, rules, select, params)
+        if result["lowest_new_salary"] is not None and result["lowest_new_salary"] <= 0:
+            raise services.ServiceError("Revision would leave a salary at or below zero; nothing was changed.")
+
+        conn.execute(f"""
+            INSERT INTO Salary_History (emp_id, old_salary, new_salary, changed_at, changed_by, reason)
+            SELECT emp_id, old_salary, new_salary, ?, ?, ? FROM ({select}) WHERE new_salary IS NOT old_salary
+        """, [datetime.now().strftime("%Y-%m-%d %H:%M:%S"), changed_by, reason] + params)
+        (new_salary, salary_params), (rule_number, rule_params) = revision_cases(rules)
+        conn.execute(f"UPDATE Employee SET salary = {new_salary} WHERE salary IS NOT NULL AND {rule_number} IS NOT NULL",
+                     salary_params + rule_params)
+        database.bump_versions(conn, "Employee")
+        result["applied"] = True
+        return result
+
+    result = database.run_in_transaction(work, db)
+    profile_cache.invalidate(db)
+    return result
+
+
+def show_revision(result):
+    print(tabulate([[r["rule"], r["employees"], r["old_total"], r["new_total"], r["new_total"] - r["old_total"]]
+                    for r in result["rules"]],
+                   headers=["Rule", "Employees", "Current Total (INR)", "New Total (INR)", "Change (INR)"],
+                   tablefmt="double_grid", floatfmt=".2f"))
+    print(colored(f"\n{result['employees']} employee(s): {result['old_total']:.2f} -> {result['new_total']:.2f} INR "
+                  f"({result['new_total'] - result['old_total']:+.2f})", "yellow"))
+    if result["changes"]:
+        print(colored(f"\nLargest changes (up to {PREVIEW_ROWS}):", "cyan"))
+        print(tabulate(result["changes"], headers=["Emp ID", "Name", "Department", "Position", "Current Salary", "New Salary"],
+                       tablefmt="double_grid"))
+
+
+def run_revision_menu(changed_by, db=database.DB_PATH):
+    # Interactive revision used by the HR and Manager menus: collect rules, preview, confirm, apply
+    print(colored("\nBulk Salary Revision", "cyan", attrs=['bold']))
+    print("Rules are checked in order; each employee gets the first rule that matches.")
+
+    rules = []
+    while True:
+        kind = input("\nRule type - (p)ercentage or (f)lat amount: ").strip().lower()
+        kind = {"p": "percent", "f": "flat"}.get(kind[:1])
+        if kind is None:
+            print(colored("\nInvalid rule type!", "red"))
+            continue
+        amount = input("Percentage to add (e.g. 8): " if kind == "percent" else "Amount to add in INR (e.g. 2000): ").strip()
+        department = input("Department (Enter for all): ").strip()
+        position = input("Position (Enter for all): ").strip()
+        min_rating = input("Minimum average rating 1-5 (Enter for any): ").strip()
+        try:
+            rules.append(make_rule(kind, amount, department, position, min_rating))
+        except services.ServiceError as e:
+            print(colored(f"\n{e}", "red"))
+            continue
+        if input("Add another rule? (yes/no): ").strip().lower() != "yes":
+            break
+
+    try:
+        result = revise_salaries(rules, dry_run=True, db=db)
+    except services.ServiceError as e:
+        print(colored(f"\n{e}", "red"))
+        return
+    if not result["employees"]:
+        print(colored("\nNo employees match these rules.", "yellow"))
+        return
+
+    print(colored("\nPreview (nothing has been changed yet):", "green"))
+    show_revision(result)
+
+    if input("\nApply this revision? (yes/no): ").strip().lower() != "yes":
+        print(colored("\nRevision cancelled.", "yellow"))
+        return
+    reason = input("Reason for the audit trail (Enter for 'Salary revision'): ").strip() or "Salary revision"
+    try:
+        result = revise_salaries(rules, changed_by, reason, dry_run=False, db=db)
+        print(colored(f"\nSalaries revised for {result['employees']} employee(s)!", "green"))
+    except services.ServiceError as e:
+        print(colored(f"\n{e}", "red"))
+
+
+if __name__ == "__main__":
+    # python3 salary_revision.py --rule "percent 8 department=IT" [--rule ...] [--apply] [--reason TEXT] [--db ems_data.db]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Preview or apply a bulk salary revision")
+    parser.add_argument("--rule", action="append", required=True,
+                        help='"percent|flat AMOUNT [department=X] [position=Y] [min_rating=N]"; first match wins')
+    parser.add_argument("--apply", action="store_true", help="Apply the revision (default is a dry run)")
+    parser.add_argument("--reason", default="Salary revision")
+    parser.add_argument("--by", default=None, help="Name recorded in Salary_History")
+    parser.add_argument("--db", default=database.DB_PATH)
+    args = parser.parse_args()
+
+    try:
+        rules = [parse_rule(text) for text in args.rule]
+        result = revise_salaries(rules, args.by, args.reason, dry_run=not args.apply, db=args.db)
+    except services.ServiceError as e:
+        parser.error(str(e))
+    if not result["employees"]:
+        print(colored("No employees match these rules.", "yellow"))
+        raise SystemExit(0)
+    show_revision(result)
+    print(colored("\nRevision applied." if result["applied"] else "\nDry run only; pass --apply to change salaries.", "green"))
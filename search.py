@@ -0,0 +1,48 @@
+import re
+
+SEARCH_LIMIT = 50
+
+# Column weights for ranking: name, email, department, position, address
+RANK_WEIGHTS = (10.0, 5.0, 2.0, 2.0, 1.0)
+
+SEARCH_COLUMNS = ["name", "email", "department", "position", "address"]
+
+
+def has_search_index(conn):
+    cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Employee_fts'")
+    return cursor.fetchone() is not None
+
+
+def match_query(text):
+    # Every word must match, each as a prefix: "ami sha" -> "ami"* AND "sha"*
+    words = re.findall(r"\w+", text)
+    return " AND ".join(f'"{word}"*' for word in words)
+
+
+def search_employees(conn, text, limit=SEARCH_LIMIT):
+    # Ranked full-text search over name, email, department, position and address
+    query = match_query(text)
+    if not query:
+        return []
+
+    if has_search_index(conn):
+        weights = ", ".join(str(weight) for weight in RANK_WEIGHTS)
+        cursor = conn.execute(f"""
+            SELECT E.*
+            FROM Employee_fts
+            JOIN Employee E ON E.emp_id = Employee_fts.rowid
+            WHERE Employee_fts MATCH ?
+            ORDER BY bm25(Employee_fts, {weights})
+            LIMIT ?
+        """, (query, limit))
+        return cursor.fetchall()
+
+    # Fallback without FTS5: every word must appear in one of the columns
+    conditions = []
+    params = []
+    for word in re.findall(r"\w+", text):
+        conditions.append("(" + " OR ".join(f"{column} LIKE ?" for column in SEARCH_COLUMNS) + ")")
+        params.extend(["%" + word + "%"] * len(SEARCH_COLUMNS))
+    cursor = conn.execute(f"SELECT * FROM Employee WHERE {' AND '.join(conditions)} ORDER BY emp_id LIMIT ?",
+                          params + [limit])
+    return cursor.fetchall()
@@ -0,0 +1,302 @@
+import re
+import json
+import logging
+import sqlite3
+import asyncio
+from urllib.parse import parse_qsl
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import database
+import services
+import leave_calendar
+import dashboard
+import profile_cache
+
+# Local JSON API over the service layer, so many clerks and kiosks can share one process.
+# Requests are parsed on the event loop; every SQLite call runs on a bounded thread pool
+# sized to the connection pool, so the loop never blocks on the database.
+
+HOST = "127.0.0.1"
+PORT = 8080
+WORKERS = database.POOL_SIZE
+KEEPALIVE_TIMEOUT = 15
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+log = logging.getLogger("ems.server")
+
+LEAVE_FIELDS = ["leave_type", "start_date", "end_date", "status"]
+PENDING_FIELDS = ["leave_id", "name", "leave_type", "start_date", "end_date", "status"]
+CALENDAR_FIELDS = ["date", "absent", "names"]
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# Endpoints: each takes (db, path match, JSON body over the query parameters) and returns (status, payload);
+# they run on the thread pool
+
+def require_employee(db, emp_id):
+    if not services.employee_exists(emp_id, db):
+        raise HTTPError(HTTPStatus.NOT_FOUND, "Employee not found.")
+
+
+def check_in(db, match, body):
+    require_employee(db, match["emp_id"])
+    day, time = services.check_in(match["emp_id"], db=db)
+    return HTTPStatus.CREATED, {"emp_id": int(match["emp_id"]), "date": day, "check_in_time": time}
+
+
+def check_out(db, match, body):
+    total_hours, status = services.check_out(match["emp_id"], db=db)
+    return HTTPStatus.OK, {"emp_id": int(match["emp_id"]), "total_work_hours": round(total_hours, 2), "type": status}
+
+
+def list_leaves(db, match, body):
+    leaves = services.list_leaves(match["emp_id"], db)
+    return HTTPStatus.OK, [dict(zip(LEAVE_FIELDS, leave)) for leave in leaves]
+
+
+def apply_leave(db, match, body):
+    leave_id = services.apply_leave(match["emp_id"], body.get("leave_type"), body.get("start_date"), body.get("end_date"), db=db)
+    return HTTPStatus.CREATED, {"leave_id": leave_id, "status": "PENDING"}
+
+
+def get_profile(db, match, body):
+    profile = services.get_profile(match["emp_id"], db)
+    if profile is None:
+        raise HTTPError(HTTPStatus.NOT_FOUND, "Employee not found.")
+    return HTTPStatus.OK, profile
+
+
+def update_profile(db, match, body):
+    invalid = sorted(field for field, value in body.items() if isinstance(value, bool) or not isinstance(value, (str, int, float)))
+    if invalid:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Fields must be strings or numbers: {', '.join(invalid)}")
+    require_employee(db, match["emp_id"])
+    services.update_employee_fields(match["emp_id"], body, services.SELF_SERVICE_FIELDS, db)
+    return get_profile(db, match, body)
+
+
+def get_salary(db, match, body):
+    salary = services.get_salary(match["emp_id"], db)
+    if salary is None:
+        raise HTTPError(HTTPStatus.NOT_FOUND, "Employee not found.")
+    return HTTPStatus.OK, {"emp_id": int(match["emp_id"]), "salary": salary}
+
+
+def pending_leaves(db, match, body):
+    return HTTPStatus.OK, [dict(zip(PENDING_FIELDS, leave)) for leave in services.pending_leaves(db)]
+
+
+def absence_calendar(db, match, body):
+    dates = leave_calendar.parse_range(body.get("start"), body.get("end"))
+    if not dates:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "\"start\" and \"end\" must be YYYY-MM-DD dates with start <= end.")
+    names = str(body.get("names", "true")).lower() not in ("0", "false", "no")
+    conn = database.connect(db)
+    try:
+        calendar = leave_calendar.absence_calendar(conn, *dates, body.get("department") or None, names)
+    finally:
+        conn.close()
+    fields = CALENDAR_FIELDS if names else CALENDAR_FIELDS[:2]
+    return HTTPStatus.OK, [dict(zip(fields, day)) for day in calendar]
+
+
+def get_dashboard(db, match, body):
+    return HTTPStatus.OK, {**dashboard.load_dashboard(db), "cache": dashboard.cache_stats()}
+
+
+def cache_stats(db, match, body):
+    return HTTPStatus.OK, {"profiles": profile_cache.stats(), "dashboard": dashboard.cache_stats()}
+
+
+def decide_leave(db, match, body):
+    if not isinstance(body.get("approve"), bool):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must contain \"approve\": true or false.")
+    status = services.decide_leave(match["leave_id"], body["approve"], db)
+    return HTTPStatus.OK, {"leave_id": int(match["leave_id"]), "status": status}
+
+
+def decide_leaves(db, match, body):
+    # {"approve": true, "ids": [..], "ranges": [[low, high], ..], "department", "leave_type", "start_date", "end_date"}
+    if not isinstance(body.get("approve"), bool):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must contain \"approve\": true or false.")
+    try:
+        ids = [int(leave_id) for leave_id in body.get("ids", [])]
+        ranges = [(int(low), int(high)) for low, high in body.get("ranges", [])]
+    except (TypeError, ValueError):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "\"ids\" must be integers and \"ranges\" [low, high] pairs.")
+    filters = {key: body.get(key) for key in ["department", "leave_type", "start_date", "end_date"]}
+    if not ids and not ranges and not any(filters.values()):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Select leaves with \"ids\", \"ranges\" or at least one filter.")
+    return HTTPStatus.OK, services.decide_leaves(body["approve"], ids, ranges, db=db, **filters)
+
+
+ROUTES = [
+    ("POST", r"/employees/(?P<emp_id>\d+)/check-in", check_in),
+    ("POST", r"/employees/(?P<emp_id>\d+)/check-out", check_out),
+    ("GET", r"/employees/(?P<emp_id>\d+)/leaves", list_leaves),
+    ("POST", r"/employees/(?P<emp_id>\d+)/leaves", apply_leave),
+    ("GET", r"/employees/(?P<emp_id>\d+)/profile", get_profile),
+    ("PATCH", r"/employees/(?P<emp_id>\d+)/profile", update_profile),
+    ("GET", r"/employees/(?P<emp_id>\d+)/salary", get_salary),
+    ("GET", r"/leaves/pending", pending_leaves),
+    ("GET", r"/leaves/calendar", absence_calendar),
+    ("GET", r"/dashboard", get_dashboard),
+    ("GET", r"/cache/stats", cache_stats),
+    ("POST", r"/leaves/(?P<leave_id>\d+)/decision", decide_leave),
+    ("POST", r"/leaves/decisions", decide_leaves),
+]
+ROUTES = [(method, re.compile(pattern + r"/?"), handler) for method, pattern, handler in ROUTES]
+
+
+def route(method, path):
+    allowed = False
+    for route_method, pattern, handler in ROUTES:
+        match = pattern.fullmatch(path)
+        if match:
+            if route_method == method:
+                return handler, match
+            allowed = True
+    if allowed:
+        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+    raise HTTPError(HTTPStatus.NOT_FOUND, f"No endpoint at {path}")
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# HTTP/1.1 with keep-alive
+
+class Server:
+    def __init__(self, db=database.DB_PATH, workers=WORKERS):
+        self.db = db
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ems-db")
+
+    async def read_request(self, reader):
+        # Returns (method, path, query, version, headers, body), or None when the client has gone away
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            return None
+        except asyncio.LimitOverrunError:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Headers too large.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        length = headers.get("content-length", "0")
+        if not length.isdigit() or int(length) > MAX_BODY_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Invalid or oversized body.")
+        body = await reader.readexactly(int(length)) if int(length) else b""
+        path, _, query = target.partition("?")
+        return method.upper(), path, query, version, headers, body
+
+    async def dispatch(self, method, path, query, body):
+        handler, match = route(method, path)
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON.")
+        if not isinstance(data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object.")
+        data = {**dict(parse_qsl(query)), **data}
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, handler, self.db, match, data)
+        except services.ServiceError as error:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(error))
+        except sqlite3.OperationalError as error:
+            status = HTTPStatus.SERVICE_UNAVAILABLE if database.is_busy(error) else HTTPStatus.INTERNAL_SERVER_ERROR
+            raise HTTPError(status, str(error))
+        except HTTPError:
+            raise
+        except Exception:
+            # A bug in a handler still gets an answer; the connection stays usable
+            log.exception("Unhandled error in %s %s", method, path)
+            raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error.")
+
+    def response(self, status, payload, keep_alive):
+        body = json.dumps(payload, default=str).encode()
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        return head.encode() + body
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self.read_request(reader)
+                    if request is None:
+                        break
+                    method, path, query, version, headers, body = request
+
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                    status, payload = await self.dispatch(method, path, query, body)
+                except HTTPError as error:
+                    status, payload = error.status, {"error": str(error)}
+                except asyncio.IncompleteReadError:
+                    break
+
+                writer.write(self.response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=HOST, port=PORT, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        if ready:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        database.close_all()
+
+
+if __name__ == "__main__":
+    # python3 server.py [--host 127.0.0.1] [--port 8080] [--db ems_data.db] [--workers 5] [--no-profile-cache]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON API for attendance, leaves and profiles")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--db", default=database.DB_PATH)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--no-profile-cache", action="store_true", help="Read every profile from the database")
+    parser.add_argument("--profile-cache-size", type=int, help=f"Most profiles cached (default {profile_cache.MAX_ENTRIES})")
+    parser.add_argument("--profile-cache-ttl", type=float, help=f"Seconds a cached profile is served (default {profile_cache.TTL_SECONDS:g})")
+    args = parser.parse_args()
+    profile_cache.configure(False if args.no_profile_cache else None, args.profile_cache_size, args.profile_cache_ttl)
+
+    app = Server(args.db, args.workers)
+    ready = lambda server: print(f"Serving on http://{args.host}:{server.sockets[0].getsockname()[1]}", flush=True)
+    try:
+        asyncio.run(app.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        app.close()
@@ -0,0 +1,593 @@
+import json
+import math
+import sqlite3
+from datetime import date, datetime
+
+import database
+import leave_balance
+import leave_overlaps
+import profile_cache
+import search
+import validators
+
+# Plain functions behind the Employee, HR and Manager menus. They take arguments,
+# return results and raise ServiceError with a user-facing message when a request
+# is invalid, so the same operations can run from menus, scripts, servers or benchmarks.
+
+LEAVE_TYPES = ["Sick Leave", "Vacation Leave", "Casual Leave"]
+
+PROFILE_FIELDS = ["age", "gender", "address", "department", "position", "salary", "email", "contactnumber", "joining_date", "degree"]
+SELF_SERVICE_FIELDS = ["age", "address", "contactnumber", "degree"]
+HR_EDITABLE_FIELDS = ["password", "age", "email", "contactnumber", "degree"]
+
+
+class ServiceError(Exception):
+    pass
+
+
+def fetch_one(sql, params=(), db=database.DB_PATH):
+    conn = database.connect(db)
+    try:
+        return conn.execute(sql, params).fetchone()
+    finally:
+        conn.close()
+
+
+def fetch_all(sql, params=(), db=database.DB_PATH):
+    conn = database.connect(db)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def positive_amount(amount):
+    # Accepts numbers or digit strings, as the menus do
+    if isinstance(amount, str):
+        amount = amount.strip()
+        if not amount.isdigit():
+            return None
+        amount = int(amount)
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)) or not math.isfinite(amount) or amount <= 0:
+        return None
+    return amount
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# Login
+
+def authenticate_employee(emp_id, password, db=database.DB_PATH):
+    return fetch_one("SELECT emp_id, name FROM Employee WHERE emp_id = ? AND password = ?", (emp_id, password), db)
+
+
+def authenticate_hr(hr_id, password, db=database.DB_PATH):
+    return fetch_one("SELECT hr_id, name FROM HR WHERE hr_id = ? AND password = ?", (hr_id, password), db)
+
+
+def authenticate_manager(manager_id, password, db=database.DB_PATH):
+    return fetch_one("SELECT id, name FROM Manager WHERE id = ? AND password = ?", (manager_id, password), db)
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# Attendance
+
+def seconds_of_day(hh_mm_ss):
+    hours, minutes, seconds = hh_mm_ss.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+def work_hours(check_in_time, check_out_time):
+    # Hours between two HH:MM:SS times and the day type they earn; a check-out before the
+    # check-in wraps past midnight as timedelta.seconds did. Parsed by hand: strptime
+    # dominated bulk attendance loads
+    total_hours = (seconds_of_day(check_out_time) - seconds_of_day(check_in_time)) % 86400 / 3600
+    return total_hours, "Full Day" if total_hours >= 8 else "Half Day"
+
+
+def check_in(emp_id, at=None, db=database.DB_PATH):
+    at = at or datetime.now()
+    today_date, now_time = at.date().isoformat(), at.strftime("%H:%M:%S")
+
+    # One short write transaction, retried while the database is busy
+    def work(conn):
+        conn.execute(
+            "INSERT INTO Employee_Attendance (emp_id, date, check_in_time) VALUES (?, ?, ?)",
+            (emp_id, today_date, now_time)
+        )
+        database.bump_versions(conn, "Employee_Attendance")
+
+    database.run_in_transaction(work, db)
+    return today_date, now_time
+
+
+def check_out(emp_id, at=None, db=database.DB_PATH):
+    at = at or datetime.now()
+    today_date, now_time = at.date().isoformat(), at.strftime("%H:%M:%S")
+
+    def work(conn):
+        row = conn.execute(
+            "SELECT check_in_time FROM Employee_Attendance WHERE emp_id = ? AND date = ?",
+            (emp_id, today_date)
+        ).fetchone()
+        if not row:
+            return None
+
+        total_hours, status = work_hours(row[0], now_time)
+        conn.execute(
+            "UPDATE Employee_Attendance SET check_out_time = ?, total_work_hours = ?, type = ? WHERE emp_id = ? AND date = ?",
+            (now_time, total_hours, status, emp_id, today_date)
+        )
+        database.bump_versions(conn, "Employee_Attendance")
+        return total_hours, status
+
+    result = database.run_in_transaction(work, db)
+    if result is None:
+        raise ServiceError("You must check-in first!")
+    return result
+
+
+def attendance_for_date(day, db=database.DB_PATH):
+    return fetch_all("""
+        SELECT emp_id, SUM(total_work_hours)
+        FROM Employee_Attendance
+        WHERE date = ?
+        GROUP BY emp_id
+    """, (day,), db)
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# Leaves
+
+def apply_leave(emp_id, leave_type, start_date, end_date, today=None, db=database.DB_PATH):
+    if leave_type not in LEAVE_TYPES:
+        raise ServiceError("Invalid leave type!")
+
+    try:
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    except (TypeError, ValueError):
+        raise ServiceError("Invalid dates! Use the YYYY-MM-DD format.")
+    if start < (today or date.today()) or end < start:
+        raise ServiceError("Invalid dates! Start date must be after today and end date after start date.")
+    if end.year > start.year + 1:
+        raise ServiceError("Invalid dates! A leave can span at most two calendar years; apply for the rest separately.")
+
+    def work(conn):
+        # Checked inside the write transaction so two concurrent requests cannot both pass
+        overlap = leave_overlaps.find_overlap(conn, emp_id, start.isoformat(), end.isoformat())
+        if overlap:
+            leave_id, other_type, other_start, other_end, status = overlap
+            raise ServiceError(f"Leave overlaps your {status} {other_type} (Leave ID {leave_id}, {other_start} to {other_end}).")
+        for year, days in leave_balance.days_by_year(start, end).items():
+            available = leave_balance.available_days(conn, emp_id, leave_type, year)
+            if available is not None and days > available:
+                raise ServiceError(f"Insufficient {leave_type} balance for {year}: {max(available, 0)} day(s) left, {days} requested.")
+
+        cursor = conn.execute(
+            "INSERT INTO Leaves (emp_id, leavetype, startdate, enddate, status) VALUES (?, ?, ?, ?, ?)",
+            (emp_id, leave_type, start.isoformat(), end.isoformat(), "PENDING")
+        )
+        database.bump_versions(conn, "Leaves")
+        return cursor.lastrowid
+
+    return database.run_in_transaction(work, db)
+
+
+def leave_balances(emp_id, year=None, db=database.DB_PATH):
+    # [leave type, entitlement, used, pending, available] for each leave type
+    conn = database.connect(db)
+    try:
+        return leave_balance.balances(conn, emp_id, year or date.today().year)
+    finally:
+        conn.close()
+
+
+def list_leaves(emp_id, db=database.DB_PATH):
+    return fetch_all("SELECT leavetype, startdate, enddate, status FROM Leaves WHERE emp_id = ?", (emp_id,), db)
+
+
+def pending_leaves(db=database.DB_PATH):
+    # CROSS JOIN keeps Leaves first: the queue is a few pending rows, but sqlite_stat1 only
+    # knows the average rows per status, which would make a walk over Employee look cheaper
+    return fetch_all("""
+        SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
+        FROM Leaves L
+        CROSS JOIN Employee E ON L.emp_id = E.emp_id
+        WHERE L.status = 'PENDING'
+    """, (), db)
+
+
+def decide_leave(leave_id, approve, db=database.DB_PATH):
+    new_status = "APPROVED" if approve else "REJECTED"
+
+    def work(conn):
+        cursor = conn.execute("UPDATE Leaves SET status = ? WHERE leave_id = ? AND status = 'PENDING'", (new_status, leave_id))
+        if cursor.rowcount:
+            database.bump_versions(conn, "Leaves")
+        return cursor.rowcount
+
+    if not database.run_in_transaction(work, db):
+        raise ServiceError("Invalid Leave ID or Leave is not pending.")
+    return new_status
+
+
+def parse_selection(text):
+    # "12, 15-20 33" -> ([12, 33], [(15, 20)])
+    ids, ranges = set(), []
+    for token in text.replace(",", " ").split():
+        low, dash, high = token.partition("-")
+        if low.isdigit() and (not dash or high.isdigit()):
+            if dash:
+                ranges.append((min(int(low), int(high)), max(int(low), int(high))))
+            else:
+                ids.add(int(low))
+        else:
+            raise ServiceError(f"Invalid Leave ID or range: {token}")
+    return sorted(ids), ranges
+
+
+def decide_leaves(approve, ids=(), ranges=(), department=None, leave_type=None, start_date=None, end_date=None,
+                  db=database.DB_PATH):
+    # Approve or reject every pending leave in the selection (IDs and ID ranges; all leaves if neither)
+    # that matches the filters, with one UPDATE in one transaction. The date window keeps leaves
+    # overlapping [start_date, end_date].
+    new_status = "APPROVED" if approve else "REJECTED"
+    ids = sorted(set(ids))
+
+    selection = []
+    params = []
+    if ids:
+        selection.append("leave_id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(ids))
+    for low, high in ranges:
+        selection.append("leave_id BETWEEN ? AND ?")
+        params += [low, high]
+    selected = "(" + " OR ".join(selection) + ")" if selection else "1"
+
+    filters = []
+    filter_params = []
+    if department:
+        filters.append("emp_id IN (SELECT emp_id FROM Employee WHERE department = ?)")
+        filter_params.append(department)
+    if leave_type:
+        filters.append("leavetype = ?")
+        filter_params.append(leave_type)
+    if start_date:
+        filters.append("enddate >= ?")
+        filter_params.append(start_date)
+    if end_date:
+        filters.append("startdate <= ?")
+        filter_params.append(end_date)
+    matching = " AND ".join(filters) or "1"
+
+    def work(conn):
+        already_decided = pending = missing = 0
+        if selection:
+            already_decided, pending = conn.execute(
+                f"SELECT COALESCE(SUM(status <> 'PENDING'), 0), COALESCE(SUM(status = 'PENDING'), 0) FROM Leaves WHERE {selected}",
+                params
+            ).fetchone()
+        if ids:
+            missing = conn.execute(
+                "SELECT COUNT(*) FROM json_each(?) WHERE value NOT IN (SELECT leave_id FROM Leaves)", (json.dumps(ids),)
+            ).fetchone()[0]
+
+        processed = conn.execute(
+            f"UPDATE Leaves SET status = ? WHERE status = 'PENDING' AND {selected} AND {matching}",
+            [new_status] + params + filter_params
+        ).rowcount
+        if processed:
+            database.bump_versions(conn, "Leaves")
+        # Skipped: pending leaves in the selection the filters left out, and IDs that do not exist
+        skipped = (pending - processed if selection else 0) + missing
+        return {"status": new_status, "processed": processed, "skipped": skipped, "already_decided": already_decided}
+
+    return database.run_in_transaction(work, db)
+
+
+def leave_history(emp_id, db=database.DB_PATH):
+    return fetch_all("""
+        SELECT L.leave_id, E.name, L.leavetype, L.startdate, L.enddate, L.status
+        FROM Leaves L
+        JOIN Employee E ON L.emp_id = E.emp_id
+        WHERE L.emp_id = ?
+    """, (emp_id,), db)
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# Employee records
+
+def get_employee(emp_id, db=database.DB_PATH):
+    return fetch_one("SELECT * FROM Employee WHERE emp_id = ?", (emp_id,), db)
+
+
+def employee_exists(emp_id, db=database.DB_PATH):
+    return fetch_one("SELECT emp_id FROM Employee WHERE emp_id = ?", (emp_id,), db) is not None
+
+
+def get_profile(emp_id, db=database.DB_PATH):
+    # Read through the profile cache; every write below invalidates the rows it changed
+    def load():
+        row = fetch_one(f"SELECT {', '.join(PROFILE_FIELDS)} FROM Employee WHERE emp_id = ?", (emp_id,), db)
+        return dict(zip(PROFILE_FIELDS, row)) if row else None
+
+    return profile_cache.get(db, emp_id, load)
+
+
+def employee_name(emp_id, db=database.DB_PATH):
+    row = fetch_one("SELECT name FROM Employee WHERE emp_id = ?", (emp_id,), db)
+    return row[0] if row else None
+
+
+def get_salary(emp_id, db=database.DB_PATH):
+    profile = get_profile(emp_id, db)
+    return profile["salary"] if profile else None
+
+
+def update_employee_fields(emp_id, updates, allowed, db=database.DB_PATH):
+    unknown = set(updates) - set(allowed)
+    if unknown:
+        raise ServiceError(f"Cannot update: {', '.join(sorted(unknown))}")
+    if not updates:
+        return 0
+
+    query = "UPDATE Employee SET " + ", ".join(f"{col} = ?" for col in updates) + " WHERE emp_id = ?"
+
+    def work(conn):
+        updated = conn.execute(query, list(updates.values()) + [emp_id]).rowcount
+        if updated:
+            database.bump_versions(conn, "Employee")
+        return updated
+
+    try:
+        updated = database.run_in_transaction(work, db)
+    except sqlite3.IntegrityError:
+        raise ServiceError("Email or contact number already exists!")
+    profile_cache.invalidate(db, [emp_id])
+    return updated
+
+
+def update_profile(emp_id, db=database.DB_PATH, **updates):
+    # Self-service profile changes (age, address, contact number, degree)
+    return update_employee_fields(emp_id, updates, SELF_SERVICE_FIELDS, db)
+
+
+def update_employee(emp_id, db=database.DB_PATH, **updates):
+    # HR changes (password, age, email, contact number, degree), validated like the HR menu
+    checks = {
+        "password": (validators.valid_password, "Invalid Password! Please enter at least 4 characters."),
+        "age": (validators.valid_age, "Invalid Age! Please enter a positive number."),
+        "email": (validators.valid_email, "Invalid Email! Please enter a valid email address."),
+        "contactnumber": (validators.valid_contact, "Invalid Contact Number! Please enter exactly 10 digits."),
+    }
+    for field, value in updates.items():
+        if field in checks and not checks[field][0](str(value)):
+            raise ServiceError(checks[field][1])
+    return update_employee_fields(emp_id, updates, HR_EDITABLE_FIELDS, db)
+
+
+def add_employee(name, password, age, gender, address, department, position, salary, email, contactnumber,
+                 degree="", joining_date=None, db=database.DB_PATH):
+    age, salary, gender = str(age), str(salary), str(gender).capitalize()
+    checks = [
+        (validators.valid_name(name), "Invalid Name! Please enter at least 5 characters with only letters and spaces."),
+        (validators.valid_password(password), "Invalid Password! Please enter at least 4 characters."),
+        (validators.valid_age(age), "Invalid Age! Please enter a positive number."),
+        (validators.valid_gender(gender), "Invalid Gender! Please enter Male or Female."),
+        (validators.valid_department(department), "Invalid Department! Please select from the available options."),
+        (validators.valid_position(department, position), "Invalid Position! Please select from the available options."),
+        (validators.valid_salary(salary), "Invalid Salary! Please enter a positive number."),
+        (validators.valid_email(email), "Invalid Email! Please enter a valid email address."),
+        (validators.valid_contact(contactnumber), "Invalid Contact Number! Please enter exactly 10 digits."),
+    ]
+    for ok, message in checks:
+        if not ok:
+            raise ServiceError(message)
+
+    def work(conn):
+        cursor = conn.execute("""
+            INSERT INTO Employee (name, password, age, gender, address, department, position, salary, email, contactnumber, joining_date, degree)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (name, password, age, gender, address, department, position, salary, email, contactnumber,
+              joining_date or str(date.today()), degree))
+        database.bump_versions(conn, "Employee")
+        return cursor.lastrowid
+
+    try:
+        return database.run_in_transaction(work, db)
+    except sqlite3.IntegrityError:
+        raise ServiceError("Email or contact number already exists!")
+
+
+def delete_employee(emp_id, db=database.DB_PATH):
+    def work(conn):
+        deleted = conn.execute("DELETE FROM Employee WHERE emp_id = ?", (emp_id,)).rowcount
+        if deleted:
+            database.bump_versions(conn, "Employee")
+        return deleted
+
+    if not database.run_in_transaction(work, db):
+        raise ServiceError("Invalid Employee ID!")
+    profile_cache.invalidate(db, [emp_id])
+
+
+def search_employees(text, db=database.DB_PATH):
+    conn = database.connect(db)
+    try:
+        return search.search_employees(conn, text)
+    finally:
+        conn.close()
+
+
+def list_departments(limit=5, db=database.DB_PATH):
+    return fetch_all("SELECT DISTINCT department FROM Employee LIMIT ?", (limit,), db)
+
+
+def department_salary_total(department, db=database.DB_PATH):
+    row = fetch_one("SELECT SUM(salary) FROM Employee WHERE department = ?", (department,), db)
+    return row[0] if row else None
+
+
+def salary_rows(db=database.DB_PATH):
+    # One pass over Employee and HR; HR staff are reported as their own department
+    return fetch_all("""
+        SELECT department, position, salary FROM Employee WHERE salary IS NOT NULL
+        UNION ALL
+        SELECT 'HR', 'HR', salary FROM HR WHERE salary IS NOT NULL
+    """, (), db)
+
+
+def record_salary_change(conn, emp_id, old_salary, new_salary, changed_by=None, reason=None):
+    conn.execute(
+        "INSERT INTO Salary_History (emp_id, old_salary, new_salary, changed_at, changed_by, reason) VALUES (?, ?, ?, ?, ?, ?)",
+        (emp_id, old_salary, new_salary, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), changed_by, reason)
+    )
+
+
+def set_salary(emp_id, amount, db=database.DB_PATH, changed_by=None):
+    amount = positive_amount(amount)
+    if amount is None:
+        raise ServiceError("Invalid salary amount! Please enter a positive number.")
+
+    def work(conn):
+        row = conn.execute("SELECT salary FROM Employee WHERE emp_id = ?", (emp_id,)).fetchone()
+        if not row:
+            raise ServiceError("Invalid Employee ID!")
+        conn.execute("UPDATE Employee SET salary = ? WHERE emp_id = ?", (amount, emp_id))
+        database.bump_versions(conn, "Employee")
+        record_salary_change(conn, emp_id, row[0], amount, changed_by, "Salary update")
+
+    database.run_in_transaction(work, db)
+    profile_cache.invalidate(db, [emp_id])
+    return amount
+
+
+def promote_employee(emp_id, new_salary, db=database.DB_PATH, changed_by=None):
+    # A promotion must raise the salary
+    new_salary = positive_amount(new_salary)
+    if new_salary is None:
+        raise ServiceError("Invalid salary amount. Please enter a valid number.")
+
+    def work(conn):
+        row = conn.execute("SELECT salary FROM Employee WHERE emp_id = ?", (emp_id,)).fetchone()
+        if not row:
+            raise ServiceError("Invalid Employee ID. Please select from the list.")
+        if new_salary <= (row[0] or 0):
+            raise ServiceError("New salary must be greater than the current salary!")
+        conn.execute("UPDATE Employee SET salary = ? WHERE emp_id = ?", (new_salary, emp_id))
+        database.bump_versions(conn, "Employee")
+        record_salary_change(conn, emp_id, row[0], new_salary, changed_by, "Promotion")
+
+    database.run_in_transaction(work, db)
+    profile_cache.invalidate(db, [emp_id])
+    return new_salary
+
+
+def rate_employee(emp_id, hr_name, rating, comments="", db=database.DB_PATH):
+    if str(rating) not in ["1", "2", "3", "4", "5"]:
+        raise ServiceError("Invalid rating! Please enter a value between 1-5.")
+    if not employee_exists(emp_id, db):
+        raise ServiceError("Invalid Employee ID!")
+
+    def work(conn):
+        cursor = conn.execute("""
+            INSERT INTO Employee_performance (employee_id, ratedbyhr_name, rating, comments)
+            VALUES (?, ?, ?, ?)
+        """, (emp_id, hr_name, int(rating), comments))
+        return cursor.lastrowid
+
+    return database.run_in_transaction(work, db)
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+# HR staff (Manager)
+
+def list_hrs(db=database.DB_PATH):
+    return fetch_all("SELECT hr_id, name FROM HR", (), db)
+
+
+def hr_salaries(db=database.DB_PATH):
+    return fetch_all("SELECT hr_id, name, salary FROM HR", (), db)
+
+
+def hr_exists(hr_id, db=database.DB_PATH):
+    return fetch_one("SELECT hr_id FROM HR WHERE hr_id = ?", (hr_id,), db) is not None
+
+
+def add_hr(name, email, password, contactnumber, salary, degree="", db=database.DB_PATH):
+    if not name.replace(" ", "").isalpha():
+        raise ServiceError("Invalid name! Name should only contain letters.")
+    if not ("@" in email and "." in email.split("@")[-1]):
+        raise ServiceError("Invalid email! Please enter a valid email address.")
+    if len(password) < 4:
+        raise ServiceError("Password too short! Must be at least 4 characters.")
+    if not validators.valid_contact(contactnumber):
+        raise ServiceError("Invalid contact number! Must be exactly 10 digits.")
+    if not str(salary).isdigit():
+        raise ServiceError("Invalid salary! Salary must be a numeric value.")
+
+    def work(conn):
+        cursor = conn.execute(
+            "INSERT INTO HR (name, email, password, contactnumber, salary, degree) VALUES (?, ?, ?, ?, ?, ?)",
+            (name, email, password, contactnumber, int(salary), degree)
+        )
+        return cursor.lastrowid
+
+    try:
+        return database.run_in_transaction(work, db)
+    except sqlite3.IntegrityError:
+        raise ServiceError("Email or Contact Number already exists!")
+
+
+def remove_hr(hr_id, db=database.DB_PATH):
+    if not database.run_in_transaction(lambda conn: conn.execute("DELETE FROM HR WHERE hr_id = ?", (hr_id,)).rowcount, db):
+        raise ServiceError("HR ID not found!")
+
+
+def update_hr(hr_id, db=database.DB_PATH, **updates):
+    unknown = set(updates) - {"email", "contactnumber", "salary", "degree"}
+    if unknown:
+        raise ServiceError(f"Cannot update: {', '.join(sorted(unknown))}")
+    if not updates:
+        return 0
+
+    query = "UPDATE HR SET " + ", ".join(f"{col} = ?" for col in updates) + " WHERE hr_id = ?"
+    try:
+        return database.run_in_transaction(lambda conn: conn.execute(query, list(updates.values()) + [hr_id]).rowcount, db)
+    except sqlite3.IntegrityError:
+        raise ServiceError("Email or contact number already exists!")
+
+
+def promote_hr(hr_id, new_salary, db=database.DB_PATH):
+    new_salary = positive_amount(new_salary)
+    if new_salary is None:
+        raise ServiceError("Invalid salary amount. Please enter a valid number.")
+
+    def work(conn):
+        row = conn.execute("SELECT salary FROM HR WHERE hr_id = ?", (hr_id,)).fetchone()
+        if not row:
+            raise ServiceError("Invalid HR ID. Please select from the list.")
+        if new_salary <= (row[0] or 0):
+            raise ServiceError("New salary must be greater than the current salary!")
+        conn.execute("UPDATE HR SET salary = ? WHERE hr_id = ?", (new_salary, hr_id))
+
+    database.run_in_transaction(work, db)
+    return new_salary
+
+
+# Which table and key column each account type lives in
+ACCOUNTS = {"hr": ("HR", "hr_id"), "employee": ("Employee", "emp_id"), "manager": ("Manager", "id")}
+
+
+def get_password(account, account_id, db=database.DB_PATH):
+    table, key = ACCOUNTS[account]
+    row = fetch_one(f"SELECT password FROM {table} WHERE {key} = ?", (account_id,), db)
+    return row[0] if row else None
+
+
+def set_password(account, account_id, password, db=database.DB_PATH):
+    if not validators.valid_password(password):
+        raise ServiceError("Password too short! Must be at least 4 characters.")
+
+    table, key = ACCOUNTS[account]
+    if not database.run_in_transaction(lambda conn: conn.execute(f"UPDATE {table} SET password = ? WHERE {key} = ?", (password, account_id)).rowcount, db):
+        raise ServiceError(f"Invalid {table} ID!")
@@ -0,0 +1,40 @@
+import os
+import sys
+import shutil
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import database
+
+
+@pytest.fixture
+def db(tmp_path):
+    # A copy of the sample database, migrated on first connect; the tracked file is never written
+    path = str(tmp_path / "ems_data.db")
+    shutil.copy(os.path.join(ROOT, "ems_data.db"), path)
+    database.connect(path).close()
+    yield path
+    database.close_all()
+
+
+def execute(db, sql, params=()):
+    # One statement in its own write transaction, as the services run theirs
+    database.run_in_transaction(lambda conn: conn.execute(sql, params), db)
+
+
+def table(db, sql):
+    conn = database.connect(db)
+    try:
+        return sorted(conn.execute(sql).fetchall())
+    finally:
+        conn.close()
+
+
+def matches_rebuild(db, rebuild, queries):
+    # The trigger-kept rows before and after rebuild(conn) recomputes them from scratch
+    before = [table(db, sql) for sql in queries]
+    database.run_in_transaction(rebuild, db)
+    return before, [table(db, sql) for sql in queries]
@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import database
+import services
+from conftest import execute, matches_rebuild
+
+# Rows whose punches were all deleted stay behind as zero rows; a rebuild does not create them
+ROLLUPS = [
+    "SELECT emp_id, date, ROUND(total_work_hours, 6), full_days, half_days, punches FROM Attendance_Daily WHERE punches <> 0",
+    "SELECT emp_id, month, ROUND(total_work_hours, 6), full_days, half_days, punches FROM Attendance_Monthly WHERE punches <> 0",
+]
+
+
+def punch(db, emp_id, day, check_in, check_out=None):
+    services.check_in(emp_id, datetime.fromisoformat(f"{day} {check_in}"), db)
+    if check_out:
+        services.check_out(emp_id, datetime.fromisoformat(f"{day} {check_out}"), db)
+
+
+def test_rollups_follow_check_ins_and_check_outs(db):
+    punch(db, 1, "2026-03-02", "09:00:00", "17:30:00")
+    punch(db, 1, "2026-03-03", "09:00:00", "13:00:00")
+    punch(db, 3, "2026-03-03", "10:00:00")
+    punch(db, 3, "2026-04-01", "09:00:00", "18:00:00")
+
+    before, after = matches_rebuild(db, database.rebuild_attendance_rollups, ROLLUPS)
+    assert before == after
+    assert (1, "2026-03", 12.5, 1, 1, 2) in after[1]
+
+
+def test_rollups_follow_updates_and_deletes(db):
+    punch(db, 1, "2026-05-04", "09:00:00", "17:00:00")
+    punch(db, 1, "2026-05-05", "09:00:00", "17:00:00")
+    punch(db, 3, "2026-05-05", "09:00:00", "12:00:00")
+    # Moved to another day and month, re-typed, then one punch removed entirely
+    execute(db, "UPDATE Employee_Attendance SET date = '2026-06-01' WHERE emp_id = 1 AND date = '2026-05-05'")
+    execute(db, "UPDATE Employee_Attendance SET total_work_hours = 9, type = 'Full Day' WHERE emp_id = 3 AND date = '2026-05-05'")
+    execute(db, "DELETE FROM Employee_Attendance WHERE emp_id = 1 AND date = '2026-05-04'")
+
+    before, after = matches_rebuild(db, database.rebuild_attendance_rollups, ROLLUPS)
+    assert before == after
+    assert not any(row[:2] == (1, "2026-05") for row in after[1])
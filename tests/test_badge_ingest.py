@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+import badge_ingest
+import database
+from conftest import matches_rebuild, table
+
+ROLLUPS = [
+    "SELECT emp_id, date, ROUND(total_work_hours, 6), full_days, half_days, punches FROM Attendance_Daily WHERE punches <> 0",
+    "SELECT emp_id, month, ROUND(total_work_hours, 6), full_days, half_days, punches FROM Attendance_Monthly WHERE punches <> 0",
+]
+PUNCHES = "SELECT emp_id, date, check_in_time, check_out_time, total_work_hours, type FROM Employee_Attendance"
+
+
+def punch(emp_id, at, direction):
+    return json.dumps({"emp_id": emp_id, "at": at, "direction": direction})
+
+
+def write_log(tmp_path, name, lines):
+    path = tmp_path / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_ingesting_a_log_twice_changes_nothing(db, tmp_path):
+    log = write_log(tmp_path, "punches.jsonl", [
+        punch(1, "2026-03-02T09:00:00", "in"),
+        punch(3, "2026-03-02T10:00:00", "in"),
+        punch(1, "2026-03-02T17:30:00", "out"),
+        punch(1, "2026-03-02T08:55:00", "in"),  # an earlier swipe of the same day wins
+        punch(3, "2026-03-02T13:00:00", "out"),
+        punch(1, "2026-03-03T09:00:00", "in"),
+    ])
+
+    first = badge_ingest.ingest([log], db, batch_size=4)
+    punches = table(db, PUNCHES)
+    rollups = [table(db, sql) for sql in ROLLUPS]
+    second = badge_ingest.ingest([log], db, batch_size=4)
+
+    assert (first["inserted"], first["updated"]) == (3, 1)
+    assert (second["inserted"], second["updated"], second["unchanged"]) == (0, 0, 4)
+    assert table(db, PUNCHES) == punches
+    assert [table(db, sql) for sql in ROLLUPS] == rollups
+    day = next(row for row in punches if row[:2] == (1, "2026-03-02"))
+    assert day[2:] == ("08:55:00", "17:30:00", pytest.approx(8 + 35 / 60), "Full Day")
+
+    before, after = matches_rebuild(db, database.rebuild_attendance_rollups, ROLLUPS)
+    assert before == after
+
+
+def test_malformed_lines_inside_a_batch_are_skipped(db, tmp_path):
+    log = write_log(tmp_path, "punches.jsonl", [
+        punch(1, "2026-03-04T09:00:00", "in"),
+        '{"emp_id": 1, "at": "2026-03-04T',            # cut off mid-write
+        punch(1, "2026-03-04T31:00:00", "out"),         # no such time
+        json.dumps({"emp_id": 3, "at": "2026-03-04T10:00:00"}),  # no direction
+        punch(3, "2026-03-04T10:00:00", "sideways"),
+        "",
+        punch(999, "2026-03-04T09:00:00", "in"),        # not an employee
+        punch(3, "2026-03-04T11:00:00", "out"),         # check-out without a check-in
+        punch(1, "2026-03-04T13:00:00", "out"),
+    ])
+
+    result = badge_ingest.ingest([log], db, batch_size=100)
+
+    assert (result["punches"], result["rejected"]) == (4, 4)
+    assert (result["unknown_employee"], result["unpaired_check_out"], result["inserted"]) == (1, 1, 1)
+    assert [row for row in table(db, PUNCHES) if row[1] == "2026-03-04"] == [
+        (1, "2026-03-04", "09:00:00", "13:00:00", 4.0, "Half Day")
+    ]
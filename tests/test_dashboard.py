@@ -0,0 +1,43 @@
+import pytest
+
+import dashboard
+import services
+from conftest import execute
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    dashboard.clear_cache()
+    yield
+    dashboard.clear_cache()
+
+
+def test_writes_through_services_show_on_the_next_load(db):
+    before = dashboard.load_dashboard(db)
+    services.set_salary(1, 80000, db)
+    services.check_in(3, db=db)
+    services.apply_leave(1, "Sick Leave", "2099-01-05", "2099-01-06", db=db)
+    after = dashboard.load_dashboard(db)
+
+    assert after["payroll_total"] == before["payroll_total"] + 80000 - 75000
+    assert after["checked_in_today"] == before["checked_in_today"] + 1
+    assert after["pending_leaves"] == before["pending_leaves"] + 1
+
+
+def test_unchanged_tables_are_served_from_the_cache(db):
+    dashboard.load_dashboard(db)
+    hits = dashboard.cache_stats()["hits"]
+    services.check_in(3, db=db)
+    dashboard.load_dashboard(db)
+    # Only the attendance section was recomputed
+    assert dashboard.cache_stats()["hits"] == hits + 2
+
+
+def test_ttl_bounds_how_long_unversioned_writes_go_unseen(db, monkeypatch):
+    before = dashboard.load_dashboard(db)
+    # Direct SQL skips Data_Version, so only the TTL brings the change in
+    execute(db, "UPDATE Employee SET salary = salary + 1000 WHERE emp_id = 1")
+    assert dashboard.load_dashboard(db)["payroll_total"] == before["payroll_total"]
+
+    monkeypatch.setattr(dashboard, "TTL_SECONDS", 0)
+    assert dashboard.load_dashboard(db)["payroll_total"] == before["payroll_total"] + 1000
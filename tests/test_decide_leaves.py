@@ -0,0 +1,47 @@
+from datetime import date
+
+import services
+from conftest import table
+
+TODAY = date(2026, 1, 1)
+
+
+def apply(db, emp_id, leave_type, start, end):
+    return services.apply_leave(emp_id, leave_type, start, end, today=TODAY, db=db)
+
+
+def status(db, leave_id):
+    return table(db, f"SELECT status FROM Leaves WHERE leave_id = {leave_id}")[0][0]
+
+
+def test_mixed_selection_counts_already_decided_and_missing_ids(db):
+    first = apply(db, 1, "Sick Leave", "2030-02-03", "2030-02-04")
+    second = apply(db, 3, "Casual Leave", "2030-02-03", "2030-02-04")
+    # Sample leaves 1 (APPROVED) and 2 (REJECTED) are already decided; 999 does not exist
+    result = services.decide_leaves(True, ids=[first, second, 1, 2, 999, first], db=db)
+
+    assert result == {"status": "APPROVED", "processed": 2, "skipped": 1, "already_decided": 2}
+    assert [status(db, leave_id) for leave_id in (first, second, 1, 2)] == ["APPROVED", "APPROVED", "APPROVED", "REJECTED"]
+
+
+def test_filters_skip_pending_leaves_they_leave_out(db):
+    it_leave = apply(db, 1, "Sick Leave", "2030-03-02", "2030-03-03")
+    finance_leave = apply(db, 3, "Sick Leave", "2030-03-02", "2030-03-03")
+    later = apply(db, 1, "Casual Leave", "2030-06-01", "2030-06-02")
+
+    result = services.decide_leaves(False, ranges=[(min(it_leave, finance_leave), later)], department="IT",
+                                    end_date="2030-04-30", db=db)
+
+    assert result == {"status": "REJECTED", "processed": 1, "skipped": 2, "already_decided": 0}
+    assert [status(db, leave_id) for leave_id in (it_leave, finance_leave, later)] == ["REJECTED", "PENDING", "PENDING"]
+
+
+def test_no_selection_decides_every_matching_pending_leave(db):
+    sick = apply(db, 1, "Sick Leave", "2030-04-06", "2030-04-07")
+    casual = apply(db, 3, "Casual Leave", "2030-04-06", "2030-04-07")
+
+    result = services.decide_leaves(True, leave_type="Casual Leave", db=db)
+
+    assert result == {"status": "APPROVED", "processed": 1, "skipped": 0, "already_decided": 0}
+    assert [status(db, sick), status(db, casual)] == ["PENDING", "APPROVED"]
+    assert services.decide_leaves(True, ids=[casual], db=db)["already_decided"] == 1
@@ -0,0 +1,38 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+import database
+import services
+from conftest import execute, matches_rebuild
+
+TODAY = date(2026, 1, 1)
+# Types and years whose rows were emptied by later changes stay behind as zero rows
+BALANCES = ["SELECT * FROM Leave_Balance WHERE used_days <> 0 OR pending_days <> 0"]
+
+
+def test_balance_triggers_match_a_rebuild(db):
+    across = services.apply_leave(1, "Vacation Leave", "2030-12-29", "2031-01-03", today=TODAY, db=db)
+    moved = services.apply_leave(3, "Sick Leave", "2030-05-04", "2030-05-06", today=TODAY, db=db)
+    dropped = services.apply_leave(3, "Casual Leave", "2031-02-02", "2031-02-02", today=TODAY, db=db)
+    services.decide_leaves(True, ids=[across, dropped], db=db)
+    execute(db, "UPDATE Leaves SET startdate = '2030-12-30', enddate = '2031-01-05', leavetype = 'Casual Leave' "
+                "WHERE leave_id = ?", (moved,))
+    execute(db, "UPDATE Leaves SET status = 'REJECTED' WHERE leave_id = ?", (dropped,))
+    execute(db, "DELETE FROM Leaves WHERE leave_id = 2")
+
+    before, after = matches_rebuild(db, database.rebuild_leave_balances, BALANCES)
+    assert before == after
+    assert (1, "Vacation Leave", 2030, 3, 0) in after[0] and (1, "Vacation Leave", 2031, 3, 0) in after[0]
+    assert (3, "Casual Leave", 2030, 0, 2) in after[0] and (3, "Casual Leave", 2031, 0, 5) in after[0]
+
+
+def test_leaves_spanning_three_years_are_refused(db):
+    with pytest.raises(services.ServiceError):
+        services.apply_leave(1, "Vacation Leave", "2030-12-31", "2032-01-01", today=TODAY, db=db)
+    with pytest.raises(sqlite3.IntegrityError):
+        execute(db, "INSERT INTO Leaves (emp_id, leavetype, startdate, enddate, status) "
+                    "VALUES (1, 'Vacation Leave', '2030-12-31', '2032-01-01', 'APPROVED')")
+    with pytest.raises(sqlite3.IntegrityError):
+        execute(db, "UPDATE Leaves SET enddate = '2027-01-01' WHERE leave_id = 1")
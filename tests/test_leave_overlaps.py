@@ -0,0 +1,40 @@
+from datetime import date
+
+import pytest
+
+import services
+from conftest import execute
+
+TODAY = date(2026, 1, 1)
+
+
+@pytest.fixture
+def booked(db):
+    # Employee 1 holds 10 to 12 March 2030
+    services.apply_leave(1, "Sick Leave", "2030-03-10", "2030-03-12", today=TODAY, db=db)
+    return db
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2030-03-08", "2030-03-10"),  # ends on its first day
+    ("2030-03-12", "2030-03-14"),  # starts on its last day
+    ("2030-03-11", "2030-03-11"),  # inside it
+    ("2030-03-01", "2030-03-31"),  # around it
+])
+def test_leaves_touching_a_booked_day_are_rejected(booked, start, end):
+    with pytest.raises(services.ServiceError, match="overlaps your PENDING Sick Leave"):
+        services.apply_leave(1, "Casual Leave", start, end, today=TODAY, db=booked)
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2030-03-05", "2030-03-09"),  # ends the day before
+    ("2030-03-13", "2030-03-15"),  # starts the day after
+])
+def test_adjacent_leaves_are_accepted(booked, start, end):
+    assert services.apply_leave(1, "Casual Leave", start, end, today=TODAY, db=booked)
+
+
+def test_other_employees_and_rejected_leaves_do_not_block(booked):
+    assert services.apply_leave(3, "Sick Leave", "2030-03-10", "2030-03-12", today=TODAY, db=booked)
+    execute(booked, "UPDATE Leaves SET status = 'REJECTED' WHERE emp_id = 1 AND startdate = '2030-03-10'")
+    assert services.apply_leave(1, "Casual Leave", "2030-03-11", "2030-03-11", today=TODAY, db=booked)
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import payroll
+import services
+from conftest import execute, table
+
+
+def payroll_row(db, month, emp_id):
+    return table(db, f"""
+        SELECT full_days, half_days, leave_days, paid_days FROM Payroll WHERE month = '{month}' AND emp_id = {emp_id}
+    """)[0]
+
+
+def test_overlapping_leaves_are_counted_once():
+    employees = [(1, 30000.0, "2026-09-01"), (2, 30000.0, "2026-09-15")]
+    leaves = [
+        (1, "2026-09-07", "2026-09-11"),
+        (1, "2026-09-01", "2026-09-08"),
+        (1, "2026-09-09", "2026-09-09"),  # inside the first one
+        (2, "2026-09-14", "2026-09-15"),  # starts before employee 2 joins
+    ]
+    result = payroll.compute_payroll("2026-09", employees, [], leaves)
+
+    # 1 to 11 September 2026 holds 9 weekdays; employee 2 only earns from the 15th
+    assert result["leave_days"].tolist() == [9, 1]
+    assert result["paid_days"].tolist() == [9, 1]
+
+
+def test_sample_overlapping_approved_leaves(db):
+    # Sample leaves 3 and 4 of employee 1 both cover 1 to 4 March 2025 (two weekdays)
+    payroll.run_payroll("2025-03", db)
+    assert payroll_row(db, "2025-03", 1) == (0, 0, 2, 2.0)
+
+
+def test_leave_days_with_attendance_are_paid_once(db):
+    services.check_in(1, datetime(2025, 3, 3, 9), db)
+    services.check_out(1, datetime(2025, 3, 3, 18), db)
+    services.check_in(1, datetime(2025, 3, 5, 9), db)
+    services.check_out(1, datetime(2025, 3, 5, 12), db)
+
+    payroll.run_payroll("2025-03", db)
+    # 3 March is a worked day inside the leave, 4 March a leave day and 5 March a half day
+    assert payroll_row(db, "2025-03", 1) == (1, 1, 1, 2.5)
+
+
+def test_repeated_and_weekend_punches_add_no_paid_days(db):
+    # Two check-ins on Monday 10 March 2025 (the check-out closes both) and a Saturday shift
+    services.check_in(1, datetime(2025, 3, 10, 9), db)
+    services.check_in(1, datetime(2025, 3, 10, 9, 5), db)
+    services.check_out(1, datetime(2025, 3, 10, 18), db)
+    services.check_in(1, datetime(2025, 3, 8, 9), db)
+    services.check_out(1, datetime(2025, 3, 8, 18), db)
+
+    payroll.run_payroll("2025-03", db)
+    assert payroll_row(db, "2025-03", 1) == (1, 0, 2, 3.0)
+
+
+def test_a_full_day_punch_outranks_a_half_day_on_the_same_day(db):
+    services.check_in(1, datetime(2025, 3, 11, 9), db)
+    services.check_out(1, datetime(2025, 3, 11, 12), db)
+    services.check_in(1, datetime(2025, 3, 11, 13), db)
+    execute(db, "UPDATE Employee_Attendance SET total_work_hours = 8.5, type = 'Full Day' "
+                "WHERE emp_id = 1 AND date = '2025-03-11' AND check_in_time = '13:00:00'")
+
+    payroll.run_payroll("2025-03", db)
+    assert payroll_row(db, "2025-03", 1) == (1, 0, 2, 3.0)
@@ -0,0 +1,37 @@
+import database
+import performance
+import services
+from conftest import execute, matches_rebuild
+
+SUMMARIES = ["SELECT * FROM Performance_Summary", "SELECT * FROM Rater_Distribution"]
+
+
+def test_summary_triggers_match_a_rebuild(db):
+    services.rate_employee(1, "Priya Sharma", 4, db=db)
+    services.rate_employee(1, "Amit Verma", 2, db=db)
+    latest = services.rate_employee(3, "Priya Sharma", 5, db=db)
+    services.rate_employee(3, "Priya Sharma", 1, db=db)
+    # An edit of the rating and rater, a rating moved to another employee, and two deletes
+    execute(db, "UPDATE Employee_performance SET rating = 5, ratedbyhr_name = 'Amit Verma' WHERE ep_id = 2")
+    execute(db, "UPDATE Employee_performance SET employee_id = 1 WHERE ep_id = ?", (latest,))
+    execute(db, "DELETE FROM Employee_performance WHERE ep_id = ?", (latest + 1,))
+    execute(db, "DELETE FROM Employee_performance WHERE ep_id = 3")
+
+    before, after = matches_rebuild(db, database.rebuild_performance_summary, SUMMARIES)
+    assert before == after
+    # Employee 3 lost every rating, sample employee 5 keeps one, and employee 1 now has 5, 4, 2
+    # and the moved 5 (latest by ep_id)
+    assert [row[0] for row in after[0]] == [1, 5]
+    assert after[0][0][1:] == (4, 16, latest, 5, 2)
+
+
+def test_ranking_reads_the_summaries(db):
+    services.rate_employee(3, "Priya Sharma", 5, db=db)
+    conn = database.connect(db)
+    try:
+        rows = performance.ranking(conn)
+    finally:
+        conn.close()
+    # Sample ratings: employee 1 has a 3 and employee 3 a 4, now followed by a 5; the sample
+    # rating of employee 5 has no Employee row and is left out
+    assert rows == [["Finance", 1, 3, "Rajesh Kumar", 2, 4.5, 5, "+1"], ["IT", 1, 1, "Amit Sharma", 1, 3.0, 3, ""]]
@@ -0,0 +1,60 @@
+import pytest
+
+import profile_cache
+import services
+from conftest import execute
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(profile_cache, "ENABLED", True)
+    monkeypatch.setattr(profile_cache, "TTL_SECONDS", 30.0)
+    profile_cache.clear()
+    yield
+    profile_cache.clear()
+
+
+def cached_salary(db, emp_id):
+    services.get_profile(emp_id, db)
+    hits = profile_cache.stats()["hits"]
+    salary = services.get_salary(emp_id, db)
+    assert profile_cache.stats()["hits"] == hits + 1
+    return salary
+
+
+def test_salary_writes_invalidate_the_profile(db):
+    assert cached_salary(db, 1) == 75000
+    services.set_salary(1, 80000, db)
+    assert services.get_salary(1, db) == 80000
+    services.promote_employee(1, 90000, db)
+    assert services.get_salary(1, db) == 90000
+
+
+def test_profile_updates_invalidate_the_profile(db):
+    services.get_profile(1, db)
+    services.update_profile(1, db, address="12 New Road", degree="MBA")
+    profile = services.get_profile(1, db)
+    assert (profile["address"], profile["degree"]) == ("12 New Road", "MBA")
+
+
+def test_other_employees_stay_cached(db):
+    services.get_profile(3, db)
+    services.set_salary(1, 80000, db)
+    assert cached_salary(db, 3) == 55000
+
+
+def test_expired_profiles_are_read_again(db, monkeypatch):
+    assert cached_salary(db, 1) == 75000
+    # Direct SQL skips the invalidation, so only the TTL brings the change in
+    execute(db, "UPDATE Employee SET salary = 81000 WHERE emp_id = 1")
+    assert services.get_salary(1, db) == 75000
+
+    monkeypatch.setattr(profile_cache, "TTL_SECONDS", 0)
+    expired = profile_cache.stats()["expired"]
+    assert services.get_salary(1, db) == 81000
+    assert profile_cache.stats()["expired"] == expired + 1
+
+
+def test_missing_employees_are_not_cached(db):
+    assert services.get_profile(999, db) is None
+    assert profile_cache.stats()["entries"] == 0
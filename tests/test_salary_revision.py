@@ -0,0 +1,66 @@
+import pytest
+
+import salary_revision
+import services
+from conftest import execute, table
+
+
+def salaries(db):
+    return table(db, "SELECT emp_id, salary FROM Employee")
+
+
+def history(db):
+    return table(db, "SELECT emp_id, old_salary, new_salary, changed_by, reason FROM Salary_History")
+
+
+def test_a_rule_updates_only_matching_employees(db):
+    before = history(db)
+    rules = [salary_revision.parse_rule("percent 10 department=IT")]
+    result = salary_revision.revise_salaries(rules, "Boss", dry_run=False, db=db)
+
+    assert result["employees"] == 1 and result["applied"]
+    assert salaries(db) == [(1, 82500.0), (3, 55000.0)]
+    assert history(db) == sorted(before + [(1, 75000.0, 82500.0, "Boss", "Salary revision")])
+
+
+def test_history_has_one_row_per_changed_employee(db):
+    before = history(db)
+    # Employee 1 gets the first matching rule only
+    rules = [salary_revision.parse_rule("flat 5000 department=IT"), salary_revision.parse_rule("percent 20")]
+    salary_revision.revise_salaries(rules, "Boss", dry_run=False, db=db)
+    # Finance is matched by a rule that leaves its salary as it is
+    salary_revision.revise_salaries([salary_revision.parse_rule("flat 0 department=Finance")],
+                                    "Boss", dry_run=False, db=db)
+
+    assert salaries(db) == [(1, 80000.0), (3, 66000.0)]
+    assert history(db) == sorted(before + [(1, 75000.0, 80000.0, "Boss", "Salary revision"),
+                                           (3, 55000.0, 66000.0, "Boss", "Salary revision")])
+
+
+def test_a_preview_changes_nothing(db):
+    result = salary_revision.revise_salaries([salary_revision.parse_rule("percent 10")], db=db)
+    assert (result["old_total"], result["new_total"], result["applied"]) == (130000.0, 143000.0, False)
+    assert salaries(db) == [(1, 75000.0), (3, 55000.0)]
+
+
+@pytest.mark.parametrize("text", ["percent nan", "flat inf", "percent -inf", "percent -100", "percent -150"])
+def test_invalid_amounts_are_rejected(text):
+    with pytest.raises(services.ServiceError):
+        salary_revision.parse_rule(text)
+
+
+def test_a_revision_leaving_a_salary_at_or_below_zero_changes_nothing(db):
+    before = history(db)
+    rules = [salary_revision.parse_rule("flat -55000 department=Finance"), salary_revision.parse_rule("percent 10")]
+    with pytest.raises(services.ServiceError, match="at or below zero"):
+        salary_revision.revise_salaries(rules, dry_run=False, db=db)
+
+    assert salaries(db) == [(1, 75000.0), (3, 55000.0)]
+    assert history(db) == before
+
+
+def test_employees_without_a_salary_are_skipped(db):
+    execute(db, "UPDATE Employee SET salary = NULL WHERE emp_id = 3")
+    result = salary_revision.revise_salaries([salary_revision.parse_rule("flat 1000")], dry_run=False, db=db)
+    assert result["employees"] == 1
+    assert salaries(db) == [(1, 76000.0), (3, None)]
@@ -0,0 +1,41 @@
+import pytest
+
+import database
+from conftest import table
+
+ADD_HR = "INSERT INTO HR (name, email, password, contactnumber, salary) VALUES (?, ?, 'pass', ?, 50000)"
+
+
+def add_hr(conn, name, n):
+    conn.execute(ADD_HR, (name, f"{name.lower()}@example.com", f"90000000{n:02d}"))
+
+
+def hr_names(db):
+    return [row[0] for row in table(db, "SELECT name FROM HR WHERE email LIKE '%@example.com'")]
+
+
+def test_a_failing_inner_transaction_only_undoes_its_own_work(db):
+    with database.transaction(db) as conn:
+        add_hr(conn, "Before", 1)
+        with pytest.raises(ValueError):
+            with database.transaction(db) as inner:
+                assert inner.in_transaction
+                add_hr(inner, "Inner", 2)
+                raise ValueError("inner failure")
+        add_hr(conn, "After", 3)
+
+    assert hr_names(db) == ["After", "Before"]
+
+
+def test_inner_work_commits_with_the_outer_transaction(db):
+    with pytest.raises(RuntimeError):
+        with database.transaction(db) as conn:
+            database.run_in_transaction(lambda inner: add_hr(inner, "Inner", 4), db)
+            add_hr(conn, "Outer", 5)
+            raise RuntimeError("outer failure")
+    assert hr_names(db) == []
+
+    with database.transaction(db) as conn:
+        database.run_in_transaction(lambda inner: add_hr(inner, "Inner", 6), db)
+        add_hr(conn, "Outer", 7)
+    assert hr_names(db) == ["Inner", "Outer"]
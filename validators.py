@@ -0,0 +1,52 @@
+# Field rules shared by HR.add_employee and the bulk import, so both accept the same data
+
+DEPARTMENTS = {
+    "IT": ["Software Engineer", "Data Analyst", "System Admin", "Backend Developer", "QA Engineer"],
+    "Finance": ["Accountant", "Financial Analyst", "Auditor", "Finance Manager"],
+    "Marketing": ["Marketing Executive", "SEO Specialist", "Content Strategist", "Brand Manager"],
+    "Operations": ["Operations Manager", "Logistics Coordinator", "Inventory Manager", "Supply Chain Analyst"]
+}
+
+GENDERS = ["Male", "Female"]
+
+
+# Name: at least 5 letters, no digits or special characters
+def valid_name(name):
+    return len(name) >= 5 and all(char.isalpha() or char.isspace() for char in name)
+
+
+# Password: at least 4 characters
+def valid_password(password):
+    return len(password) >= 4
+
+
+# Age: positive number
+def valid_age(age):
+    return age.isdigit() and int(age) > 0
+
+
+def valid_gender(gender):
+    return gender in GENDERS
+
+
+def valid_department(department):
+    return department in DEPARTMENTS
+
+
+def valid_position(department, position):
+    return position in DEPARTMENTS.get(department, [])
+
+
+# Salary: positive whole number
+def valid_salary(salary):
+    return salary.isdigit() and int(salary) > 0
+
+
+# Email: must contain "@" and a "." after it (checked against the first ".")
+def valid_email(email):
+    return "@" in email and "." in email and email.index("@") < email.index(".")
+
+
+# Contact number: exactly 10 digits
+def valid_contact(contactnumber):
+    return contactnumber.isdigit() and len(contactnumber) == 10